@@ -0,0 +1,146 @@
+"""
+Admission Control for Expensive Endpoints
+Each class of expensive request (matching, parsing, sync) gets a concurrency
+limit and a bounded FIFO wait queue:
+
+- a request runs immediately while fewer than `max_concurrent` are running
+- otherwise it waits in the queue for at most `max_wait_seconds`; if it can't
+  start in time it is rejected with 503 rather than starting work the client
+  has probably given up on
+- when the queue is already full it is rejected at once with 429
+
+Rejections carry a Retry-After estimate based on recent service times. Under
+overload the server keeps completing admitted requests at full speed instead
+of slowing every request down until they all time out.
+
+Limits are per process; with several gunicorn workers the totals multiply.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from functools import wraps
+from flask import jsonify
+
+class Rejected(Exception):
+    """A request was not admitted"""
+
+    def __init__(self, status, reason, retry_after):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+class AdmissionController:
+    def __init__(self, name, max_concurrent=2, max_queue=8, max_wait_seconds=10):
+        """
+        Args:
+            name: Endpoint class name used in messages and metrics
+            max_concurrent: Requests allowed to run at the same time
+            max_queue: Requests allowed to wait for a slot
+            max_wait_seconds: Longest a request may wait before it is rejected
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.active = 0
+        self.waiters = deque()  # threading.Event per queued request, oldest first
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.peak_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.avg_service_seconds = None  # exponential moving average
+        self._lock = threading.Lock()
+
+    def _retry_after(self):
+        """Seconds until a slot is likely to be free for a new request"""
+        service = self.avg_service_seconds or 1.0
+        batches = (len(self.waiters) + 1) / self.max_concurrent
+        return max(1, math.ceil(service * batches))
+
+    def acquire(self):
+        """
+        Wait for a slot
+
+        Returns:
+            float: Seconds spent queued
+
+        Raises:
+            Rejected: The queue is full (429) or no slot freed up in time (503)
+        """
+        with self._lock:
+            if self.active < self.max_concurrent and not self.waiters:
+                self.active += 1
+                self.admitted += 1
+                return 0.0
+            if len(self.waiters) >= self.max_queue:
+                self.rejected_queue_full += 1
+                raise Rejected(429, f"Too many {self.name} requests queued; try again later", self._retry_after())
+            turn = threading.Event()
+            self.waiters.append(turn)
+            self.peak_queue_depth = max(self.peak_queue_depth, len(self.waiters))
+
+        start = time.monotonic()
+        granted = turn.wait(self.max_wait_seconds)
+        waited = time.monotonic() - start
+
+        with self._lock:
+            if not granted and not turn.is_set():
+                self.waiters.remove(turn)
+                self.rejected_timeout += 1
+                raise Rejected(503, f"Server busy with {self.name} requests; try again later", self._retry_after())
+            # The releasing request handed its slot straight to us
+            self.admitted += 1
+            self.total_wait_seconds += waited
+        return waited
+
+    def release(self, service_seconds):
+        """Free a slot, handing it to the oldest waiting request if there is one"""
+        with self._lock:
+            if self.avg_service_seconds is None:
+                self.avg_service_seconds = service_seconds
+            else:
+                self.avg_service_seconds = 0.8 * self.avg_service_seconds + 0.2 * service_seconds
+
+            if self.waiters:
+                self.waiters.popleft().set()  # slot passes on; active count unchanged
+            else:
+                self.active -= 1
+
+    def limit(self, view):
+        """Decorator running a Flask view under this controller"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                self.acquire()
+            except Rejected as e:
+                response = jsonify({'success': False, 'error': e.reason})
+                response.status_code = e.status
+                response.headers['Retry-After'] = str(e.retry_after)
+                return response
+
+            start = time.monotonic()
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.release(time.monotonic() - start)
+        return wrapper
+
+    def metrics(self):
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'max_wait_seconds': self.max_wait_seconds,
+                'active': self.active,
+                'queue_depth': len(self.waiters),
+                'peak_queue_depth': self.peak_queue_depth,
+                'admitted': self.admitted,
+                'rejected_queue_full': self.rejected_queue_full,
+                'rejected_timeout': self.rejected_timeout,
+                'avg_queue_wait_ms': round(self.total_wait_seconds / self.admitted * 1000, 1) if self.admitted else 0.0,
+                'avg_service_ms': round(self.avg_service_seconds * 1000, 1) if self.avg_service_seconds else None,
+            }
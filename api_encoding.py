@@ -0,0 +1,170 @@
+"""
+Compact API Responses
+- Field projection: `fields=name,email,skills` trims volunteer records to the
+  listed columns
+- Fast JSON: responses are encoded with orjson when it is installed
+- MessagePack: clients sending `Accept: application/msgpack` get MessagePack
+  instead of JSON when msgpack is installed
+- Compression: large text responses are compressed with brotli (if installed)
+  or gzip, according to the request's Accept-Encoding
+
+orjson, msgpack and brotli are optional; without them responses fall back to
+the standard JSON encoder and gzip.
+"""
+
+import gzip
+from flask import Response, current_app, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', MSGPACK_MIMETYPE, 'text/csv', 'text/html', 'text/plain', 'text/css',
+    'application/javascript',
+}
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # 0-11; higher compresses slightly better but much slower
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when available"""
+
+    def _orjson_options(self):
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, option=self._orjson_options()).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, option=self._orjson_options())
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+def parse_fields(value, allowed):
+    """
+    Parse a `fields=` parameter
+
+    Args:
+        value: Comma-separated field names (or a list), or None for all fields
+        allowed: Field names that may be requested
+
+    Returns:
+        list: Requested fields, or None when no projection was asked for
+
+    Raises:
+        ValueError: Unknown field names
+    """
+    if not value:
+        return None
+    fields = value.split(',') if isinstance(value, str) else list(value)
+    fields = [field.strip() for field in fields if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+def project(record, fields):
+    """Keep only the given fields of a record (all fields when fields is None)"""
+    if fields is None:
+        return record
+    return {field: record.get(field) for field in fields}
+
+def _msgpack_default(value):
+    if hasattr(value, 'item'):  # numpy scalars
+        return value.item()
+    return str(value)
+
+def wants_msgpack():
+    """True if the client prefers MessagePack and it can be produced"""
+    if msgpack is None:
+        return False
+    best = request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE, 'application/x-msgpack'])
+    return best in (MSGPACK_MIMETYPE, 'application/x-msgpack')
+
+def api_response(payload, status=200):
+    """JSON (or MessagePack, if the client asks for it) response for a payload"""
+    if wants_msgpack():
+        body = msgpack.packb(payload, default=_msgpack_default)
+        return Response(body, status=status, mimetype=MSGPACK_MIMETYPE)
+    response = current_app.json.response(payload)
+    response.status_code = status
+    return response
+
+def choose_encoding(accept_encodings):
+    """Best supported content coding from an Accept-Encoding header, or None"""
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+def compress_response(response, min_bytes=1024, encoded_cache=None):
+    """
+    Compress a response body in place when the client accepts it
+
+    Args:
+        response: Response to compress (streamed or already encoded responses are left alone)
+        min_bytes: Bodies smaller than this are sent as they are
+        encoded_cache: Optional dict to reuse compressed bodies in ({encoding: bytes})
+
+    Returns:
+        Response: The same response
+    """
+    if (response.direct_passthrough or response.is_streamed
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if response.status_code != 200:
+        return response
+
+    encoding = choose_encoding(request.accept_encodings)
+    body = response.get_data()
+    if encoding is None or len(body) < min_bytes:
+        return response
+
+    if encoded_cache is not None and encoding in encoded_cache:
+        compressed = encoded_cache[encoding]
+    else:
+        compressed = compress(body, encoding)
+        if encoded_cache is not None:
+            encoded_cache[encoding] = compressed
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    # The compressed bytes differ, so only weak validators still apply
+    if response.get_etag()[0]:
+        response.set_etag(response.get_etag()[0], weak=True)
+    return response
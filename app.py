@@ -1,18 +1,254 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, g, has_request_context, request, jsonify, render_template
 from flask_cors import CORS
-from database import Database
-from resume_matcher import ResumeMatcher  # Back to TF-IDF matcher (fast!)
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.local import LocalProxy
+from werkzeug.wsgi import get_input_stream
+from database import VOLUNTEER_COLUMNS
 from keyword_extractor import KeywordExtractor  # AI for keyword extraction only
 from resume_parser import ResumeParser
+from resume_sandbox import SandboxedParser, spool_upload, UploadTooLarge, ParseTimeout, ParseFailed
+from google_sheets_sync import GoogleSheetSync
+from sync_scheduler import SyncScheduler
+from volunteer_import import import_volunteers
+from facet_index import normalize_filters
+from tenants import TenantRegistry
+from shortlist_cache import ShortlistCache, normalize_description
+from response_cache import ResponseCache
+from admission import AdmissionController
+from profiling import init_profiling
+from api_encoding import FastJSONProvider, api_response, compress_response, parse_fields, project
+import volunteer_export
+import config
 import json
+import os
+
+MAX_UPLOAD_BYTES = getattr(config, 'MAX_UPLOAD_MB', 10) * 1024 * 1024
+MAX_IMPORT_BYTES = getattr(config, 'MAX_IMPORT_MB', 1024) * 1024 * 1024
+COMPRESS_MIN_BYTES = getattr(config, 'COMPRESS_MIN_BYTES', 1024)
+AUTO_FACET_FILTERS = getattr(config, 'AUTO_FACET_FILTERS', True)
+MATCH_ENGINE = getattr(config, 'MATCH_ENGINE', 'tfidf')
+MATCH_ENGINES = ['tfidf', 'semantic']
+
+IMPORT_CONTENT_TYPES = {
+    'text/csv': 'csv',
+    'application/x-ndjson': 'jsonl',
+    'application/jsonl': 'jsonl',
+    'application/x-jsonlines': 'jsonl',
+}
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)  # orjson when installed
+# Reject oversized request bodies before they are read (leave room for form fields)
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES + 64 * 1024
 CORS(app)
 
-db = Database()
-matcher = ResumeMatcher()  # Fast TF-IDF matching
-keyword_extractor = KeywordExtractor()  # AI keyword extraction
+# Per-organisation databases and matching state, selected per request (see tenants.py)
+tenants = TenantRegistry(
+    getattr(config, 'TENANTS', {}),
+    settings={
+        'match_index': getattr(config, 'MATCH_INDEX', None),
+        'semantic_index': getattr(config, 'SEMANTIC_INDEX', {}),
+        'posting_top_k': getattr(config, 'POSTING_TOP_K', 25),
+        'posting_min_score': getattr(config, 'POSTING_MIN_SCORE', 0.05),
+    },
+    max_bytes=getattr(config, 'TENANT_MEMORY_MB', 1024) * 1024 * 1024,
+    max_resident=getattr(config, 'TENANT_MAX_RESIDENT', None),
+    spill_directory=getattr(config, 'TENANT_SPILL_DIRECTORY', None)
+)
+
+def current_tenant():
+    """The request's tenant; the default tenant outside requests (warm-up, background sync)"""
+    if has_request_context() and 'tenant' in g:
+        return g.tenant
+    return tenants.default
+
+# The current tenant's state, under the names the routes use
+db = LocalProxy(lambda: current_tenant().db)
+volunteer_store = LocalProxy(lambda: current_tenant().volunteer_store)  # Resident columnar copy of the fields matching reads
+matcher = LocalProxy(lambda: current_tenant().matcher)  # Fast TF-IDF matching
+facet_index = LocalProxy(lambda: current_tenant().facet_index)  # Availability/mode/language/location bitsets
+semantic_index = LocalProxy(lambda: current_tenant().semantic_index)  # LSA + LSH engine
+posting_matcher = LocalProxy(lambda: current_tenant().posting_matcher)  # Standing job postings
+keyword_extractor = KeywordExtractor(compaction=getattr(config, 'PROMPT_COMPACTION', {'max_tokens': 600}))  # AI keyword extraction
 parser = ResumeParser()
+sandboxed_parser = SandboxedParser(  # Resume parsing in resource-limited subprocesses
+    pool_size=getattr(config, 'PARSER_WORKERS', 2),
+    timeout_seconds=getattr(config, 'PARSE_TIMEOUT_SECONDS', 20),
+    memory_limit_mb=getattr(config, 'PARSE_MEMORY_LIMIT_MB', 512),
+    max_pages=getattr(config, 'PARSE_MAX_PAGES', 20)
+)
+sync_scheduler = SyncScheduler(  # Background Google Sheets sync (default tenant)
+    GoogleSheetSync(db=tenants.default.db),
+    min_interval=getattr(config, 'SYNC_MIN_INTERVAL_SECONDS', 30),
+    max_interval=getattr(config, 'SYNC_MAX_INTERVAL_SECONDS', 900)
+)
+# Registered sheets live in the database, so every worker and restart sees the same list
+for sheet in getattr(config, 'SYNC_SHEETS', []):
+    tenants.default.db.add_sync_sheet(sheet['sheet'], sheet.get('worksheet', 'Sheet1'))
+
+def on_volunteers_changed(volunteer_ids):
+    """Let in-memory matcher state ingest volunteers that were added or changed"""
+    volunteers = db.get_volunteers_by_ids(volunteer_ids)
+    matcher.ingest_volunteers(volunteers)
+    facet_index.ingest(volunteers)
+    semantic_index.ingest(volunteers)  # fold-in; no-op until the index is built
+    posting_matcher.on_volunteers(volunteers)
+
+sync_scheduler.add_listener(on_volunteers_changed)
+sync_lock_file = None
+sync_lock_path = None
+
+# Rendered GET responses keyed by URL and data version (see response_cache.py)
+response_cache = ResponseCache(
+    getattr(config, 'RESPONSE_CACHE_ENTRIES', 256),
+    compressor=lambda response, encoded_cache: compress_response(response, COMPRESS_MIN_BYTES, encoded_cache)
+)
+
+# Keyword extractions and ranked shortlists keyed by the volunteer data version (see shortlist_cache.py)
+shortlist_cache = ShortlistCache(int(getattr(config, 'SHORTLIST_CACHE_MB', 32) * 1024 * 1024))
+
+# Concurrency limits and wait queues for expensive endpoint classes (see admission.py)
+ADMISSION_DEFAULTS = {
+    'matching': {'max_concurrent': 2, 'max_queue': 8, 'max_wait_seconds': 15},
+    'parsing': {'max_concurrent': getattr(config, 'PARSER_WORKERS', 2), 'max_queue': 16, 'max_wait_seconds': 20},
+    'sync': {'max_concurrent': 1, 'max_queue': 2, 'max_wait_seconds': 30},
+}
+admission = {
+    name: AdmissionController(name, **{**limits, **getattr(config, 'ADMISSION_LIMITS', {}).get(name, {})})
+    for name, limits in ADMISSION_DEFAULTS.items()
+}
+
+@app.before_request
+def select_tenant():
+    """Pick the tenant from the X-Tenant header or ?tenant= (default tenant without either)"""
+    name = request.headers.get('X-Tenant') or request.args.get('tenant')
+    try:
+        g.tenant = tenants.acquire(name)
+    except KeyError:
+        return jsonify({
+            'success': False,
+            'error': f"Unknown tenant '{name}'"
+        }), 404
+
+@app.teardown_request
+def release_tenant(error=None):
+    tenant = g.pop('tenant', None)
+    if tenant is not None:
+        tenants.release(tenant)
+
+@app.after_request
+def compress(response):
+    """gzip/brotli-compress large responses the client accepts compressed"""
+    return compress_response(response, COMPRESS_MIN_BYTES)
+
+# Opt-in request profiling and tracemalloc endpoints (see profiling.py)
+profiling = init_profiling(
+    app,
+    getattr(config, 'PROFILING_ADMIN_TOKEN', None),
+    getattr(config, 'PROFILING_DIRECTORY', None)
+)
+
+def resolve_filters(data, explicit_filters, keywords_data):
+    """
+    Combine keyword-derived and explicit hard filters for a request body
+    
+    Returns:
+        tuple: (facet -> set of values, set of facets where volunteers with no value pass)
+    """
+    filters = facet_index.filters_from_keywords(keywords_data) if data.get('auto_filters', AUTO_FACET_FILTERS) else {}
+    lenient = set(filters) - set(explicit_filters)  # keyword-derived filters let empty fields through
+    filters.update(explicit_filters)
+    if data.get('include_unknown', False):
+        lenient |= set(explicit_filters)
+    return filters, lenient
+
+def extract_keywords(description):
+    """Keyword extraction, cached per normalized description (fallback results are not cached)"""
+    key = normalize_description(description)
+    keywords_data = shortlist_cache.get('keywords', key)
+    if keywords_data is None:
+        keywords_data = keyword_extractor.extract_keywords(description)
+        if not keywords_data.get('fallback'):
+            shortlist_cache.put('keywords', key, keywords_data)
+    return keywords_data
+
+def resident_volunteers():
+    """
+    Every volunteer from the columnar store, with the facet index synced to them
+    
+    The full facet comparison only runs when the volunteer data changed since
+    the last sync; in-process writes are already pushed in by on_volunteers_changed.
+    
+    Returns:
+        tuple: (list of volunteers, data version the list is at least as new as)
+    """
+    version = volunteer_store.sync().version  # read first: the list below is at least this new
+    volunteers = volunteer_store.volunteers()
+    facet_index.sync(volunteers, version)
+    return volunteers, version
+
+def data_versions(*scopes):
+    """Version lookup for ResponseCache.versioned: the data versions of the given scopes"""
+    return lambda: db.get_data_versions(scopes)
+
+def warm_up():
+    """
+    Build in-memory matcher state for every volunteer
+    
+    Called once before a pre-fork server starts its workers, so the profile
+    cache is built once and shared copy-on-write instead of per worker.
+    """
+    volunteers = volunteer_store.volunteers()
+    matcher.ingest_volunteers(volunteers)
+    facet_index.ingest(volunteers)
+    if MATCH_ENGINE == 'semantic':
+        semantic_index.build(volunteers)
+    if matcher.index is not None:
+        matcher.index.fit([volunteer.get('id') for volunteer in volunteers],
+                          [matcher.create_volunteer_profile(volunteer) for volunteer in volunteers])
+    print(f"[INFO] Preloaded matcher profiles and facet indexes for {len(volunteers)} volunteers")
+
+def start_background_sync(lock_path=None):
+    """
+    Start the Google Sheets sync scheduler in this process
+    
+    With several worker processes only one of them should sync. When
+    lock_path is given, the scheduler only starts in the process that holds
+    an exclusive lock on that file (and writes its pid there); the lock is
+    released when the process exits, so a replacement worker takes over.
+    
+    The scheduler starts even with no sheets registered yet. Its jobs are the
+    worksheets stored in the database, so sheets registered later or before
+    a restart are synced too.
+    
+    Returns:
+        bool: True if the scheduler was started in this process
+    """
+    global sync_lock_file, sync_lock_path
+    sync_lock_path = lock_path
+    if lock_path:
+        import fcntl
+        lock_file = open(lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.truncate(0)
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        sync_lock_file = lock_file  # keep the lock for the life of the process
+    
+    for sheet in tenants.default.db.get_sync_sheets():
+        sync_scheduler.register(sheet['sheet'], sheet['worksheet'], sheet['id'])
+    sync_scheduler.start()
+    print(f"[SYNC] Background sync running in process {os.getpid()}")
+    return True
+
+def shutdown():
+    """Stop background work: the sync scheduler and the parser worker pool"""
+    sync_scheduler.stop()
+    sandboxed_parser.close()
 
 @app.route('/')
 def index():
@@ -20,22 +256,100 @@ def index():
     return render_template('index.html')
 
 @app.route('/api/volunteers', methods=['GET'])
+@response_cache.versioned(data_versions('volunteers'))
 def get_volunteers():
-    """Get all volunteers from database"""
+    """Get all volunteers from database (?fields=name,email,... to return only those columns)"""
     try:
-        volunteers = db.get_all_volunteers()
-        return jsonify({
+        fields = parse_fields(request.args.get('fields'), VOLUNTEER_COLUMNS)
+        volunteers = db.get_all_volunteers(fields)
+        return api_response({
             'success': True,
             'count': len(volunteers),
             'volunteers': volunteers
         })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+def rank_shortlist(data, job_description, keywords_data, engine, probes, explicit_filters, max_results, min_score):
+    """
+    Filter and rank the current tenant's volunteers for a job description
+    
+    Returns:
+        dict: shortlisted (full rows, scores, matching skills), filters,
+            eligible_count, engine and total_volunteers; None if there are
+            no volunteers at all
+    """
+    all_keywords = keywords_data.get('all_keywords', [])
+    
+    # Enhance job description with extracted keywords for better matching
+    enhanced_description = job_description + " " + " ".join(all_keywords)
+    
+    print(f"[AI] Extracted {len(all_keywords)} keywords")
+    print(f"[MATCHER] Step 2: Matching volunteers using {'LSA + LSH' if engine == 'semantic' else 'TF-IDF'} (fast)...")
+    
+    # Matching-relevant fields of every volunteer, from the resident columnar store
+    volunteers, version = resident_volunteers()
+    
+    if not volunteers:
+        return None
+    
+    total_volunteers = len(volunteers)
+    all_volunteers = volunteers
+    
+    # Hard filters: AND the facet bitsets, then score only the eligible volunteers
+    filters, lenient = resolve_filters(data, explicit_filters, keywords_data)
+    
+    if filters:
+        eligible = set(facet_index.volunteer_ids(facet_index.select(filters, lenient)))
+        volunteers = [volunteer for volunteer in volunteers if volunteer['id'] in eligible]
+        print(f"[MATCHER] Filters {dict((facet, sorted(values)) for facet, values in filters.items())}: "
+              f"{len(volunteers)} of {total_volunteers} volunteers eligible")
+    
+    if engine == 'semantic' and not semantic_index.sync(all_volunteers, version):
+        engine = 'tfidf'  # pool too small for an LSA model
+    
+    # STEP 2: Match the eligible volunteers with enhanced description (fast matching)
+    if not volunteers:
+        shortlisted = []
+    elif engine == 'semantic':
+        shortlisted = semantic_index.shortlist_volunteers(
+            volunteers,
+            enhanced_description,
+            min_score=min_score,
+            max_results=max_results,
+            exact=bool(data.get('exact', False)),
+            probes=probes
+        )
+    else:
+        shortlisted = matcher.shortlist_volunteers(
+            volunteers, 
+            enhanced_description,
+            min_score=min_score,
+            max_results=max_results
+        )
+    
+    # Only the final top-k are read as full rows
+    for item, row in zip(shortlisted, volunteer_store.full_rows([item['volunteer'] for item in shortlisted])):
+        item['volunteer'] = row
+    
+    return {
+        'shortlisted': [item for item in shortlisted if item['volunteer'] is not None],
+        'filters': {facet: sorted(values) for facet, values in filters.items()},
+        'eligible_count': len(volunteers),
+        'engine': engine,
+        'total_volunteers': total_volunteers,
+    }
+
 @app.route('/api/shortlist', methods=['POST'])
+@admission['matching'].limit
 def shortlist_volunteers():
     """
     Shortlist volunteers using HYBRID approach:
@@ -46,8 +360,28 @@ def shortlist_volunteers():
     {
         "job_description": "Looking for Python developer with Django experience...",
         "max_results": 10,
-        "min_score": 0.1
+        "min_score": 0.1,
+        "fields": ["name", "email", "skills"],   (optional, also ?fields=)
+        "filters": {                              (optional hard filters)
+            "availability": ["weekends"],
+            "mode": "remote",
+            "language": ["hindi"],
+            "location": ["pune"]
+        },
+        "include_unknown": false,   (let volunteers with an empty field pass that filter)
+        "auto_filters": true,       (also filter on the extracted location/availability keywords)
+        "engine": "semantic",       (optional: "tfidf" exact cosine, or "semantic" LSA + LSH)
+        "probes": 2,                (semantic only: more probes, higher recall, slower)
+        "exact": false              (semantic only: score every volunteer instead of LSH candidates)
     }
+    
+    Hard filters are applied to the facet bitsets before scoring, so only
+    eligible volunteers are matched. Explicit filters replace keyword-derived
+    ones for the same facet; keyword-derived filters always let volunteers
+    with an empty field through.
+    
+    Repeating a request while the volunteers are unchanged returns the
+    cached ranking (and the same run_id while that run is still the latest).
     """
     try:
         data = request.get_json()
@@ -55,6 +389,35 @@ def shortlist_volunteers():
         max_results = data.get('max_results', 10)
         min_score = data.get('min_score', 0.1)
         
+        try:
+            fields = parse_fields(request.args.get('fields') or data.get('fields'), VOLUNTEER_COLUMNS)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        engine = data.get('engine', MATCH_ENGINE)
+        if engine not in MATCH_ENGINES:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown engine '{engine}' (choose from {', '.join(MATCH_ENGINES)})"
+            }), 400
+        probes = data.get('probes')
+        if probes is not None and (not isinstance(probes, int) or isinstance(probes, bool) or probes < 0):
+            return jsonify({
+                'success': False,
+                'error': 'probes must be a non-negative integer'
+            }), 400
+        
+        try:
+            explicit_filters = normalize_filters(data.get('filters'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
         if not job_description:
             return jsonify({
                 'success': False,
@@ -64,56 +427,55 @@ def shortlist_volunteers():
         print("\n[API] Received job description")
         print("[AI] Step 1: Extracting keywords using GPT-4...")
         
-        # STEP 1: Use GPT-4 to extract keywords (AI-powered understanding)
-        keywords_data = keyword_extractor.extract_keywords(job_description)
+        # STEP 1: Use GPT-4 to extract keywords (AI-powered understanding; cached per description)
+        keywords_data = extract_keywords(job_description)
         all_keywords = keywords_data.get('all_keywords', [])
         
-        # Enhance job description with extracted keywords for better matching
-        enhanced_description = job_description + " " + " ".join(all_keywords)
-        
-        print(f"[AI] Extracted {len(all_keywords)} keywords")
-        print("[MATCHER] Step 2: Matching volunteers using TF-IDF (fast)...")
-        
-        # Get all volunteers from database
-        volunteers = db.get_all_volunteers()
-        
-        if not volunteers:
-            return jsonify({
-                'success': False,
-                'error': 'No volunteers found in database'
-            }), 404
-        
-        # Clear previous shortlisted volunteers
-        db.clear_shortlisted_volunteers()
-        
-        # STEP 2: Use TF-IDF matcher with enhanced description (fast matching)
-        shortlisted = matcher.shortlist_volunteers(
-            volunteers, 
-            enhanced_description,
-            min_score=min_score,
-            max_results=max_results
+        # Identical requests against an unchanged volunteer pool reuse the ranked result
+        versions = db.get_data_versions(['volunteers', 'shortlisted'])
+        cache_key = (
+            current_tenant().name, versions['epoch'], versions['volunteers'],
+            normalize_description(job_description), json.dumps(keywords_data, sort_keys=True),
+            engine, probes, bool(data.get('exact', False)), max_results, min_score,
+            json.dumps({facet: sorted(values) for facet, values in explicit_filters.items()}, sort_keys=True),
+            bool(data.get('auto_filters', AUTO_FACET_FILTERS)), bool(data.get('include_unknown', False))
         )
+        result = shortlist_cache.get('results', cache_key)
         
-        # Insert shortlisted volunteers into database
-        for item in shortlisted:
-            volunteer = item['volunteer']
-            match_score = item['match_score']
-            matching_skills = json.dumps(item['matching_skills'])
-            
-            db.insert_shortlisted_volunteer(
-                volunteer['id'],
-                job_description,
-                match_score,
-                matching_skills
-            )
+        if result is None:
+            result = rank_shortlist(data, job_description, keywords_data, engine, probes,
+                                    explicit_filters, max_results, min_score)
+            if result is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'No volunteers found in database'
+                }), 404
+        else:
+            print(f"[MATCHER] Reusing cached shortlist ({len(result['shortlisted'])} volunteers)")
         
-        print(f"[SUCCESS] Found {len(shortlisted)} matching volunteers")
+        # Store this run (earlier runs stay available for export). A cached
+        # result whose run is still the latest one is not stored again.
+        if result.get('shortlisted_version') != versions['shortlisted']:
+            run_id = db.save_shortlist_run(job_description, result['shortlisted'])
+            result = {
+                **result,
+                'run_id': run_id,
+                'shortlisted_version': db.get_data_versions(['shortlisted'])['shortlisted']
+            }
+            shortlist_cache.put('results', cache_key, result)
         
-        return jsonify({
+        print(f"[SUCCESS] Found {len(result['shortlisted'])} matching volunteers")
+        
+        return api_response({
             'success': True,
-            'count': len(shortlisted),
-            'shortlisted': shortlisted,
+            'run_id': result['run_id'],
+            'count': len(result['shortlisted']),
+            'shortlisted': [{**item, 'volunteer': project(item['volunteer'], fields)} for item in result['shortlisted']],
             'extracted_keywords': all_keywords[:20],  # Return top 20 keywords for reference
+            'filters': result['filters'],
+            'eligible_count': result['eligible_count'],
+            'engine': result['engine'],
+            'total_volunteers': result['total_volunteers'],
             'ai_enhanced': True  # Flag to indicate AI keyword extraction was used
         })
         
@@ -127,11 +489,28 @@ def shortlist_volunteers():
             'error': str(e)
         }), 500
 
+SHORTLISTED_FIELDS = [
+    'id', 'name', 'email', 'phone', 'skills', 'experience', 'education',
+    'job_description', 'match_score', 'matching_skills', 'shortlisted_at', 'run_id',
+]
+
+@app.route('/api/shortlist/cache', methods=['GET'])
+def get_shortlist_cache_status():
+    """Shortlist result and keyword cache size, hits and misses, and prompt tokens saved (this worker)"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'cache': shortlist_cache.stats(),
+        'prompt_compaction': keyword_extractor.compaction_stats()
+    })
+
 @app.route('/api/shortlisted', methods=['GET'])
+@response_cache.versioned(data_versions('volunteers', 'shortlisted'))
 def get_shortlisted_volunteers():
-    """Get all shortlisted volunteers from database"""
+    """Get shortlisted volunteers from the latest shortlist run (or ?run_id=; ?fields= to project)"""
     try:
-        shortlisted = db.get_shortlisted_volunteers()
+        shortlisted = db.get_shortlisted_volunteers(request.args.get('run_id', type=int))
+        fields = parse_fields(request.args.get('fields'), SHORTLISTED_FIELDS)
         
         # Parse matching_skills from JSON string
         for volunteer in shortlisted:
@@ -140,11 +519,16 @@ def get_shortlisted_volunteers():
             except:
                 volunteer['matching_skills'] = []
         
-        return jsonify({
+        return api_response({
             'success': True,
             'count': len(shortlisted),
-            'shortlisted': shortlisted
+            'shortlisted': [project(volunteer, fields) for volunteer in shortlisted]
         })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -166,7 +550,102 @@ def clear_shortlisted():
             'error': str(e)
         }), 500
 
+@app.route('/api/shortlist/runs', methods=['GET'])
+@response_cache.versioned(data_versions('shortlisted'))
+def get_shortlist_runs():
+    """List recent shortlist runs (newest first)"""
+    try:
+        runs = db.get_shortlist_runs(request.args.get('limit', 50, type=int))
+        return jsonify({
+            'success': True,
+            'count': len(runs),
+            'runs': runs
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+EXPORT_RESERVED_ARGS = {'format', 'columns', 'run_id'}
+
+def export_response(rows, basename, data_format):
+    """Stream header-first rows as a CSV or XLSX attachment"""
+    headers = {'Content-Disposition': f'attachment; filename={basename}.{data_format}'}
+    if data_format == 'xlsx':
+        path = volunteer_export.write_xlsx(rows, basename)
+        headers['Content-Length'] = str(os.path.getsize(path))
+        return Response(
+            volunteer_export.stream_file(path),
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            headers=headers
+        )
+    return Response(volunteer_export.stream_csv(rows), mimetype='text/csv', headers=headers)
+
+def export_args(available, default_columns=None):
+    """Format, columns and filters from the export query string"""
+    data_format = request.args.get('format', 'csv')
+    if data_format not in ('csv', 'xlsx'):
+        raise ValueError('format must be csv or xlsx')
+    columns = volunteer_export.select_columns(request.args.get('columns'), available, default_columns)
+    filters = {key: value for key, value in request.args.items() if key not in EXPORT_RESERVED_ARGS}
+    return data_format, columns, filters
+
+@app.route('/api/export/volunteers', methods=['GET'])
+def export_volunteers():
+    """
+    Download volunteers as CSV or XLSX
+    
+    Query parameters:
+        format: csv (default) or xlsx
+        columns: Comma-separated columns to include (default: all)
+        <column>=<text>: Only volunteers whose column contains the text
+    """
+    try:
+        data_format, columns, filters = export_args(volunteer_export.VOLUNTEER_COLUMNS)
+        query, params = volunteer_export.volunteers_query(columns, filters)
+        return export_response(db.iter_rows(query, params), 'volunteers', data_format)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/export/shortlisted', methods=['GET'])
+def export_shortlisted():
+    """
+    Download one shortlist run as CSV or XLSX
+    
+    Query parameters:
+        run_id: Shortlist run to export (default: the latest run)
+        format, columns, <column>=<text>: As for /api/export/volunteers
+    """
+    try:
+        data_format, columns, filters = export_args(
+            volunteer_export.SHORTLIST_COLUMNS, volunteer_export.DEFAULT_SHORTLIST_COLUMNS
+        )
+        run_id = request.args.get('run_id', type=int) or db.get_latest_shortlist_run_id()
+        query, params = volunteer_export.shortlist_query(run_id, columns, filters)
+        rows = volunteer_export.format_matching_skills(db.iter_rows(query, params))
+        return export_response(rows, f'shortlist_run_{run_id}', data_format)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/upload-resume', methods=['POST'])
+@admission['parsing'].limit
 def upload_resume():
     """
     Upload and parse resume file
@@ -196,17 +675,54 @@ def upload_resume():
                 'error': 'Only PDF and DOCX files are supported'
             }), 400
         
-        # Read file content
-        file_content = file.read()
-        
-        # Parse resume
-        volunteer_data = parser.parse_resume(file_content, file.filename)
+        # Spool the upload to a temporary file (size-capped, hashed on the way)
+        try:
+            upload_path, content_hash = spool_upload(
+                file.stream, MAX_UPLOAD_BYTES, suffix=os.path.splitext(file.filename)[1]
+            )
+        except UploadTooLarge as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 413
         
-        if not volunteer_data:
+        try:
+            # Re-upload of a file we've already seen: reuse the stored parse
+            stored = db.get_resume_document(content_hash)
+            if stored and stored['volunteer_id']:
+                return jsonify({
+                    'success': False,
+                    'error': 'This resume has already been uploaded',
+                    'volunteer': json.loads(stored['parsed_data'])
+                }), 409
+            
+            if stored:
+                volunteer_data = json.loads(stored['parsed_data'])
+            else:
+                # Parse resume in a sandboxed worker
+                text, volunteer_data = sandboxed_parser.parse_file(upload_path, file.filename)
+                
+                if not text:
+                    return jsonify({
+                        'success': False,
+                        'error': 'Failed to parse resume. Please check file format.'
+                    }), 400
+                
+                db.save_resume_document(
+                    content_hash, file.filename, text, volunteer_data, parser.PARSER_VERSION
+                )
+        except ParseTimeout:
             return jsonify({
                 'success': False,
-                'error': 'Failed to parse resume. Please check file format.'
-            }), 400
+                'error': 'Resume took too long to parse. Please upload a simpler file.'
+            }), 422
+        except ParseFailed as e:
+            return jsonify({
+                'success': False,
+                'error': f'Failed to parse resume: {e}'
+            }), 422
+        finally:
+            os.unlink(upload_path)
         
         # Validate required fields
         if not volunteer_data['email']:
@@ -219,6 +735,8 @@ def upload_resume():
         volunteer_id = db.insert_volunteer(volunteer_data)
         
         if volunteer_id:
+            db.link_resume_document(content_hash, volunteer_id)
+            on_volunteers_changed([volunteer_id])
             return jsonify({
                 'success': True,
                 'message': f'Successfully added {volunteer_data["name"]} to database',
@@ -230,6 +748,305 @@ def upload_resume():
                 'error': f'Email {volunteer_data["email"]} already exists'
             }), 409
         
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.errorhandler(413)
+def request_too_large(e):
+    """Reject request bodies over MAX_CONTENT_LENGTH"""
+    return jsonify({
+        'success': False,
+        'error': f'Upload exceeds {MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit'
+    }), 413
+
+@app.route('/api/volunteers/import', methods=['POST'])
+@admission['sync'].limit
+def import_volunteers_bulk():
+    """
+    Bulk import volunteers from a CSV or JSON-lines request body
+    
+    The body is parsed as it streams in and inserted in batches, so large
+    partner exports never have to be held in memory. Format comes from
+    ?format=csv|jsonl or the Content-Type header.
+    """
+    try:
+        data_format = request.args.get('format') or IMPORT_CONTENT_TYPES.get(request.mimetype)
+        if data_format not in ('csv', 'jsonl'):
+            return jsonify({
+                'success': False,
+                'error': 'Send text/csv or application/x-ndjson, or pass ?format=csv|jsonl'
+            }), 415
+        
+        batch_size = request.args.get('batch_size', 1000, type=int)
+        if not 1 <= batch_size <= 50000:
+            return jsonify({
+                'success': False,
+                'error': 'batch_size must be between 1 and 50000'
+            }), 400
+        
+        # Read the raw body with the import limit rather than the upload limit
+        stream = get_input_stream(request.environ, max_content_length=MAX_IMPORT_BYTES)
+        last_id = db.get_max_volunteer_id()
+        summary = import_volunteers(db, stream, data_format, batch_size)
+        
+        # Score only the imported volunteers against the open job postings
+        new_ids = db.get_volunteer_ids_after(last_id)
+        for start in range(0, len(new_ids), batch_size):
+            on_volunteers_changed(new_ids[start:start + batch_size])
+        
+        print(f"[SUCCESS] Imported {summary['inserted']} volunteers "
+              f"({summary['duplicates']} duplicates, {summary['invalid']} invalid) in {summary['seconds']}s")
+        
+        return jsonify({
+            'success': True,
+            **summary
+        })
+        
+    except RequestEntityTooLarge:
+        return jsonify({
+            'success': False,
+            'error': f'Import exceeds {MAX_IMPORT_BYTES // (1024 * 1024)} MB limit'
+        }), 413
+    except UnicodeDecodeError:
+        return jsonify({
+            'success': False,
+            'error': 'Import must be UTF-8 encoded'
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/postings', methods=['POST'])
+@admission['matching'].limit
+def create_job_posting():
+    """
+    Create a standing job posting
+    
+    Keywords and the posting's vector are computed once here, and the current
+    volunteers are scored once to fill its top-k. From then on only newly
+    arriving volunteers are scored against it.
+    
+    Expected JSON body:
+    {
+        "title": "Weekend Python tutor",
+        "description": "Looking for ...",
+        "top_k": 25,                 (optional, default POSTING_TOP_K)
+        "filters": {...},            (optional, as for /api/shortlist)
+        "include_unknown": false,
+        "auto_filters": true
+    }
+    """
+    try:
+        data = request.get_json() or {}
+        title = (data.get('title') or '').strip()
+        description = (data.get('description') or '').strip()
+        top_k = data.get('top_k')
+        
+        if not title or not description:
+            return jsonify({
+                'success': False,
+                'error': 'Title and description are required'
+            }), 400
+        if top_k is not None and (not isinstance(top_k, int) or isinstance(top_k, bool) or not 1 <= top_k <= 1000):
+            return jsonify({
+                'success': False,
+                'error': 'top_k must be an integer between 1 and 1000'
+            }), 400
+        
+        try:
+            explicit_filters = normalize_filters(data.get('filters'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        keywords_data = extract_keywords(description)
+        volunteers, _ = resident_volunteers()
+        filters, lenient = resolve_filters(data, explicit_filters, keywords_data)
+        
+        posting_id = posting_matcher.create_posting(
+            title, description, keywords_data,
+            filters=filters, lenient=lenient, top_k=top_k, volunteers=volunteers
+        )
+        posting = db.get_job_posting(posting_id)
+        print(f"[SUCCESS] Created job posting {posting_id} with {posting['match_count']} matches")
+        
+        return api_response({
+            'success': True,
+            'posting': posting_summary(posting)
+        }, 201)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def posting_summary(posting):
+    """JSON-ready posting row (stored JSON columns decoded)"""
+    summary = dict(posting)
+    keywords_data = json.loads(summary.pop('keywords') or '{}')
+    summary['filters'] = json.loads(summary['filters'] or '{}').get('filters', {})
+    summary['extracted_keywords'] = keywords_data.get('all_keywords', [])[:20]
+    return summary
+
+@app.route('/api/postings', methods=['GET'])
+@response_cache.versioned(data_versions('postings'))
+def get_job_postings():
+    """List job postings (?status=open|closed)"""
+    try:
+        status = request.args.get('status')
+        if status not in (None, 'open', 'closed'):
+            return jsonify({
+                'success': False,
+                'error': 'status must be open or closed'
+            }), 400
+        
+        postings = [posting_summary(posting) for posting in db.get_job_postings(status=status)]
+        return api_response({
+            'success': True,
+            'count': len(postings),
+            'postings': postings
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/postings/<int:posting_id>', methods=['GET'])
+@response_cache.versioned(data_versions('volunteers', 'postings'))
+def get_job_posting(posting_id):
+    """A posting and its stored top-k volunteers (supports ?fields= for the volunteers)"""
+    try:
+        fields = parse_fields(request.args.get('fields'), VOLUNTEER_COLUMNS)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        posting = db.get_job_posting(posting_id)
+        if posting is None:
+            return jsonify({
+                'success': False,
+                'error': 'Job posting not found'
+            }), 404
+        
+        matches = []
+        for row in db.get_posting_matches(posting_id):
+            match_score = row.pop('match_score')
+            matching_skills = json.loads(row.pop('matching_skills') or '[]')
+            matched_at = row.pop('matched_at')
+            matches.append({
+                'volunteer': project(row, fields),
+                'match_score': match_score,
+                'matching_skills': matching_skills,
+                'matched_at': matched_at
+            })
+        
+        return api_response({
+            'success': True,
+            'posting': posting_summary(posting),
+            'matches': matches
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/postings/<int:posting_id>/close', methods=['POST'])
+def close_job_posting(posting_id):
+    """Stop matching new volunteers against a posting (its matches are kept)"""
+    try:
+        if not posting_matcher.close_posting(posting_id):
+            return jsonify({
+                'success': False,
+                'error': 'Job posting not found'
+            }), 404
+        return jsonify({
+            'success': True,
+            'message': f'Job posting {posting_id} closed'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/postings/<int:posting_id>/refresh', methods=['POST'])
+@admission['matching'].limit
+def refresh_job_posting(posting_id):
+    """
+    Rescore every volunteer against a posting and replace its top-k
+    
+    Reopens a closed posting. Incremental matching already rescores edited
+    volunteers, removes them when they no longer qualify and refills the
+    posting; a refresh is for writes that bypass the app, such as volunteers
+    edited directly in the database.
+    """
+    try:
+        posting = db.get_job_posting(posting_id)
+        if posting is None:
+            return jsonify({
+                'success': False,
+                'error': 'Job posting not found'
+            }), 404
+        
+        if posting['status'] != 'open':
+            posting_matcher.reopen_posting(posting_id)
+        match_count = posting_matcher.refresh_posting(posting_id, volunteer_store.volunteers())
+        
+        return jsonify({
+            'success': True,
+            'posting_id': posting_id,
+            'match_count': match_count
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/volunteers/<int:volunteer_id>/postings', methods=['GET'])
+@response_cache.versioned(data_versions('volunteers', 'postings'))
+def get_volunteer_postings(volunteer_id):
+    """Best open job postings for one volunteer (?limit=10)"""
+    try:
+        volunteers = db.get_volunteers_by_ids([volunteer_id])
+        if not volunteers:
+            return jsonify({
+                'success': False,
+                'error': 'Volunteer not found'
+            }), 404
+        
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+        shortlisted_in = db.get_volunteer_posting_ids(volunteer_id)
+        postings = [
+            {
+                'posting_id': posting_id,
+                'title': title,
+                'match_score': score,
+                'in_top_k': posting_id in shortlisted_in
+            }
+            for posting_id, title, score in posting_matcher.postings_for_volunteer(volunteers[0], limit)
+        ]
+        
+        return api_response({
+            'success': True,
+            'volunteer_id': volunteer_id,
+            'postings': postings
+        })
     except Exception as e:
         return jsonify({
             'success': False,
@@ -237,17 +1054,15 @@ def upload_resume():
         }), 500
 
 @app.route('/api/stats', methods=['GET'])
+@response_cache.versioned(data_versions('volunteers', 'shortlisted'))
 def get_stats():
     """Get database statistics"""
     try:
-        volunteers = db.get_all_volunteers()
-        shortlisted = db.get_shortlisted_volunteers()
-        
         return jsonify({
             'success': True,
             'stats': {
-                'total_volunteers': len(volunteers),
-                'shortlisted_count': len(shortlisted)
+                'total_volunteers': db.count_volunteers(),
+                'shortlisted_count': db.count_shortlisted_volunteers()
             }
         })
     except Exception as e:
@@ -256,18 +1071,146 @@ def get_stats():
             'error': str(e)
         }), 500
 
+@app.route('/api/admission/status', methods=['GET'])
+def get_admission_status():
+    """Concurrency, queue depth and rejection counts per endpoint class (this worker)"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'admission': {name: controller.metrics() for name, controller in admission.items()}
+    })
+
+@app.route('/api/memory/status', methods=['GET'])
+def get_memory_status():
+    """Resident matching structures and their size (this worker)"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'volunteer_store': volunteer_store.stats(),
+        'tfidf_index': matcher.index.memory_report() if matcher.index is not None else None,
+        'semantic_index': semantic_index.stats()
+    })
+
+@app.route('/api/tenants/status', methods=['GET'])
+def get_tenants_status():
+    """Resident tenants, their estimated memory, hit rates and evictions (this worker)"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'tenants': tenants.status()
+    })
+
+def sync_scheduler_elsewhere():
+    """
+    409 response for /api/sync/* when this worker doesn't run the sync scheduler
+    
+    Returns:
+        tuple: (response, 409), or None if the scheduler runs in this process
+    """
+    if sync_scheduler.running:
+        return None
+    
+    scheduler_pid = None
+    if sync_lock_path:
+        try:
+            with open(sync_lock_path) as f:
+                scheduler_pid = int(f.read().strip() or 0) or None
+        except (OSError, ValueError):
+            pass
+    
+    return jsonify({
+        'success': False,
+        'error': 'The Google Sheets sync scheduler does not run in this worker process; retry the request',
+        'scheduler_pid': scheduler_pid
+    }), 409
+
+@app.route('/api/sync/status', methods=['GET'])
+def get_sync_status():
+    """Get background Google Sheets sync status and timings"""
+    elsewhere = sync_scheduler_elsewhere()
+    if elsewhere:
+        return elsewhere
+    
+    return jsonify({
+        'success': True,
+        'sync': sync_scheduler.status()
+    })
+
+@app.route('/api/sync/sheets', methods=['POST'])
+def register_sync_sheet():
+    """
+    Register a Google Sheet for background sync
+    
+    Expected JSON body:
+    {
+        "sheet": "<Google Sheet URL or ID>",
+        "worksheet": "Sheet1"
+    }
+    """
+    elsewhere = sync_scheduler_elsewhere()
+    if elsewhere:
+        return elsewhere
+    
+    data = request.get_json() or {}
+    sheet = data.get('sheet', '').strip()
+    
+    if not sheet:
+        return jsonify({
+            'success': False,
+            'error': 'Sheet URL or ID is required'
+        }), 400
+    
+    worksheet = data.get('worksheet') or 'Sheet1'
+    job_id = sync_scheduler.register(sheet, worksheet, tenants.default.db.add_sync_sheet(sheet, worksheet))
+    return jsonify({
+        'success': True,
+        'job_id': job_id
+    })
+
+@app.route('/api/sync/sheets/<int:job_id>', methods=['DELETE'])
+def unregister_sync_sheet(job_id):
+    """Stop syncing a registered Google Sheet"""
+    elsewhere = sync_scheduler_elsewhere()
+    if elsewhere:
+        return elsewhere
+    
+    removed = tenants.default.db.remove_sync_sheet(job_id)
+    if not sync_scheduler.unregister(job_id) and not removed:
+        return jsonify({
+            'success': False,
+            'error': f'Sync job {job_id} not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'message': f'Sync job {job_id} removed'
+    })
+
+@app.route('/api/sync/run', methods=['POST'])
+def run_sync_now():
+    """Run one (or every) registered sheet sync now instead of waiting"""
+    elsewhere = sync_scheduler_elsewhere()
+    if elsewhere:
+        return elsewhere
+    
+    data = request.get_json(silent=True) or {}
+    sync_scheduler.run_now(data.get('job_id'))
+    return jsonify({
+        'success': True,
+        'message': 'Sync scheduled'
+    })
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("Volunteer Management System Starting...")
     print("="*60)
-    print("\nInitializing database...")
+    print("\nDevelopment server (use gunicorn -c gunicorn.conf.py wsgi:application in production)")
     
-    # Initialize database
-    db = Database()
+    # Start background sync in the serving process (not the reloader's watcher)
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_sync()
     
-    print("Database ready!")
     print("\nServer starting at http://localhost:5000")
     print("="*60 + "\n")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
-
@@ -0,0 +1,122 @@
+"""
+TF-IDF Index Storage Benchmark
+Builds TfidfIndex over a deterministic synthetic volunteer pool in several
+storage modes (precision and vocabulary pruning) and, for each, reports:
+  - index bytes per volunteer (weights, row indices, vocabulary, ...)
+  - build time and query latency percentiles
+  - ranking agreement with the exact float64 index over the full vocabulary:
+    overlap@k, top-1 agreement, Kendall tau over the reference top 50 and
+    the largest score error
+The per-request refit ResumeMatcher uses without MATCH_INDEX is measured
+the same way. Results are written as JSON.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from scipy.stats import kendalltau
+from benchmark_semantic import generate_volunteers, generate_queries, latency_summary
+from resume_matcher import ResumeMatcher
+from tfidf_index import TfidfIndex
+
+REFERENCE = {'precision': 'float64'}
+MODES = {
+    'float64': {'precision': 'float64'},
+    'float32': {'precision': 'float32'},
+    'int8': {'precision': 'int8'},
+    'float32_pruned': {'precision': 'float32', 'min_df': 2, 'max_df': 0.5},
+    'int8_pruned': {'precision': 'int8', 'min_df': 2, 'max_df': 0.5},
+}
+
+def agreement(reference_scores, scores, k):
+    """How closely one score vector ranks like the reference"""
+    top_reference = np.argsort(-reference_scores, kind='stable')[:k]
+    top = np.argsort(-scores, kind='stable')[:k]
+    head = np.argsort(-reference_scores, kind='stable')[:50]
+    tau = kendalltau(reference_scores[head], scores[head]).statistic
+    return {
+        'overlap': len(set(top_reference) & set(top)) / k,
+        'top1': float(top_reference[0] == top[0]),
+        'tau': 1.0 if np.isnan(tau) else float(tau),
+        'max_error': float(np.max(np.abs(reference_scores - scores))),
+    }
+
+def summarize(rows, k):
+    return {
+        f'overlap@{k}': round(float(np.mean([row['overlap'] for row in rows])), 4),
+        'top1_agreement': round(float(np.mean([row['top1'] for row in rows])), 4),
+        'kendall_tau@50': round(float(np.mean([row['tau'] for row in rows])), 4),
+        'max_score_error': round(float(max(row['max_error'] for row in rows)), 5),
+    }
+
+def build(settings, volunteer_ids, profiles):
+    index = TfidfIndex(**settings)
+    start = time.perf_counter()
+    index.fit(volunteer_ids, profiles)
+    return index, time.perf_counter() - start
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark TF-IDF index storage modes: memory vs ranking agreement')
+    arg_parser.add_argument('--volunteers', type=int, default=50000)
+    arg_parser.add_argument('--queries', type=int, default=50)
+    arg_parser.add_argument('--k', type=int, default=10)
+    arg_parser.add_argument('--output', default='bench_index_storage_results.json')
+    args = arg_parser.parse_args()
+
+    matcher = ResumeMatcher()
+    volunteers = generate_volunteers(args.volunteers)
+    queries = [matcher.preprocess_text(query) for query in generate_queries(args.queries)]
+    volunteer_ids = [volunteer['id'] for volunteer in volunteers]
+    profiles = [matcher.create_volunteer_profile(volunteer) for volunteer in volunteers]
+
+    reference, _ = build(REFERENCE, volunteer_ids, profiles)
+    reference_scores = [reference.scores(query, volunteer_ids) for query in queries]
+    del reference
+
+    print(f"\n{args.volunteers} volunteers, {args.queries} queries, k={args.k}")
+    print(f"  {'mode':<16} {'bytes/vol':>10} {'terms':>7} {'stop':>6} {'build':>7} {'p50':>8} "
+          f"{'overlap':>8} {'top1':>6} {'tau':>6} {'max err':>8}")
+    results = {}
+    for name, settings in MODES.items():
+        index, build_seconds = build(settings, volunteer_ids, profiles)
+        seconds, rows = [], []
+        for query, expected in zip(queries, reference_scores):
+            start = time.perf_counter()
+            scores = index.scores(query, volunteer_ids)
+            seconds.append(time.perf_counter() - start)
+            rows.append(agreement(expected, scores, args.k))
+        report = index.memory_report()
+        results[name] = {
+            'settings': settings,
+            'memory': report,
+            'build_seconds': round(build_seconds, 2),
+            'latency': latency_summary(seconds),
+            'agreement': summarize(rows, args.k),
+        }
+        row = results[name]
+        print(f"  {name:<16} {report['bytes_per_volunteer']:>10,.1f} {report['terms']:>7} "
+              f"{report['stop_terms']:>6} {row['build_seconds']:>6}s {row['latency']['p50_ms']:>6}ms "
+              f"{row['agreement'][f'overlap@{args.k}']:>8} {row['agreement']['top1_agreement']:>6} "
+              f"{row['agreement']['kendall_tau@50']:>6} {row['agreement']['max_score_error']:>8}")
+        del index
+
+    # Without MATCH_INDEX: a fresh 1000-term vectorizer fitted per request
+    seconds, rows = [], []
+    for query, expected in zip(queries, reference_scores):
+        start = time.perf_counter()
+        matrix = matcher.vectorizer.fit_transform([query] + profiles)
+        scores = (matrix[1:] @ matrix[0].T).toarray().ravel()
+        seconds.append(time.perf_counter() - start)
+        rows.append(agreement(expected, scores, args.k))
+    results['refit_per_request'] = {'latency': latency_summary(seconds), 'agreement': summarize(rows, args.k)}
+    print(f"  {'refit/request':<16} {'-':>10} {'1000':>7} {'-':>6} {'-':>7} "
+          f"{results['refit_per_request']['latency']['p50_ms']:>6}ms "
+          f"{results['refit_per_request']['agreement'][f'overlap@{args.k}']:>8}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'config': vars(args), 'results': results}, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+Resume Parsing Throughput Benchmark
+Generates a deterministic corpus of synthetic PDF and DOCX resumes offline
+(variable page counts, section layouts and noise) and measures
+ResumeParser.parse_resume on it:
+  - resumes per second, sequential, with a process pool and through the
+    sandboxed parser workers used by the upload endpoint
+  - time per field extractor
+  - peak Python memory per file
+Results are written as JSON.
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+import docx
+from resume_parser import ResumeParser
+from resume_sandbox import SandboxedParser
+
+FIRST_NAMES = ['Asha', 'Ben', 'Carla', 'Dev', 'Elena', 'Farid', 'Grace', 'Hiro', 'Ines', 'Jonas',
+               'Kavya', 'Liam', 'Maya', 'Noah', 'Olu', 'Priya', 'Quinn', 'Rosa', 'Sam', 'Tariq']
+LAST_NAMES = ['Sharma', 'Okafor', 'Garcia', 'Chen', 'Novak', 'Haddad', 'Smith', 'Tanaka', 'Silva',
+              'Muller', 'Iyer', 'Brown', 'Cohen', 'Kim', 'Adeyemi', 'Patel', 'Rossi', 'Lopez']
+SKILLS = ['Python', 'Django', 'Flask', 'SQL', 'JavaScript', 'React', 'Node.js', 'Docker', 'AWS',
+          'Machine Learning', 'Data Analysis', 'Excel', 'Graphic Design', 'Figma', 'SEO',
+          'Content Writing', 'Fundraising', 'Event Planning', 'Teaching', 'Public Speaking',
+          'Project Management', 'Agile', 'Git', 'Java', 'C++', 'Go', 'R', 'Kubernetes']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Health', 'City Food Bank', 'Hooli',
+             'Green Earth Trust', 'Northwind', 'Literacy First', 'Stark Industries']
+DEGREES = ['Bachelor of Computer Science', 'Master of Data Science', 'B.Tech Electronics',
+           'MBA', 'BSc Psychology', 'M.Sc Statistics', 'Bachelor of Arts, English']
+CERTIFICATIONS = ['AWS Certified Developer', 'PMP', 'Scrum Master', 'Google UX Design Certificate',
+                  'First Aid / CPR', 'ISTQB Certified Tester']
+LANGUAGES = ['English', 'Spanish', 'Hindi', 'French', 'Mandarin', 'Arabic', 'Portuguese']
+FILLER_WORDS = ('led coordinated delivered improved volunteers community program budget team '
+                'weekly reports outreach training platform analysis stakeholders events '
+                'campaign partners schools clinics data quality onboarding').split()
+
+LAYOUTS = ['classic', 'inline', 'bulleted', 'minimal']
+LINES_PER_PAGE = 45
+
+def _sentence(rng, words=12):
+    return ' '.join(rng.choice(FILLER_WORDS) for _ in range(words)).capitalize() + '.'
+
+def _noise_line(rng):
+    return ''.join(rng.choice('-=*~_.#| ') for _ in range(rng.randint(5, 60)))
+
+def generate_resume_lines(rng, layout, pages, noise):
+    """
+    Build the text lines of one synthetic resume
+
+    Args:
+        rng: random.Random used for every choice (keeps the corpus deterministic)
+        layout: One of LAYOUTS, controls how headings and lists are written
+        pages: Target page count; experience entries are padded to fill it
+        noise: Probability of inserting a noise line after each line
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    skills = rng.sample(SKILLS, rng.randint(4, 10))
+    certifications = rng.sample(CERTIFICATIONS, rng.randint(0, 2))
+    languages = rng.sample(LANGUAGES, rng.randint(1, 3))
+
+    def heading(name):
+        if layout == 'classic':
+            return [name.upper()]
+        if layout == 'bulleted':
+            return [f'• {name}']
+        return [name]
+
+    lines = [f'{first} {last}',
+             f'{first.lower()}.{last.lower()}{rng.randint(1, 999)}@example.org',
+             f'+1 {rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}',
+             '']
+
+    if layout == 'inline':
+        lines.append('Skills: ' + ', '.join(skills))
+    elif layout == 'minimal':
+        lines.append('Comfortable with ' + ', '.join(skills) + '.')
+    else:
+        lines += heading('Skills') + [f'- {skill}' if layout == 'bulleted' else skill for skill in skills]
+    lines.append('')
+
+    lines += heading('Experience')
+    while len(lines) < pages * LINES_PER_PAGE - 12:
+        lines.append(f'{rng.choice(COMPANIES)} - {rng.randint(2008, 2024)}')
+        lines += [_sentence(rng) for _ in range(rng.randint(2, 5))]
+        lines.append('')
+
+    lines += heading('Education') + [rng.choice(DEGREES), '']
+    if certifications:
+        lines += ['Certifications: ' + ', '.join(certifications)] if layout == 'inline' \
+            else heading('Certifications') + certifications
+    lines += ['Languages: ' + ', '.join(languages)]
+
+    noisy = []
+    for line in lines:
+        noisy.append(line)
+        if rng.random() < noise:
+            noisy.append(_noise_line(rng))
+    return noisy
+
+def write_docx(lines):
+    """Render resume lines as a DOCX document"""
+    document = docx.Document()
+    document.core_properties.created = datetime(2024, 1, 1)
+    document.core_properties.modified = datetime(2024, 1, 1)
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def _pdf_escape(text):
+    text = text.encode('latin-1', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def write_pdf(lines):
+    """
+    Render resume lines as a minimal multi-page PDF (Helvetica, one Tj per line)
+
+    Just enough of the PDF 1.4 structure for PyPDF2 to extract the text.
+    """
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects = []  # object bodies, numbered from 1
+
+    # 1: catalog, 2: page tree, 3: font; pages and content streams follow
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append('<< /Type /Catalog /Pages 2 0 R >>')
+    objects.append('<< /Type /Pages /Kids [%s] /Count %d >>' % (' '.join(f'{p} 0 R' for p in page_ids), len(pages)))
+    objects.append('<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+
+    for page_id, page_lines in zip(page_ids, pages):
+        stream = ['BT', '/F1 10 Tf', '14 TL', '50 800 Td']
+        for line in page_lines:
+            stream.append(f'({_pdf_escape(line)}) Tj T*')
+        stream.append('ET')
+        content = '\n'.join(stream)
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>')
+        objects.append(f'<< /Length {len(content.encode("latin-1"))} >>\nstream\n{content}\nendstream')
+
+    output = io.BytesIO()
+    output.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1'))
+
+    xref_offset = output.tell()
+    output.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1'))
+    for offset in offsets:
+        output.write(f'{offset:010d} 00000 n \n'.encode('latin-1'))
+    output.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+                 f'startxref\n{xref_offset}\n%%EOF\n'.encode('latin-1'))
+    return output.getvalue()
+
+def generate_corpus(count, seed=42, max_pages=4, noise=0.05):
+    """
+    Generate a deterministic corpus of synthetic resumes
+
+    Returns:
+        list: (filename, file_bytes) pairs, alternating PDF and DOCX
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        layout = LAYOUTS[i % len(LAYOUTS)]
+        pages = rng.randint(1, max_pages)
+        lines = generate_resume_lines(rng, layout, pages, noise)
+        if i % 2 == 0:
+            corpus.append((f'resume_{i:05d}_{layout}_{pages}p.pdf', write_pdf(lines)))
+        else:
+            corpus.append((f'resume_{i:05d}_{layout}_{pages}p.docx', write_docx(lines)))
+    return corpus
+
+def profile_file(parser, filename, file_content):
+    """Parse one file, timing text extraction and each field extractor separately"""
+    timings = {}
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    text = parser.extract_text(file_content, filename)
+    timings['extract_text'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sections = parser.segment_sections(text)
+    timings['segment_sections'] = time.perf_counter() - start
+
+    extractors = {
+        'name': lambda: parser.extract_name(text),
+        'email': lambda: parser.extract_email(text),
+        'phone': lambda: parser.extract_phone(text),
+        'skills': lambda: parser.extract_skills(text, sections),
+        'experience': lambda: parser.extract_experience(text, sections),
+        'education': lambda: parser.extract_education(text, sections),
+        'certifications': lambda: parser.extract_certifications(text, sections),
+        'languages': lambda: parser.extract_languages(text, sections),
+    }
+    for field, extractor in extractors.items():
+        start = time.perf_counter()
+        extractor()
+        timings[field] = time.perf_counter() - start
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings, peak
+
+def _parse_one(item):
+    filename, file_content = item
+    return ResumeParser().parse_resume(file_content, filename) is not None
+
+def run_sequential(corpus):
+    """Parse the corpus in-process, one file at a time"""
+    parser = ResumeParser()
+    start = time.perf_counter()
+    parsed = sum(parser.parse_resume(content, name) is not None for name, content in corpus)
+    elapsed = time.perf_counter() - start
+    return {'files': len(corpus), 'parsed': parsed, 'seconds': round(elapsed, 4),
+            'resumes_per_second': round(len(corpus) / elapsed, 2)}
+
+def run_parallel(corpus, workers):
+    """Parse the corpus across a pool of worker processes"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_parse_one, corpus[:workers]))  # warm up the workers
+        start = time.perf_counter()
+        parsed = sum(pool.map(_parse_one, corpus, chunksize=4))
+        elapsed = time.perf_counter() - start
+    return {'workers': workers, 'files': len(corpus), 'parsed': parsed, 'seconds': round(elapsed, 4),
+            'resumes_per_second': round(len(corpus) / elapsed, 2)}
+
+def run_sandboxed(corpus, workers):
+    """Parse the corpus through SandboxedParser, as /api/upload-resume does"""
+    sandbox = SandboxedParser(pool_size=workers)
+    spool_dir = tempfile.mkdtemp(prefix='bench_resumes_')
+    paths = []
+    for filename, content in corpus:
+        path = os.path.join(spool_dir, filename)
+        with open(path, 'wb') as f:
+            f.write(content)
+        paths.append((path, filename))
+
+    def parse(item):
+        text, _ = sandbox.parse_file(*item)
+        return bool(text)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(parse, paths[:workers]))  # start the worker processes
+            start = time.perf_counter()
+            parsed = sum(pool.map(parse, paths))
+            elapsed = time.perf_counter() - start
+    finally:
+        sandbox.close()
+        shutil.rmtree(spool_dir)
+
+    return {'workers': workers, 'files': len(corpus), 'parsed': parsed, 'seconds': round(elapsed, 4),
+            'resumes_per_second': round(len(corpus) / elapsed, 2)}
+
+def summarize_fields(profiles):
+    """Mean and max milliseconds per field across all profiled files"""
+    summary = {}
+    for field in profiles[0]['timings_ms']:
+        values = [p['timings_ms'][field] for p in profiles]
+        summary[field] = {'mean_ms': round(sum(values) / len(values), 4), 'max_ms': round(max(values), 4)}
+    return summary
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark resume parsing throughput')
+    arg_parser.add_argument('--count', type=int, default=200, help='Number of resumes to generate')
+    arg_parser.add_argument('--seed', type=int, default=42)
+    arg_parser.add_argument('--max-pages', type=int, default=4)
+    arg_parser.add_argument('--noise', type=float, default=0.05, help='Probability of a noise line')
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    arg_parser.add_argument('--save-corpus', help='Directory to write the generated files to')
+    arg_parser.add_argument('--output', default='bench_parse_throughput_results.json')
+    args = arg_parser.parse_args()
+
+    print(f"\nGenerating {args.count} synthetic resumes (seed {args.seed})...")
+    corpus = generate_corpus(args.count, args.seed, args.max_pages, args.noise)
+    if args.save_corpus:
+        os.makedirs(args.save_corpus, exist_ok=True)
+        for filename, content in corpus:
+            with open(os.path.join(args.save_corpus, filename), 'wb') as f:
+                f.write(content)
+
+    print("Profiling fields and memory per file...")
+    parser = ResumeParser()
+    profiles = []
+    for filename, content in corpus:
+        timings, peak = profile_file(parser, filename, content)
+        profiles.append({
+            'file': filename,
+            'bytes': len(content),
+            'peak_memory_bytes': peak,
+            'timings_ms': {k: round(v * 1000, 4) for k, v in timings.items()},
+        })
+
+    print("Running sequential path...")
+    sequential = run_sequential(corpus)
+    print(f"  {sequential['resumes_per_second']} resumes/s")
+
+    print(f"Running parallel path ({args.workers} workers)...")
+    parallel = run_parallel(corpus, args.workers)
+    print(f"  {parallel['resumes_per_second']} resumes/s")
+
+    print(f"Running sandboxed path ({args.workers} workers)...")
+    sandboxed = run_sandboxed(corpus, args.workers)
+    print(f"  {sandboxed['resumes_per_second']} resumes/s")
+
+    peaks = [p['peak_memory_bytes'] for p in profiles]
+    results = {
+        'config': vars(args),
+        'sequential': sequential,
+        'parallel': parallel,
+        'sandboxed': sandboxed,
+        'fields': summarize_fields(profiles),
+        'memory': {'mean_peak_bytes': int(sum(peaks) / len(peaks)), 'max_peak_bytes': max(peaks)},
+        'files': profiles,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print("\nPer-field mean time (ms):")
+    for field, stats in results['fields'].items():
+        print(f"  {field:<18} {stats['mean_ms']:>9.3f}")
+    print(f"\nMean peak memory per file: {results['memory']['mean_peak_bytes'] / 1024:.1f} KiB")
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
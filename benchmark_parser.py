@@ -0,0 +1,123 @@
+"""
+Resume Parser Benchmark
+Measures ResumeParser.parse_text on adversarial inputs (long lines, heading
+floods, punctuation runs that used to trigger regex backtracking) and checks
+that parse time stays within a per-resume bound that grows linearly with size.
+Also checks that skill matching cost stays flat as the taxonomy grows.
+"""
+
+import argparse
+import json
+import random
+import time
+from resume_parser import ResumeParser
+from skills_taxonomy import SkillsTaxonomy, get_default_taxonomy
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+def _repeat_to(unit, size):
+    return (unit * (size // len(unit) + 1))[:size]
+
+def adversarial_inputs(size, seed=42):
+    """Build the adversarial resume texts of roughly `size` characters"""
+    rng = random.Random(seed)
+    noise = ''.join(rng.choice('abc .,@-:\n•') for _ in range(size))
+    return {
+        'dotted_run': _repeat_to('a.', size),
+        'email_like_token': _repeat_to('a.b-', size - 20) + '@example',
+        'single_long_line': _repeat_to('skills experience education ', size),
+        'heading_flood': _repeat_to('Experience\nEducation:\nSkills - \n', size),
+        'no_blank_lines': _repeat_to('Skills: Python, SQL\nWorked at Acme\n', size),
+        'skill_words': _repeat_to('python go java machine learning ', size),
+        'digit_run': _repeat_to('1234567 ', size),
+        'random_noise': noise,
+    }
+
+def time_parse(parser, text, repeats):
+    """Best-of-N wall time of parse_text in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parser.parse_text(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def run_adversarial(max_ms_per_100k, repeats=3):
+    """
+    Time every adversarial input at every size
+
+    Returns:
+        list: One result dict per (case, size), with `within_bound` set when
+        parse time is under max_ms_per_100k per 100k characters
+    """
+    parser = ResumeParser()
+    results = []
+
+    for size in SIZES:
+        for case, text in adversarial_inputs(size).items():
+            elapsed_ms = time_parse(parser, text, repeats)
+            bound_ms = max_ms_per_100k * max(len(text), 100_000) / 100_000
+            results.append({
+                'case': case,
+                'chars': len(text),
+                'parse_ms': round(elapsed_ms, 3),
+                'bound_ms': round(bound_ms, 3),
+                'within_bound': elapsed_ms <= bound_ms,
+            })
+            print(f"  {case:<18} {len(text):>9} chars  {elapsed_ms:>9.2f} ms"
+                  f"{'' if elapsed_ms <= bound_ms else '  [OVER BOUND]'}")
+
+    return results
+
+def run_taxonomy_scaling(repeats=3):
+    """
+    Time skill matching on a fixed resume with taxonomies of growing size
+
+    The synthetic skills are padded onto the real taxonomy, so the text still
+    contains genuine matches at every size.
+    """
+    base = [{'name': name, 'aliases': []} for name in get_default_taxonomy().skills]
+    text = _repeat_to('Python developer with Django, SQL and machine learning. ', 50_000)
+    results = []
+
+    for extra in [0, 1_000, 10_000, 50_000]:
+        synthetic = [{'name': f'skill{i:05d} tool{i % 97}', 'aliases': [f'st{i:05d}']} for i in range(extra)]
+        taxonomy = SkillsTaxonomy(base + synthetic)
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            taxonomy.find_skills(text)
+            best = min(best, time.perf_counter() - start)
+        results.append({'taxonomy_size': len(taxonomy.skills), 'match_ms': round(best * 1000, 3)})
+        print(f"  {len(taxonomy.skills):>6} skills  {best * 1000:>9.2f} ms")
+
+    return results
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark the resume parser')
+    arg_parser.add_argument('--max-ms-per-100k', type=float, default=100.0,
+                            help='Allowed parse time per 100k characters of resume text')
+    arg_parser.add_argument('--repeats', type=int, default=3)
+    arg_parser.add_argument('--output', default='bench_parser_results.json')
+    args = arg_parser.parse_args()
+
+    print("\nAdversarial parse-time benchmark")
+    print("-" * 60)
+    results = run_adversarial(args.max_ms_per_100k, args.repeats)
+
+    print("\nSkill matching vs taxonomy size (50k chars)")
+    print("-" * 60)
+    taxonomy_results = run_taxonomy_scaling(args.repeats)
+
+    with open(args.output, 'w') as f:
+        json.dump({'adversarial': results, 'taxonomy_scaling': taxonomy_results}, f, indent=2)
+
+    failures = [r for r in results if not r['within_bound']]
+    print(f"\nResults written to {args.output}")
+    if failures:
+        print(f"[ERROR] {len(failures)} case(s) exceeded the parse-time bound")
+        raise SystemExit(1)
+    print("[SUCCESS] All cases within the parse-time bound")
+
+if __name__ == "__main__":
+    main()
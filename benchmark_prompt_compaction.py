@@ -0,0 +1,121 @@
+"""
+Prompt Compaction Benchmark
+Runs synthetic job descriptions (synthetic_data.py, boilerplate included)
+through keyword extraction twice, once with the full description in the
+prompt and once with compact_description(), and shortlists a synthetic
+volunteer pool with each set of keywords the way POST /api/shortlist does
+(auto filters from the keywords, then TF-IDF on the description plus the
+keywords). Reports:
+  - prompt tokens per description, before and after, and what was dropped
+  - compaction time
+  - shortlist equivalence: overlap@k, top-1 agreement, identical top-k
+    order, identical auto filters and identical extracted skills
+
+Keywords come from stub_openai_server.build_keywords (taxonomy skills and
+words of the description), so results are deterministic and offline. The
+stub turns every word into a keyword, boilerplate included, which makes it a
+pessimistic stand-in for the model; --endpoint runs KeywordExtractor against
+a real deployment instead.
+Results are written as JSON.
+"""
+
+import argparse
+import json
+import os
+import time
+import numpy as np
+from benchmark_semantic import latency_summary
+from facet_index import FacetIndex
+from prompt_compaction import compact_description, tiktoken
+from resume_matcher import ResumeMatcher
+from stub_openai_server import build_keywords
+from synthetic_data import generate_jobs, generate_volunteers
+
+def shortlist(matcher, facet_index, volunteers_by_id, description, keywords_data, k):
+    """Top-k volunteer ids and auto filters, as rank_shortlist computes them"""
+    filters = facet_index.filters_from_keywords(keywords_data)
+    eligible = facet_index.volunteer_ids(facet_index.select(filters, set(filters)))
+    enhanced_description = description + " " + " ".join(keywords_data.get('all_keywords', []))
+    matches = matcher.match_volunteers([volunteers_by_id[i] for i in eligible], enhanced_description, top_n=k)
+    return [volunteer['id'] for volunteer, _, _ in matches], filters
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark job description compaction: tokens saved vs shortlist equivalence')
+    arg_parser.add_argument('--jobs', type=int, default=100)
+    arg_parser.add_argument('--volunteers', type=int, default=5000)
+    arg_parser.add_argument('--boilerplate', type=float, default=0.8)
+    arg_parser.add_argument('--max-tokens', type=int, default=600)
+    arg_parser.add_argument('--k', type=int, default=10)
+    arg_parser.add_argument('--endpoint', help='Extract keywords with KeywordExtractor against this endpoint instead')
+    arg_parser.add_argument('--output', default='bench_prompt_compaction_results.json')
+    args = arg_parser.parse_args()
+
+    if args.endpoint:
+        os.environ['AZURE_OPENAI_ENDPOINT'] = args.endpoint
+        from keyword_extractor import KeywordExtractor
+        extractor = KeywordExtractor()
+        extract = extractor.extract_keywords
+    else:
+        extract = build_keywords
+
+    volunteers = [dict(volunteer, id=volunteer_id)
+                  for volunteer_id, volunteer in enumerate(generate_volunteers(args.volunteers, seed=3), start=1)]
+    volunteers_by_id = {volunteer['id']: volunteer for volunteer in volunteers}
+    facet_index = FacetIndex()
+    facet_index.ingest(volunteers)
+    matcher = ResumeMatcher()
+    matcher.ingest_volunteers(volunteers)
+
+    rows, seconds = [], []
+    for job in generate_jobs(args.jobs, seed=5, boilerplate=args.boilerplate):
+        description = job['description']
+        start = time.perf_counter()
+        compaction = compact_description(description, max_tokens=args.max_tokens)
+        seconds.append(time.perf_counter() - start)
+
+        full_keywords, compact_keywords = extract(description), extract(compaction['text'])
+        full, full_filters = shortlist(matcher, facet_index, volunteers_by_id, description, full_keywords, args.k)
+        compact, compact_filters = shortlist(matcher, facet_index, volunteers_by_id, description, compact_keywords, args.k)
+        rows.append({
+            'original_tokens': compaction['original_tokens'],
+            'tokens': compaction['tokens'],
+            'dropped': compaction['dropped'],
+            'overlap': len(set(full) & set(compact)) / max(len(full), 1),
+            'top1': float(full[:1] == compact[:1]),
+            'identical': float(full == compact),
+            'same_filters': float(full_filters == compact_filters),
+            'same_skills': float(set(full_keywords.get('skills', [])) == set(compact_keywords.get('skills', []))),
+        })
+
+    original = sum(row['original_tokens'] for row in rows)
+    compacted = sum(row['tokens'] for row in rows)
+    results = {
+        'tokens': {
+            'original_mean': round(original / len(rows), 1),
+            'compacted_mean': round(compacted / len(rows), 1),
+            'saved_ratio': round(1 - compacted / original, 4),
+            'dropped_units': {reason: sum(row['dropped'][reason] for row in rows) for reason in rows[0]['dropped']},
+        },
+        'compaction_latency': latency_summary(seconds),
+        'equivalence': {
+            f'overlap@{args.k}': round(float(np.mean([row['overlap'] for row in rows])), 4),
+            'top1_agreement': round(float(np.mean([row['top1'] for row in rows])), 4),
+            'identical_top_k': round(float(np.mean([row['identical'] for row in rows])), 4),
+            'same_auto_filters': round(float(np.mean([row['same_filters'] for row in rows])), 4),
+            'same_skills': round(float(np.mean([row['same_skills'] for row in rows])), 4),
+        },
+        'token_counter': 'tiktoken' if tiktoken is not None else 'chars/4',
+    }
+
+    print(f"\n{args.jobs} descriptions (boilerplate {args.boilerplate}), {args.volunteers} volunteers, k={args.k}")
+    print(f"  tokens/description: {results['tokens']['original_mean']} -> {results['tokens']['compacted_mean']} "
+          f"({results['tokens']['saved_ratio']:.0%} saved), dropped {results['tokens']['dropped_units']}")
+    print(f"  compaction p50 {results['compaction_latency']['p50_ms']} ms, p95 {results['compaction_latency']['p95_ms']} ms")
+    print(f"  equivalence: {results['equivalence']}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'config': vars(args), 'results': results}, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Semantic Engine Recall / Latency Benchmark
+Builds SemanticIndex over a deterministic synthetic volunteer pool and, for a
+grid of LSH settings (tables, bits, probes), measures:
+  - recall@k against exact search over the same LSA vectors
+  - query latency percentiles and how many volunteers each query scores
+It also reports build and fold-in cost, exact LSA latency, the TF-IDF
+matcher's latency on the same pool, and how much its top k overlaps with
+the LSA top k. Results are written as JSON.
+"""
+
+import argparse
+import json
+import random
+import time
+from benchmark_parse_throughput import FIRST_NAMES, LAST_NAMES, LANGUAGES, CERTIFICATIONS
+from load_test import JOB_DESCRIPTIONS
+from resume_matcher import ResumeMatcher
+from semantic_index import SemanticIndex
+
+# Related vocabulary per field, so the pool has the co-occurrence structure LSA picks up
+DOMAINS = {
+    'web': ['Python', 'Django', 'Flask', 'JavaScript', 'React', 'Node.js', 'HTML', 'CSS', 'REST APIs',
+            'web development', 'frontend', 'backend', 'full stack'],
+    'data': ['SQL', 'Excel', 'Tableau', 'Power BI', 'Data Analysis', 'Statistics', 'Pandas',
+             'Machine Learning', 'reporting', 'dashboards', 'data cleaning'],
+    'design': ['Graphic Design', 'Figma', 'Photoshop', 'Illustrator', 'UX', 'branding', 'posters',
+               'social media graphics', 'layout'],
+    'teaching': ['Teaching', 'Tutoring', 'Mentoring', 'Curriculum', 'Lesson Planning', 'classroom',
+                 'literacy', 'mathematics', 'reading support'],
+    'events': ['Event Planning', 'Fundraising', 'Public Speaking', 'logistics', 'volunteer coordination',
+               'donor relations', 'outreach', 'community engagement'],
+    'health': ['First Aid', 'Nursing', 'Patient Care', 'Counselling', 'mental health', 'clinic support',
+               'health camps', 'elder care'],
+}
+WORDS = ('led coordinated delivered improved built supported organised trained planned managed '
+         'volunteers community program team weekly projects schools clinics partners').split()
+DEFAULT_GRID = {'tables': [4, 8, 16, 32], 'bits': [None], 'probes': [0, 2, 4]}
+
+def generate_volunteers(count, seed=0, start_id=1):
+    """Synthetic volunteers with one main field of work and some spill-over"""
+    rng = random.Random(seed)
+    domains = list(DOMAINS)
+    volunteers = []
+    for i in range(count):
+        main = rng.choice(domains)
+        other = rng.choice(domains)
+        skills = rng.sample(DOMAINS[main], rng.randint(3, 6)) + rng.sample(DOMAINS[other], rng.randint(0, 2))
+        experience = ' '.join(rng.choice(WORDS) for _ in range(6)) + ' ' + ' '.join(rng.sample(DOMAINS[main], 2))
+        volunteers.append({
+            'id': start_id + i,
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'skills': ', '.join(skills),
+            'experience': f'{rng.randint(1, 15)} years. {experience}',
+            'education': '',
+            'certifications': ', '.join(rng.sample(CERTIFICATIONS, rng.randint(0, 1))),
+            'interests': ', '.join(rng.sample(DOMAINS[main], 2)),
+            'languages': ', '.join(rng.sample(LANGUAGES, rng.randint(1, 2))),
+        })
+    return volunteers
+
+def generate_queries(count, seed=1):
+    rng = random.Random(seed)
+    queries = list(JOB_DESCRIPTIONS)
+    while len(queries) < count:
+        domain = rng.choice(list(DOMAINS))
+        terms = rng.sample(DOMAINS[domain], 3)
+        queries.append(f"Looking for a volunteer with {terms[0]}, {terms[1]} and {terms[2]} experience.")
+    return queries[:count]
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, round(p / 100 * len(values)) - 1))]
+
+def latency_summary(seconds):
+    return {
+        'p50_ms': round(percentile(seconds, 50) * 1000, 2),
+        'p95_ms': round(percentile(seconds, 95) * 1000, 2),
+        'mean_ms': round(sum(seconds) / len(seconds) * 1000, 2),
+    }
+
+def run_grid(volunteers, queries, k, grid, dimensions):
+    matcher = ResumeMatcher()
+    rows = []
+    for tables in grid['tables']:
+        for bits in grid['bits']:
+            index = SemanticIndex(matcher, dimensions=dimensions, tables=tables, bits=bits)
+            index.build(volunteers)
+            exact = [[volunteer_id for volunteer_id, _ in index.search(query, k, exact=True)[0]] for query in queries]
+            for probes in grid['probes']:
+                recalls, seconds, scored = [], [], []
+                for query, reference in zip(queries, exact):
+                    start = time.perf_counter()
+                    results, count = index.search(query, k, probes=probes)
+                    seconds.append(time.perf_counter() - start)
+                    scored.append(count)
+                    found = {volunteer_id for volunteer_id, _ in results}
+                    recalls.append(len(found & set(reference)) / max(len(reference), 1))
+                row = {
+                    'tables': tables, 'bits': index.bits, 'probes': probes,
+                    f'recall@{k}': round(sum(recalls) / len(recalls), 4),
+                    'avg_scored': round(sum(scored) / len(scored)),
+                    **latency_summary(seconds),
+                }
+                rows.append(row)
+                print(f"  tables={tables:<3} bits={index.bits:<3} probes={probes:<2} "
+                      f"recall@{k}={row[f'recall@{k}']:.3f}  scored={row['avg_scored']:>6}  "
+                      f"p50={row['p50_ms']}ms p95={row['p95_ms']}ms")
+    return rows
+
+def run_baselines(volunteers, queries, k, dimensions, fold_in_count):
+    matcher = ResumeMatcher()
+    index = SemanticIndex(matcher, dimensions=dimensions)
+
+    start = time.perf_counter()
+    index.build(volunteers)
+    build_seconds = time.perf_counter() - start
+
+    exact_seconds, tfidf_seconds, overlaps = [], [], []
+    for query in queries:
+        start = time.perf_counter()
+        semantic, _ = index.search(query, k, exact=True)
+        exact_seconds.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        lexical = matcher.match_volunteers(volunteers, query, k)
+        tfidf_seconds.append(time.perf_counter() - start)
+        overlaps.append(len({v for v, _ in semantic} & {v['id'] for v, _, _ in lexical}) / k)
+
+    new_volunteers = generate_volunteers(fold_in_count, seed=99, start_id=len(volunteers) + 1)
+    start = time.perf_counter()
+    index.ingest(new_volunteers)
+    fold_in_seconds = time.perf_counter() - start
+
+    return {
+        'build_seconds': round(build_seconds, 2),
+        'index': index.stats(),
+        'exact_lsa': latency_summary(exact_seconds),
+        'tfidf_matcher': latency_summary(tfidf_seconds),
+        f'tfidf_overlap@{k}': round(sum(overlaps) / len(overlaps), 4),
+        'fold_in_ms_per_volunteer': round(fold_in_seconds / fold_in_count * 1000, 3),
+    }
+
+def parse_list(text, convert=int):
+    return [None if value == 'auto' else convert(value) for value in text.split(',')]
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark semantic (LSA + LSH) matching recall and latency')
+    arg_parser.add_argument('--volunteers', type=int, default=20000)
+    arg_parser.add_argument('--queries', type=int, default=50)
+    arg_parser.add_argument('--k', type=int, default=10)
+    arg_parser.add_argument('--dimensions', type=int, default=128)
+    arg_parser.add_argument('--tables', default=','.join(map(str, DEFAULT_GRID['tables'])))
+    arg_parser.add_argument('--bits', default='auto', help="Comma-separated bit counts, 'auto' for the default")
+    arg_parser.add_argument('--probes', default=','.join(map(str, DEFAULT_GRID['probes'])))
+    arg_parser.add_argument('--fold-in', type=int, default=500, help='Volunteers folded in after the build')
+    arg_parser.add_argument('--output', default='bench_semantic_results.json')
+    args = arg_parser.parse_args()
+
+    volunteers = generate_volunteers(args.volunteers)
+    queries = generate_queries(args.queries)
+    grid = {'tables': parse_list(args.tables), 'bits': parse_list(args.bits), 'probes': parse_list(args.probes)}
+
+    print(f"\nBaselines ({args.volunteers} volunteers, {args.queries} queries, k={args.k})...")
+    baselines = run_baselines(volunteers, queries, args.k, args.dimensions, args.fold_in)
+    print(f"  build {baselines['build_seconds']}s, exact LSA p50 {baselines['exact_lsa']['p50_ms']}ms, "
+          f"TF-IDF matcher p50 {baselines['tfidf_matcher']['p50_ms']}ms, "
+          f"fold-in {baselines['fold_in_ms_per_volunteer']}ms/volunteer")
+
+    print("\nLSH grid (recall against exact LSA search)...")
+    grid_results = run_grid(volunteers, queries, args.k, grid, args.dimensions)
+
+    with open(args.output, 'w') as f:
+        json.dump({'config': vars(args), 'baselines': baselines, 'grid': grid_results}, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -17,3 +17,61 @@ MAX_VOLUNTEERS_TO_ANALYZE = 50  # Analyze top 50 candidates in detail
 TOP_MATCHES_TO_RETURN = 10  # Return top 10 best matches
 MIN_MATCH_SCORE = 60  # Minimum score to be considered a match (0-100)
 
+
+# Resume Upload Limits
+MAX_UPLOAD_MB = 10  # Reject resume uploads larger than this
+PARSE_TIMEOUT_SECONDS = 20  # Kill a parser worker that takes longer than this
+PARSE_MEMORY_LIMIT_MB = 512  # Address-space cap for each parser worker (POSIX only)
+PARSE_MAX_PAGES = 20  # Only read this many PDF pages
+MAX_IMPORT_MB = 1024  # Reject bulk volunteer imports (CSV / JSON lines) larger than this
+PARSER_WORKERS = 2  # Number of reusable parser worker processes
+
+# Google Sheets Background Sync (runs inside the web app)
+SYNC_SHEETS = []  # e.g. [{"sheet": "<sheet url or id>", "worksheet": "Form Responses 1"}]
+SYNC_MIN_INTERVAL_SECONDS = 30  # Polling interval while a sheet is being edited
+SYNC_MAX_INTERVAL_SECONDS = 900  # Polling backs off to this when nothing changes
+
+# API Responses
+RESPONSE_CACHE_ENTRIES = 256  # Rendered GET responses kept per worker (keyed by URL and data version)
+COMPRESS_MIN_BYTES = 1024  # gzip/brotli-compress responses at least this large
+
+# Shortlisting
+AUTO_FACET_FILTERS = True  # Filter on location/availability keywords extracted from the job description
+MATCH_ENGINE = "tfidf"  # Default engine: "tfidf" (exact cosine) or "semantic" (LSA + LSH, see semantic_index.py)
+SEMANTIC_INDEX = {
+    # "dimensions": 128, "max_features": 20000,  # LSA model
+    # "tables": 16, "bits": None, "probes": 2,    # LSH recall/latency (bits=None: ~32 volunteers per bucket)
+    # "refit_ratio": 0.25,                        # Refit after this share of the pool was folded in
+}
+PROMPT_COMPACTION = {"max_tokens": 600}  # Strip boilerplate from job descriptions before keyword extraction (None disables)
+SHORTLIST_CACHE_MB = 32  # Cached keyword extractions and ranked shortlists per worker (0 disables)
+MATCH_INDEX = None  # Resident TF-IDF index for the "tfidf" engine (see tfidf_index.py); None refits per request
+# MATCH_INDEX = {
+#     "precision": "float32",            # "float64", "float32" or "int8" weights
+#     "min_df": 2, "max_df": 0.5,        # Prune rare terms and corpus-wide stop terms
+#     "max_features": None,              # Optional vocabulary cap
+#     "refit_ratio": 0.1,                # Refit after this share of the pool changed
+# }
+
+# Job Postings (standing queries matched against arriving volunteers)
+POSTING_TOP_K = 25  # Best volunteers stored per posting
+POSTING_MIN_SCORE = 0.05  # Volunteers below this similarity are never stored
+
+# Tenants (one database and set of matching indexes per organisation; see tenants.py)
+# Requests choose one with an X-Tenant header or ?tenant=; without one they use volunteer_management.db
+TENANTS = {}  # e.g. {"north": "data/north.db", "south": "data/south.db"}
+TENANT_MEMORY_MB = 1024  # Resident budget per worker; idle tenants beyond it are spilled to disk
+TENANT_MAX_RESIDENT = None  # Optional cap on resident tenants besides the default
+TENANT_SPILL_DIRECTORY = None  # Where evicted state is written; must be owned by the app's user, mode 0700 (default: a private temp dir per process)
+
+# Admission Control (per worker process; see admission.py)
+# Override any of: max_concurrent, max_queue, max_wait_seconds
+ADMISSION_LIMITS = {
+    # "matching": {"max_concurrent": 2, "max_queue": 8, "max_wait_seconds": 15},  # /api/shortlist
+    # "parsing": {"max_concurrent": 2, "max_queue": 16, "max_wait_seconds": 20},   # /api/upload-resume
+    # "sync": {"max_concurrent": 1, "max_queue": 2, "max_wait_seconds": 30},       # /api/volunteers/import
+}
+
+# Profiling (disabled unless a token is set; send it as the X-Admin-Token header)
+PROFILING_ADMIN_TOKEN = None  # e.g. a long random string
+PROFILING_DIRECTORY = None  # Where profiles are written; must be owned by the app's user, mode 0700 (default: a private temp dir)
@@ -2,6 +2,36 @@ import sqlite3
 from datetime import datetime
 import json
 
+# Volunteer columns accepted on insert: core fields first, then the expanded schema
+VOLUNTEER_FIELDS = [
+    'name', 'email', 'phone', 'skills', 'experience', 'education',
+    'availability', 'languages', 'certifications', 'interests',
+    # Expanded fields
+    'timestamp', 'prefix', 'alternate_phone', 'date_of_birth', 'anniversary_date',
+    'gender', 'country', 'state', 'city', 'address', 'pin_code', 'zip_code',
+    'education_field', 'job_sector', 'profession', 'job_position', 'years_experience',
+    'linkedin_url', 'facebook_url', 'instagram_url', 'previous_experience',
+    'primary_skills', 'secondary_skills', 'volunteering_mode', 'availability_days',
+    'time_availability', 'commitment_duration', 'join_date', 'hear_about_source',
+    'passed_examination', 'departments_served', 'journey_description',
+]
+
+# Every column of a volunteer row
+VOLUNTEER_COLUMNS = ['id'] + VOLUNTEER_FIELDS + ['created_at']
+
+# Columns added to job_postings for standing-query matching
+JOB_POSTING_COLUMNS = {
+    'status': "TEXT NOT NULL DEFAULT 'open'",
+    'keywords': 'TEXT',         # JSON keyword extraction result
+    'filters': 'TEXT',          # JSON {"filters": {facet: [values]}, "lenient": [facets]}
+    'top_k': 'INTEGER NOT NULL DEFAULT 25',
+    'vector_indices': 'BLOB',   # hashed term vector (int32 indices, float32 values)
+    'vector_values': 'BLOB',
+}
+
+# Independently versioned groups of tables; every write bumps the version of its scope
+DATA_SCOPES = ['volunteers', 'shortlisted', 'resumes', 'postings']
+
 class Database:
     def __init__(self, db_name='volunteer_management.db'):
         self.db_name = db_name
@@ -33,6 +63,13 @@ class Database:
             )
         ''')
         
+        # Add expanded-schema columns to databases created before they existed
+        cursor.execute('PRAGMA table_info(volunteers)')
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for field in VOLUNTEER_FIELDS:
+            if field not in existing_columns:
+                cursor.execute(f'ALTER TABLE volunteers ADD COLUMN {field} TEXT')
+        
         # Create shortlisted_volunteers table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS shortlisted_volunteers (
@@ -46,7 +83,21 @@ class Database:
             )
         ''')
         
-        # Create job_postings table for reference
+        # Create shortlist_runs table (one row per /api/shortlist request)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS shortlist_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_description TEXT NOT NULL,
+                result_count INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('PRAGMA table_info(shortlisted_volunteers)')
+        if 'run_id' not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE shortlisted_volunteers ADD COLUMN run_id INTEGER REFERENCES shortlist_runs (id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_shortlisted_run ON shortlisted_volunteers (run_id)')
+        
+        # Create job_postings table (standing queries matched against arriving volunteers)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS job_postings (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,11 +107,144 @@ class Database:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        cursor.execute('PRAGMA table_info(job_postings)')
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for column, definition in JOB_POSTING_COLUMNS.items():
+            if column not in existing_columns:
+                cursor.execute(f'ALTER TABLE job_postings ADD COLUMN {column} {definition}')
+        
+        # Create posting_matches table (persisted top-k volunteers per job posting)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS posting_matches (
+                posting_id INTEGER NOT NULL,
+                volunteer_id INTEGER NOT NULL,
+                score REAL NOT NULL,
+                matching_skills TEXT,
+                matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (posting_id, volunteer_id),
+                FOREIGN KEY (posting_id) REFERENCES job_postings (id),
+                FOREIGN KEY (volunteer_id) REFERENCES volunteers (id)
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_posting_matches_score ON posting_matches (posting_id, score DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_posting_matches_volunteer ON posting_matches (volunteer_id)')
+        
+        # Create resume_documents table (raw extracted text keyed by SHA-256 of the file)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS resume_documents (
+                content_hash TEXT PRIMARY KEY,
+                filename TEXT,
+                extracted_text TEXT NOT NULL,
+                parsed_data TEXT,
+                parser_version INTEGER,
+                volunteer_id INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (volunteer_id) REFERENCES volunteers (id)
+            )
+        ''')
+        
+        # Create sheet sync state tables (row fingerprints per synced worksheet)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sheet_sync_state (
+                sheet_key TEXT PRIMARY KEY,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                header_hash TEXT,
+                last_synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sheet_row_hashes (
+                sheet_key TEXT NOT NULL,
+                row_number INTEGER NOT NULL,
+                row_hash TEXT NOT NULL,
+                PRIMARY KEY (sheet_key, row_number)
+            )
+        ''')
+        
+        # Create sync_sheets table (worksheets the background scheduler keeps in
+        # sync; shared by every worker process and kept across restarts)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sync_sheets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                sheet TEXT NOT NULL,
+                worksheet TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (sheet, worksheet)
+            )
+        ''')
+        
+        # Create data_versions table (write counters used for HTTP ETags). The
+        # epoch is random per database file, so versions from a deleted or
+        # replaced database are never mistaken for current ones.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS data_versions (
+                scope TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO data_versions (scope, version) VALUES ('epoch', abs(random()))")
+        
+        # Create volunteer_changes table (the volunteers version at which each
+        # existing volunteer was last updated; new volunteers are found by id)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS volunteer_changes (
+                volunteer_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_volunteer_changes_version ON volunteer_changes (version)')
+        cursor.executemany(
+            'INSERT OR IGNORE INTO data_versions (scope, version) VALUES (?, 0)',
+            [(scope,) for scope in DATA_SCOPES]
+        )
         
         conn.commit()
         conn.close()
         print("Database initialized successfully!")
     
+    def _bump_version(self, cursor, *scopes):
+        """Increment the data version of scopes (call inside the write's transaction)"""
+        cursor.executemany(
+            'UPDATE data_versions SET version = version + 1 WHERE scope = ?',
+            [(scope,) for scope in scopes]
+        )
+    
+    def _record_volunteer_change(self, cursor, volunteer_id):
+        """Log an update of an existing volunteer (call after bumping the volunteers version)"""
+        cursor.execute('''
+            INSERT OR REPLACE INTO volunteer_changes (volunteer_id, version)
+            SELECT ?, version FROM data_versions WHERE scope = 'volunteers'
+        ''', (volunteer_id,))
+    
+    def get_changed_volunteer_ids(self, since_version):
+        """Ids of existing volunteers updated after the given volunteers version"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT volunteer_id FROM volunteer_changes WHERE version > ?', (since_version,))
+        volunteer_ids = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return volunteer_ids
+    
+    def get_data_versions(self, scopes=None):
+        """
+        Current data versions
+        
+        Args:
+            scopes: Scopes to return (default: all)
+        
+        Returns:
+            dict: {scope: version}, always including 'epoch'
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT scope, version FROM data_versions')
+        versions = dict(cursor.fetchall())
+        conn.close()
+        
+        if scopes is None:
+            return versions
+        return {scope: versions[scope] for scope in ['epoch'] + list(scopes)}
+    
     def insert_volunteer(self, volunteer_data):
         """Insert a new volunteer into the database with expanded schema"""
         conn = self.get_connection()
@@ -71,57 +255,10 @@ class Database:
             fields = []
             values = []
             
-            # Core fields (always required)
-            field_mapping = {
-                'name': 'name',
-                'email': 'email',
-                'phone': 'phone',
-                'skills': 'skills',
-                'experience': 'experience',
-                'education': 'education',
-                'availability': 'availability',
-                'languages': 'languages',
-                'certifications': 'certifications',
-                'interests': 'interests',
-                # Expanded fields
-                'timestamp': 'timestamp',
-                'prefix': 'prefix',
-                'alternate_phone': 'alternate_phone',
-                'date_of_birth': 'date_of_birth',
-                'anniversary_date': 'anniversary_date',
-                'gender': 'gender',
-                'country': 'country',
-                'state': 'state',
-                'city': 'city',
-                'address': 'address',
-                'pin_code': 'pin_code',
-                'zip_code': 'zip_code',
-                'education_field': 'education_field',
-                'job_sector': 'job_sector',
-                'profession': 'profession',
-                'job_position': 'job_position',
-                'years_experience': 'years_experience',
-                'linkedin_url': 'linkedin_url',
-                'facebook_url': 'facebook_url',
-                'instagram_url': 'instagram_url',
-                'previous_experience': 'previous_experience',
-                'primary_skills': 'primary_skills',
-                'secondary_skills': 'secondary_skills',
-                'volunteering_mode': 'volunteering_mode',
-                'availability_days': 'availability_days',
-                'time_availability': 'time_availability',
-                'commitment_duration': 'commitment_duration',
-                'join_date': 'join_date',
-                'hear_about_source': 'hear_about_source',
-                'passed_examination': 'passed_examination',
-                'departments_served': 'departments_served',
-                'journey_description': 'journey_description',
-            }
-            
-            for key, db_field in field_mapping.items():
-                if key in volunteer_data:
-                    fields.append(db_field)
-                    values.append(volunteer_data[key])
+            for field in VOLUNTEER_FIELDS:
+                if field in volunteer_data:
+                    fields.append(field)
+                    values.append(volunteer_data[field])
             
             # Construct the SQL query
             placeholders = ', '.join(['?' for _ in fields])
@@ -129,6 +266,7 @@ class Database:
             
             sql = f"INSERT INTO volunteers ({fields_str}) VALUES ({placeholders})"
             cursor.execute(sql, values)
+            self._bump_version(cursor, 'volunteers')
             
             conn.commit()
             return cursor.lastrowid
@@ -138,12 +276,126 @@ class Database:
         finally:
             conn.close()
     
-    def get_all_volunteers(self):
-        """Retrieve all volunteers from the database"""
+    def insert_volunteers_bulk(self, columns, rows):
+        """
+        Insert many volunteers in a single transaction
+        
+        Rows whose email already exists are skipped.
+        
+        Args:
+            columns: Volunteer field names, in the order of each row's values
+            rows: Iterable of value tuples
+        
+        Returns:
+            int: Number of volunteers inserted
+        """
+        unknown = set(columns) - set(VOLUNTEER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown volunteer fields: {', '.join(sorted(unknown))}")
+        
+        conn = self.get_connection()
+        
+        try:
+            placeholders = ', '.join('?' for _ in columns)
+            before = conn.total_changes
+            with conn:
+                cursor = conn.executemany(
+                    f"INSERT OR IGNORE INTO volunteers ({', '.join(columns)}) VALUES ({placeholders})",
+                    rows
+                )
+                inserted = conn.total_changes - before
+                if inserted:
+                    self._bump_version(cursor, 'volunteers')
+            return inserted
+        finally:
+            conn.close()
+    
+    def upsert_volunteer(self, volunteer_data):
+        """
+        Insert a volunteer, or update the existing volunteer with the same email
+        
+        Returns:
+            tuple: ('inserted' or 'updated', volunteer id), or (None, None) on failure
+        """
+        volunteer_id = self.insert_volunteer(volunteer_data)
+        if volunteer_id:
+            return 'inserted', volunteer_id
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM volunteers')
+        try:
+            # Only the given fields are updated; fields the caller doesn't have are left as they are
+            changes = {k: v for k, v in volunteer_data.items() if k != 'email' and k in VOLUNTEER_FIELDS}
+            if changes:
+                assignments = ', '.join(f"{field} = ?" for field in changes)
+                cursor.execute(
+                    f"UPDATE volunteers SET {assignments} WHERE email = ?",
+                    list(changes.values()) + [volunteer_data['email']]
+                )
+            cursor.execute('SELECT id FROM volunteers WHERE email = ?', (volunteer_data['email'],))
+            row = cursor.fetchone()
+            if row is None:
+                return None, None
+            if changes:
+                self._bump_version(cursor, 'volunteers')
+                self._record_volunteer_change(cursor, row[0])
+            conn.commit()
+            return 'updated', row[0]
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not update volunteer {volunteer_data.get('email')}: {e}")
+            return None, None
+        finally:
+            conn.close()
+    
+    def update_volunteer(self, volunteer_id, volunteer_data):
+        """Update the given fields of an existing volunteer"""
+        if not volunteer_data:
+            return False
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            assignments = ', '.join(f"{field} = ?" for field in volunteer_data)
+            values = list(volunteer_data.values()) + [volunteer_id]
+            cursor.execute(f"UPDATE volunteers SET {assignments} WHERE id = ?", values)
+            updated = cursor.rowcount > 0
+            if updated:
+                self._bump_version(cursor, 'volunteers')
+                self._record_volunteer_change(cursor, volunteer_id)
+            conn.commit()
+            return updated
+        except sqlite3.IntegrityError:
+            return False
+        finally:
+            conn.close()
+    
+    def count_volunteers(self):
+        """Number of volunteers in the database"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM volunteers')
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+    
+    def get_all_volunteers(self, columns=None):
+        """
+        Retrieve all volunteers from the database
+        
+        Args:
+            columns: Columns to return (names from VOLUNTEER_COLUMNS; default: all)
+        """
+        if columns:
+            unknown = set(columns) - set(VOLUNTEER_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown volunteer columns: {', '.join(sorted(unknown))}")
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(f"SELECT {', '.join(columns) if columns else '*'} FROM volunteers")
         columns = [description[0] for description in cursor.description]
         volunteers = []
         
@@ -153,22 +405,123 @@ class Database:
         conn.close()
         return volunteers
     
-    def insert_shortlisted_volunteer(self, volunteer_id, job_description, match_score, matching_skills):
+    def get_volunteers_by_ids(self, volunteer_ids):
+        """Retrieve the volunteers with the given ids"""
+        volunteer_ids = list(volunteer_ids)
+        if not volunteer_ids:
+            return []
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        volunteers = []
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(volunteer_ids), 500):
+            batch = volunteer_ids[start:start + 500]
+            placeholders = ', '.join('?' for _ in batch)
+            cursor.execute(f'SELECT * FROM volunteers WHERE id IN ({placeholders})', batch)
+            columns = [description[0] for description in cursor.description]
+            volunteers.extend(dict(zip(columns, row)) for row in cursor.fetchall())
+        
+        conn.close()
+        return volunteers
+    
+    def insert_shortlisted_volunteer(self, volunteer_id, job_description, match_score, matching_skills, run_id=None):
         """Insert a shortlisted volunteer"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
             INSERT INTO shortlisted_volunteers 
-            (volunteer_id, job_description, match_score, matching_skills)
-            VALUES (?, ?, ?, ?)
-        ''', (volunteer_id, job_description, match_score, matching_skills))
+            (volunteer_id, job_description, match_score, matching_skills, run_id)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (volunteer_id, job_description, match_score, matching_skills, run_id))
+        self._bump_version(cursor, 'shortlisted')
+        
+        conn.commit()
+        conn.close()
+    
+    def save_shortlist_run(self, job_description, shortlisted):
+        """
+        Store a shortlist run and its results in one transaction
+        
+        Args:
+            job_description: Job description the run matched against
+            shortlisted: Results from ResumeMatcher.shortlist_volunteers
+            
+        Returns:
+            int: The new run id
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            'INSERT INTO shortlist_runs (job_description, result_count) VALUES (?, ?)',
+            (job_description, len(shortlisted))
+        )
+        run_id = cursor.lastrowid
+        cursor.executemany('''
+            INSERT INTO shortlisted_volunteers 
+            (volunteer_id, job_description, match_score, matching_skills, run_id)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (item['volunteer']['id'], job_description, item['match_score'],
+             json.dumps(item['matching_skills']), run_id)
+            for item in shortlisted
+        ])
+        self._bump_version(cursor, 'shortlisted')
         
         conn.commit()
         conn.close()
+        return run_id
+    
+    def get_latest_shortlist_run_id(self):
+        """Id of the most recent shortlist run, or None if there are none"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT MAX(id) FROM shortlist_runs')
+        run_id = cursor.fetchone()[0]
+        conn.close()
+        return run_id
+    
+    def get_shortlist_runs(self, limit=50):
+        """Most recent shortlist runs, newest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM shortlist_runs ORDER BY id DESC LIMIT ?', (limit,))
+        columns = [description[0] for description in cursor.description]
+        runs = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        
+        conn.close()
+        return runs
+    
+    def count_shortlisted_volunteers(self, run_id=None):
+        """Number of volunteers get_shortlisted_volunteers(run_id) would return"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT COUNT(*)
+            FROM shortlisted_volunteers s
+            JOIN volunteers v ON s.volunteer_id = v.id
+            WHERE s.run_id IS COALESCE(?, (SELECT MAX(id) FROM shortlist_runs))
+        ''', (run_id,))
+        count = cursor.fetchone()[0]
+        
+        conn.close()
+        return count
     
-    def get_shortlisted_volunteers(self):
-        """Retrieve all shortlisted volunteers with their details"""
+    def get_shortlisted_volunteers(self, run_id=None):
+        """
+        Retrieve shortlisted volunteers with their details
+        
+        Args:
+            run_id: Shortlist run to return (default: the most recent run)
+        """
+        if run_id is None:
+            run_id = self.get_latest_shortlist_run_id()
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -184,11 +537,13 @@ class Database:
                 s.job_description,
                 s.match_score,
                 s.matching_skills,
-                s.shortlisted_at
+                s.shortlisted_at,
+                s.run_id
             FROM shortlisted_volunteers s
             JOIN volunteers v ON s.volunteer_id = v.id
+            WHERE s.run_id IS ?
             ORDER BY s.match_score DESC, s.shortlisted_at DESC
-        ''')
+        ''', (run_id,))
         
         columns = [description[0] for description in cursor.description]
         shortlisted = []
@@ -199,11 +554,424 @@ class Database:
         conn.close()
         return shortlisted
     
+    def iter_rows(self, query, params=(), batch_size=1000):
+        """
+        Stream the rows of a query without loading them all
+        
+        Yields the column names first, then one tuple per row. The connection
+        stays open until the generator is exhausted or closed.
+        """
+        conn = self.get_connection()
+        try:
+            cursor = conn.execute(query, params)
+            yield [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+    
     def clear_shortlisted_volunteers(self):
         """Clear all shortlisted volunteers"""
         conn = self.get_connection()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM shortlisted_volunteers')
+        cursor.execute('DELETE FROM shortlist_runs')
+        self._bump_version(cursor, 'shortlisted')
+        conn.commit()
+        conn.close()
+    
+    def get_resume_document(self, content_hash):
+        """Retrieve a stored resume document by the SHA-256 of its file content"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM resume_documents WHERE content_hash = ?', (content_hash,))
+        row = cursor.fetchone()
+        columns = [description[0] for description in cursor.description]
+        
+        conn.close()
+        return dict(zip(columns, row)) if row else None
+    
+    def save_resume_document(self, content_hash, filename, extracted_text, parsed_data, parser_version):
+        """Store the extracted text and parse result of an uploaded resume"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO resume_documents
+            (content_hash, filename, extracted_text, parsed_data, parser_version)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (content_hash, filename, extracted_text, json.dumps(parsed_data), parser_version))
+        self._bump_version(cursor, 'resumes')
+        
+        conn.commit()
+        conn.close()
+    
+    def link_resume_document(self, content_hash, volunteer_id):
+        """Record which volunteer was created from a stored resume document"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'UPDATE resume_documents SET volunteer_id = ? WHERE content_hash = ?',
+            (volunteer_id, content_hash)
+        )
+        self._bump_version(cursor, 'resumes')
+        conn.commit()
+        conn.close()
+    
+    def update_resume_parse(self, content_hash, parsed_data, parser_version):
+        """Replace the stored parse result of a resume document"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'UPDATE resume_documents SET parsed_data = ?, parser_version = ? WHERE content_hash = ?',
+            (json.dumps(parsed_data), parser_version, content_hash)
+        )
+        self._bump_version(cursor, 'resumes')
+        conn.commit()
+        conn.close()
+    
+    def get_max_volunteer_id(self):
+        """Highest volunteer id (0 when there are none); ids above it are newer volunteers"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM volunteers')
+        max_id = cursor.fetchone()[0]
+        conn.close()
+        return max_id
+    
+    def get_volunteer_ids_after(self, last_id):
+        """Ids of volunteers inserted after last_id, in insertion order"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT id FROM volunteers WHERE id > ? ORDER BY id', (last_id,))
+        volunteer_ids = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return volunteer_ids
+    
+    def insert_job_posting(self, posting):
+        """
+        Insert a job posting
+        
+        Args:
+            posting: Dict with title, description and any of required_skills
+                and the JOB_POSTING_COLUMNS
+        
+        Returns:
+            int: The new posting id
+        """
+        columns = [column for column in ['title', 'description', 'required_skills', *JOB_POSTING_COLUMNS]
+                   if column in posting]
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            f"INSERT INTO job_postings ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            [posting[column] for column in columns]
+        )
+        posting_id = cursor.lastrowid
+        self._bump_version(cursor, 'postings')
+        
+        conn.commit()
+        conn.close()
+        return posting_id
+    
+    def get_job_postings(self, status=None, include_vectors=False, posting_id=None):
+        """
+        Retrieve job postings, newest first, with their current match counts
+        
+        Args:
+            status: Only postings with this status ('open' or 'closed')
+            include_vectors: Include the vector_indices/vector_values blobs
+            posting_id: Only this posting
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        columns = ['id', 'title', 'description', 'required_skills', 'created_at'] + [
+            column for column in JOB_POSTING_COLUMNS if include_vectors or not column.startswith('vector_')
+        ]
+        query = f'''
+            SELECT {', '.join('p.' + column for column in columns)},
+                   (SELECT COUNT(*) FROM posting_matches m WHERE m.posting_id = p.id) AS match_count
+            FROM job_postings p
+        '''
+        conditions, params = [], []
+        if status:
+            conditions.append('p.status = ?')
+            params.append(status)
+        if posting_id is not None:
+            conditions.append('p.id = ?')
+            params.append(posting_id)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        cursor.execute(query + ' ORDER BY p.id DESC', params)
+        columns = [description[0] for description in cursor.description]
+        postings = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        
+        conn.close()
+        return postings
+    
+    def get_job_posting(self, posting_id, include_vectors=False):
+        """A single job posting, or None"""
+        postings = self.get_job_postings(include_vectors=include_vectors, posting_id=posting_id)
+        return postings[0] if postings else None
+    
+    def set_job_posting_status(self, posting_id, status):
+        """Open or close a posting; returns False if it does not exist"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('UPDATE job_postings SET status = ? WHERE id = ?', (status, posting_id))
+        updated = cursor.rowcount > 0
+        if updated:
+            self._bump_version(cursor, 'postings')
+        
+        conn.commit()
+        conn.close()
+        return updated
+    
+    def replace_posting_matches(self, posting_id, matches):
+        """
+        Replace the stored matches of a posting
+        
+        Args:
+            matches: Iterable of (volunteer_id, score, matching_skills list)
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('DELETE FROM posting_matches WHERE posting_id = ?', (posting_id,))
+        cursor.executemany(
+            'INSERT INTO posting_matches (posting_id, volunteer_id, score, matching_skills) VALUES (?, ?, ?, ?)',
+            [(posting_id, volunteer_id, score, json.dumps(skills)) for volunteer_id, score, skills in matches]
+        )
+        self._bump_version(cursor, 'postings')
+        
+        conn.commit()
+        conn.close()
+    
+    def merge_posting_matches(self, updates, removals=None):
+        """
+        Merge newly scored volunteers into the stored top-k of several postings
+        in one transaction, then trim each posting back to its top_k
+        
+        Args:
+            updates: {posting_id: [(volunteer_id, score, matching_skills list)]}
+            removals: {posting_id: [volunteer_id]} stored matches to delete
+        
+        Returns:
+            dict: {posting_id: (match count, lowest stored score)} after the merge
+        """
+        removals = removals or {}
+        if not updates and not removals:
+            return {}
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany('''
+            INSERT INTO posting_matches (posting_id, volunteer_id, score, matching_skills)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (posting_id, volunteer_id) DO UPDATE SET
+                score = excluded.score,
+                matching_skills = excluded.matching_skills,
+                matched_at = CURRENT_TIMESTAMP
+        ''', [
+            (posting_id, volunteer_id, score, json.dumps(skills))
+            for posting_id, matches in updates.items()
+            for volunteer_id, score, skills in matches
+        ])
+        cursor.executemany('DELETE FROM posting_matches WHERE posting_id = ? AND volunteer_id = ?', [
+            (posting_id, volunteer_id)
+            for posting_id, volunteer_ids in removals.items()
+            for volunteer_id in volunteer_ids
+        ])
+        
+        floors = {}
+        for posting_id in set(updates) | set(removals):
+            cursor.execute('''
+                DELETE FROM posting_matches
+                WHERE posting_id = ? AND volunteer_id NOT IN (
+                    SELECT volunteer_id FROM posting_matches
+                    WHERE posting_id = ?
+                    ORDER BY score DESC
+                    LIMIT (SELECT top_k FROM job_postings WHERE id = ?)
+                )
+            ''', (posting_id, posting_id, posting_id))
+            cursor.execute('SELECT COUNT(*), MIN(score) FROM posting_matches WHERE posting_id = ?', (posting_id,))
+            floors[posting_id] = cursor.fetchone()
+        self._bump_version(cursor, 'postings')
+        
+        conn.commit()
+        conn.close()
+        return floors
+    
+    def get_posting_match_floors(self):
+        """{posting_id: (match count, lowest stored score)} for every posting with matches"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT posting_id, COUNT(*), MIN(score) FROM posting_matches GROUP BY posting_id')
+        floors = {posting_id: (count, lowest) for posting_id, count, lowest in cursor.fetchall()}
+        conn.close()
+        return floors
+    
+    def get_posting_matches(self, posting_id):
+        """Stored top-k volunteers of a posting, best first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT v.*, m.score AS match_score, m.matching_skills, m.matched_at
+            FROM posting_matches m
+            JOIN volunteers v ON m.volunteer_id = v.id
+            WHERE m.posting_id = ?
+            ORDER BY m.score DESC
+        ''', (posting_id,))
+        columns = [description[0] for description in cursor.description]
+        matches = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        
+        conn.close()
+        return matches
+    
+    def get_volunteer_posting_ids(self, volunteer_id):
+        """Ids of the postings whose stored top-k includes this volunteer"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT posting_id FROM posting_matches WHERE volunteer_id = ?', (volunteer_id,))
+        posting_ids = {row[0] for row in cursor.fetchall()}
+        conn.close()
+        return posting_ids
+    
+    def get_posting_match_pairs(self, volunteer_ids):
+        """(posting_id, volunteer_id) of every stored match of the given volunteers"""
+        volunteer_ids = list(volunteer_ids)
+        if not volunteer_ids:
+            return set()
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        pairs = set()
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(volunteer_ids), 500):
+            batch = volunteer_ids[start:start + 500]
+            placeholders = ', '.join('?' for _ in batch)
+            cursor.execute(f'SELECT posting_id, volunteer_id FROM posting_matches WHERE volunteer_id IN ({placeholders})', batch)
+            pairs.update(cursor.fetchall())
+        
+        conn.close()
+        return pairs
+    
+    def get_all_resume_documents(self):
+        """Retrieve all stored resume documents"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM resume_documents ORDER BY created_at')
+        columns = [description[0] for description in cursor.description]
+        documents = []
+        
+        for row in cursor.fetchall():
+            documents.append(dict(zip(columns, row)))
+        
+        conn.close()
+        return documents
+    
+    def add_sync_sheet(self, sheet, worksheet):
+        """Register a worksheet for background sync (idempotent); returns its job id"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('INSERT OR IGNORE INTO sync_sheets (sheet, worksheet) VALUES (?, ?)', (sheet, worksheet))
+        cursor.execute('SELECT id FROM sync_sheets WHERE sheet = ? AND worksheet = ?', (sheet, worksheet))
+        job_id = cursor.fetchone()[0]
+        
+        conn.commit()
+        conn.close()
+        return job_id
+    
+    def remove_sync_sheet(self, job_id):
+        """Stop syncing a registered worksheet; returns False if it was not registered"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('DELETE FROM sync_sheets WHERE id = ?', (job_id,))
+        removed = cursor.rowcount > 0
+        
+        conn.commit()
+        conn.close()
+        return removed
+    
+    def get_sync_sheets(self):
+        """All worksheets registered for background sync, oldest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT id, sheet, worksheet FROM sync_sheets ORDER BY id')
+        sheets = [{'id': row[0], 'sheet': row[1], 'worksheet': row[2]} for row in cursor.fetchall()]
+        
+        conn.close()
+        return sheets
+    
+    def get_sheet_sync_state(self, sheet_key):
+        """
+        Retrieve the stored sync state of a worksheet
+        
+        Returns:
+            dict: row_count, header_hash and row_hashes ({row number: hash})
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            'SELECT row_count, header_hash FROM sheet_sync_state WHERE sheet_key = ?',
+            (sheet_key,)
+        )
+        row = cursor.fetchone()
+        cursor.execute(
+            'SELECT row_number, row_hash FROM sheet_row_hashes WHERE sheet_key = ?',
+            (sheet_key,)
+        )
+        row_hashes = dict(cursor.fetchall())
+        
+        conn.close()
+        return {
+            'row_count': row[0] if row else 0,
+            'header_hash': row[1] if row else None,
+            'row_hashes': row_hashes
+        }
+    
+    def save_sheet_sync_state(self, sheet_key, row_count, header_hash, row_hashes):
+        """
+        Store the sync state of a worksheet
+        
+        Args:
+            sheet_key: Spreadsheet id and worksheet name
+            row_count: Number of data rows seen
+            header_hash: Fingerprint of the header row
+            row_hashes: {row number: hash} for rows that changed
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        # Forget rows that no longer exist
+        cursor.execute(
+            'DELETE FROM sheet_row_hashes WHERE sheet_key = ? AND row_number > ?',
+            (sheet_key, row_count)
+        )
+        cursor.executemany(
+            'INSERT OR REPLACE INTO sheet_row_hashes (sheet_key, row_number, row_hash) VALUES (?, ?, ?)',
+            [(sheet_key, number, row_hash) for number, row_hash in row_hashes.items()]
+        )
+        cursor.execute('''
+            INSERT OR REPLACE INTO sheet_sync_state (sheet_key, row_count, header_hash, last_synced_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (sheet_key, row_count, header_hash))
+        
         conn.commit()
         conn.close()
     
@@ -212,8 +980,17 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM shortlisted_volunteers')
+        cursor.execute('DELETE FROM shortlist_runs')
+        cursor.execute('DELETE FROM resume_documents')
+        cursor.execute('DELETE FROM sheet_row_hashes')
+        cursor.execute('DELETE FROM sheet_sync_state')
         cursor.execute('DELETE FROM volunteers')
+        cursor.execute('DELETE FROM volunteer_changes')
+        cursor.execute('DELETE FROM posting_matches')
         cursor.execute('DELETE FROM job_postings')
+        self._bump_version(cursor, *DATA_SCOPES)
+        # A new epoch: resident copies reload instead of catching up
+        cursor.execute("UPDATE data_versions SET version = abs(random()) WHERE scope = 'epoch'")
         conn.commit()
         conn.close()
 
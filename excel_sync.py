@@ -1,6 +1,24 @@
 import pandas as pd
+from openpyxl import load_workbook
 from database import Database
 
+# Excel column for each volunteer field
+EXCEL_COLUMNS = {
+    'name': 'Name',
+    'email': 'Email',
+    'phone': 'Phone',
+    'skills': 'Skills',
+    'experience': 'Experience',
+    'education': 'Education',
+    'availability': 'Availability',
+    'languages': 'Languages',
+    'certifications': 'Certifications',
+    'interests': 'Interests'
+}
+
+# Cell values treated as empty
+MISSING_VALUES = ['', 'nan', 'none', 'null', 'n/a', '<na>']
+
 def sync_excel_to_database(excel_file_path):
     """
     Sync volunteer data from Excel file to SQL database
@@ -70,8 +88,110 @@ def sync_excel_to_database(excel_file_path):
     except Exception as e:
         print(f"Error syncing data: {e}")
 
+def iter_row_chunks(excel_file_path, chunk_size):
+    """
+    Stream an Excel sheet as DataFrames of at most chunk_size rows
+    
+    Uses openpyxl's read-only worksheet reader, so only one chunk of rows is
+    held in memory at a time.
+    """
+    workbook = load_workbook(excel_file_path, read_only=True, data_only=True)
+    
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(column).strip() if column is not None else '' for column in next(rows, ())]
+        
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+    finally:
+        workbook.close()
+
+def normalize_chunk(df):
+    """
+    Vectorized column normalization for one chunk
+    
+    Maps Excel columns onto volunteer fields, converts every value to a
+    stripped string, and blanks out missing values (including the literal
+    'nan'/'None' strings older exports contain).
+    """
+    normalized = pd.DataFrame(index=df.index)
+    
+    for field, column in EXCEL_COLUMNS.items():
+        if column in df.columns:
+            values = df[column].astype('string').str.strip()
+            values = values.mask(values.str.lower().isin(MISSING_VALUES))
+            normalized[field] = values.fillna('')
+        else:
+            normalized[field] = ''
+    
+    return normalized
+
+def import_excel_chunked(excel_file_path, chunk_size=5000, db=None, progress=None):
+    """
+    Import volunteers from a (very large) Excel file in bounded-size chunks
+    
+    Each chunk is normalized and validated with vectorized pandas operations
+    and bulk-inserted in one transaction; rows whose email already exists are
+    skipped.
+    
+    Args:
+        excel_file_path: Path to the .xlsx file
+        chunk_size: Rows per chunk
+        db: Database to import into (default: volunteer_management.db)
+        progress: Optional callback(rows_read, inserted, skipped) after each chunk
+    
+    Returns:
+        dict: rows, inserted, invalid and duplicate counts
+    """
+    db = db or Database()
+    counts = {'rows': 0, 'inserted': 0, 'invalid': 0, 'duplicates': 0}
+    columns = list(EXCEL_COLUMNS)
+    
+    for chunk in iter_row_chunks(excel_file_path, chunk_size):
+        normalized = normalize_chunk(chunk)
+        
+        # Validate required fields
+        valid = (normalized['name'] != '') & (normalized['email'] != '')
+        valid_rows = normalized.loc[valid, columns]
+        
+        inserted = db.insert_volunteers_bulk(columns, valid_rows.itertuples(index=False, name=None))
+        
+        counts['rows'] += len(normalized)
+        counts['inserted'] += inserted
+        counts['invalid'] += int((~valid).sum())
+        counts['duplicates'] += len(valid_rows) - inserted
+        
+        if progress:
+            progress(counts['rows'], counts['inserted'], counts['invalid'] + counts['duplicates'])
+    
+    return counts
+
+def _print_progress(rows_read, inserted, skipped):
+    print(f"  ... {rows_read} rows read, {inserted} inserted, {skipped} skipped")
+
 if __name__ == "__main__":
-    # Example usage
-    excel_file = "volunteers_data.xlsx"
-    sync_excel_to_database(excel_file)
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description='Sync volunteers from an Excel file')
+    arg_parser.add_argument('excel_file', nargs='?', default='volunteers_data.xlsx')
+    arg_parser.add_argument('--chunked', action='store_true',
+                            help='Stream the file in chunks (for very large exports)')
+    arg_parser.add_argument('--chunk-size', type=int, default=5000)
+    args = arg_parser.parse_args()
+    
+    if args.chunked:
+        print(f"Importing {args.excel_file} in chunks of {args.chunk_size} rows")
+        counts = import_excel_chunked(args.excel_file, args.chunk_size, progress=_print_progress)
+        print(f"\n[SUCCESS] Import completed!")
+        print(f"  - Rows read: {counts['rows']}")
+        print(f"  - Inserted: {counts['inserted']} volunteers")
+        print(f"  - Skipped: {counts['invalid']} invalid, {counts['duplicates']} already existing")
+    else:
+        sync_excel_to_database(args.excel_file)
 
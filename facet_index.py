@@ -0,0 +1,380 @@
+"""
+Facet Indexes for Hard Shortlist Filters
+Normalized availability, volunteering mode, language and location values of
+every volunteer, each stored as a bitset (a Python int with one bit per
+volunteer slot). A filter such as "weekends AND remote AND speaks Hindi" is
+a few bitwise ORs and ANDs, so scoring only has to touch the volunteers left.
+
+Within a facet the requested values are alternatives (OR); different facets
+must all match (AND). Volunteers who left a facet empty can be let through
+for that facet (include_unknown) instead of being excluded.
+"""
+
+import re
+import threading
+import numpy as np
+
+# Volunteer fields read for each facet
+FACET_FIELDS = {
+    'availability': ('availability', 'availability_days', 'time_availability'),
+    'mode': ('volunteering_mode', 'availability'),
+    'language': ('languages',),
+    'location': ('city', 'state', 'country'),
+}
+FACETS = list(FACET_FIELDS)
+INDEXED_FIELDS = sorted({field for fields in FACET_FIELDS.values() for field in fields})
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+WEEKEND_DAYS = ['saturday', 'sunday']
+
+# Word -> normalized availability values
+AVAILABILITY_TERMS = {
+    'weekend': {'weekends'}, 'weekends': {'weekends'},
+    'weekday': {'weekdays'}, 'weekdays': {'weekdays'},
+    'morning': {'mornings'}, 'mornings': {'mornings'},
+    'afternoon': {'afternoons'}, 'afternoons': {'afternoons'},
+    'evening': {'evenings'}, 'evenings': {'evenings'}, 'night': {'evenings'}, 'nights': {'evenings'},
+    'part-time': {'part-time'}, 'parttime': {'part-time'},
+    'full-time': {'full-time'}, 'fulltime': {'full-time'},
+    'flexible': {'flexible'}, 'anytime': {'flexible'},
+}
+for day in WEEKDAYS:
+    for word in (day, day + 's', day[:3]):
+        AVAILABILITY_TERMS[word] = {day, 'weekdays'}
+for day in WEEKEND_DAYS:
+    for word in (day, day + 's', day[:3]):
+        AVAILABILITY_TERMS[word] = {day, 'weekends'}
+
+# Word -> normalized volunteering mode
+MODE_TERMS = {
+    'remote': 'remote', 'remotely': 'remote', 'online': 'remote', 'virtual': 'remote',
+    'virtually': 'remote', 'wfh': 'remote', 'work-from-home': 'remote',
+    'onsite': 'onsite', 'on-site': 'onsite', 'in-person': 'onsite', 'offline': 'onsite',
+    'physical': 'onsite', 'field': 'onsite',
+    'hybrid': 'hybrid',
+}
+# A hybrid volunteer can take remote and on-site roles
+MODE_IMPLIES = {'hybrid': {'remote', 'onsite'}}
+
+# Multi-word phrases rewritten to single tokens before matching
+PHRASES = [
+    (re.compile(r'\bpart\s+time\b'), 'part-time'),
+    (re.compile(r'\bfull\s+time\b'), 'full-time'),
+    (re.compile(r'\bon\s+site\b'), 'on-site'),
+    (re.compile(r'\bin\s+person\b'), 'in-person'),
+    (re.compile(r'\bwork\s+from\s+home\b'), 'work-from-home'),
+]
+
+LANGUAGE_NOISE = {'and', 'or', 'fluent', 'native', 'basic', 'intermediate', 'advanced', 'beginner',
+                  'conversational', 'proficient', 'proficiency', 'speak', 'speaking', 'read', 'write',
+                  'written', 'spoken', 'language', 'languages', 'mother', 'tongue', 'little', 'some'}
+
+LOCATION_ALIASES = {
+    'usa': 'united states', 'us': 'united states', 'u.s.': 'united states', 'u.s.a.': 'united states',
+    'united states of america': 'united states', 'america': 'united states',
+    'uk': 'united kingdom', 'u.k.': 'united kingdom', 'great britain': 'united kingdom',
+    'bombay': 'mumbai', 'bengaluru': 'bangalore', 'madras': 'chennai', 'calcutta': 'kolkata',
+    'new delhi': 'delhi',
+}
+
+# Keyword-derived values that are too soft to exclude anyone
+AUTO_IGNORED = {
+    'availability': {'part-time', 'full-time', 'flexible'},
+    'mode': {'hybrid'},
+}
+
+def _words(text):
+    text = str(text).lower()
+    for pattern, replacement in PHRASES:
+        text = pattern.sub(replacement, text)
+    return re.findall(r'[a-z][a-z-]*', text)
+
+def normalize_availability(text):
+    values = set()
+    for word in _words(text):
+        values |= AVAILABILITY_TERMS.get(word, set())
+    return values
+
+def normalize_mode(text):
+    values = set()
+    for word in _words(text):
+        mode = MODE_TERMS.get(word)
+        if mode:
+            values.add(mode)
+            values |= MODE_IMPLIES.get(mode, set())
+    return values
+
+def normalize_language(text):
+    text = re.sub(r'\([^)]*\)', ' ', str(text).lower())  # "English (fluent)"
+    return {word for word in re.findall(r'[a-z]+', text) if word not in LANGUAGE_NOISE and len(word) > 1}
+
+def normalize_location(text):
+    values = set()
+    for part in re.split(r'[,;/|]', str(text).lower()):
+        place = ' '.join(part.split()).strip(' .')
+        if place and place != 'nan':
+            values.add(LOCATION_ALIASES.get(place, place))
+    return values
+
+NORMALIZERS = {
+    'availability': normalize_availability,
+    'mode': normalize_mode,
+    'language': normalize_language,
+    'location': normalize_location,
+}
+
+def volunteer_facets(volunteer):
+    """Normalized values of every facet for one volunteer"""
+    facets = {}
+    for facet, fields in FACET_FIELDS.items():
+        values = set()
+        for field in fields:
+            value = volunteer.get(field)
+            if value and value != 'nan':
+                values |= NORMALIZERS[facet](value)
+        facets[facet] = values
+    return facets
+
+def passes_filters(facets, filters, include_unknown=()):
+    """
+    Check one volunteer against filters without an index (same rules as FacetIndex.select)
+
+    Args:
+        facets: volunteer_facets() of the volunteer
+        filters: facet -> set of normalized values
+        include_unknown: Facets for which a volunteer with no value passes
+    """
+    for facet, values in filters.items():
+        if facets[facet] & set(values):
+            continue
+        if not facets[facet] and facet in include_unknown:
+            continue
+        return False
+    return True
+
+def normalize_filters(filters):
+    """
+    Normalize request filters such as {"availability": ["Weekends"], "mode": "remote"}
+
+    Returns:
+        dict: facet -> set of normalized values (facets without usable values are dropped)
+
+    Raises:
+        ValueError: Unknown facet or malformed values
+    """
+    if not filters:
+        return {}
+    if not isinstance(filters, dict):
+        raise ValueError("filters must be an object of facet -> value(s)")
+
+    normalized = {}
+    for facet, values in filters.items():
+        if facet not in NORMALIZERS:
+            raise ValueError(f"Unknown filter '{facet}' (choose from {', '.join(FACETS)})")
+        if isinstance(values, str):
+            values = [values]
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise ValueError(f"Filter '{facet}' must be a string or a list of strings")
+
+        facet_values = set()
+        for value in values:
+            if facet == 'mode':
+                # Asking for "hybrid" should not widen to remote or on-site volunteers
+                facet_values |= {MODE_TERMS[word] for word in _words(value) if word in MODE_TERMS}
+            else:
+                facet_values |= NORMALIZERS[facet](value)
+        if facet_values:
+            normalized[facet] = facet_values
+    return normalized
+
+def _bits_from_slots(slots, size):
+    """Bitset with the given slot numbers set"""
+    flags = np.zeros(size, dtype=bool)
+    flags[slots] = True
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+class FacetIndex:
+    def __init__(self):
+        self.slots = {}   # volunteer id -> slot (bit position)
+        self.ids = []     # slot -> volunteer id (None once removed)
+        self.raw = {}     # volunteer id -> raw indexed fields, to skip unchanged volunteers
+        self.values = {}  # volunteer id -> {facet: set of values}
+        self.bits = {facet: {} for facet in FACETS}  # facet -> value -> bitset
+        self.known = {facet: 0 for facet in FACETS}  # volunteers with any value for the facet
+        self.all = 0
+        self.synced_version = None  # data version of the volunteer list last passed to sync()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks don't pickle; tenants.py spills evicted indexes
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.synced_version = None
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _apply(self, changes, clear):
+        size = len(self.ids)
+        for (facet, value), slots in changes.items():
+            mask = _bits_from_slots(slots, size)
+            if value is None:
+                self.known[facet] = self.known[facet] & ~mask if clear else self.known[facet] | mask
+                continue
+            bits = self.bits[facet].get(value, 0)
+            bits = bits & ~mask if clear else bits | mask
+            if bits:
+                self.bits[facet][value] = bits
+            else:
+                self.bits[facet].pop(value, None)
+
+    def ingest(self, volunteers):
+        """
+        Index volunteers that were added or changed (unchanged ones are skipped)
+
+        Returns:
+            int: Number of volunteers (re)indexed
+        """
+        with self._lock:
+            cleared, added, new_slots = {}, {}, []
+            changed = 0
+            for volunteer in volunteers:
+                volunteer_id = volunteer.get('id')
+                if volunteer_id is None:
+                    continue
+                raw = tuple(volunteer.get(field) for field in INDEXED_FIELDS)
+                if self.raw.get(volunteer_id) == raw:
+                    continue
+
+                slot = self.slots.get(volunteer_id)
+                if slot is None:
+                    slot = len(self.ids)
+                    self.slots[volunteer_id] = slot
+                    self.ids.append(volunteer_id)
+                    new_slots.append(slot)
+                else:
+                    for facet, values in self.values[volunteer_id].items():
+                        for value in values | ({None} if values else set()):
+                            cleared.setdefault((facet, value), []).append(slot)
+
+                facets = volunteer_facets(volunteer)
+                for facet, values in facets.items():
+                    for value in values | ({None} if values else set()):
+                        added.setdefault((facet, value), []).append(slot)
+                self.raw[volunteer_id] = raw
+                self.values[volunteer_id] = facets
+                changed += 1
+
+            self._apply(cleared, clear=True)
+            self._apply(added, clear=False)
+            if new_slots:
+                self.all |= _bits_from_slots(new_slots, len(self.ids))
+            return changed
+
+    def remove(self, volunteer_ids):
+        """Drop volunteers from every facet"""
+        with self._lock:
+            cleared, slots = {}, []
+            for volunteer_id in volunteer_ids:
+                slot = self.slots.pop(volunteer_id, None)
+                if slot is None:
+                    continue
+                for facet, values in self.values.pop(volunteer_id).items():
+                    for value in values | ({None} if values else set()):
+                        cleared.setdefault((facet, value), []).append(slot)
+                self.raw.pop(volunteer_id, None)
+                self.ids[slot] = None
+                slots.append(slot)
+            self._apply(cleared, clear=True)
+            if slots:
+                self.all &= ~_bits_from_slots(slots, len(self.ids))
+
+    def sync(self, volunteers, version=None):
+        """
+        Make the index match exactly this list of volunteers
+
+        Args:
+            version: Data version the list is at least as new as; when it equals
+                the version of the last sync, the O(N) comparison is skipped
+        """
+        if version is not None and version == self.synced_version:
+            return
+        self.ingest(volunteers)
+        current = {volunteer.get('id') for volunteer in volunteers}
+        stale = [volunteer_id for volunteer_id in self.slots if volunteer_id not in current]
+        if stale:
+            self.remove(stale)
+        self.synced_version = version
+
+    def select(self, filters, include_unknown=()):
+        """
+        Bitset of the volunteers that pass every filter
+
+        Args:
+            filters: facet -> set of normalized values (see normalize_filters)
+            include_unknown: Facets for which volunteers with no value also pass
+        """
+        with self._lock:
+            selected = self.all
+            for facet, values in filters.items():
+                facet_bits = 0
+                for value in values:
+                    facet_bits |= self.bits[facet].get(value, 0)
+                if facet in include_unknown:
+                    facet_bits |= self.all & ~self.known[facet]
+                selected &= facet_bits
+            return selected
+
+    def volunteer_ids(self, bitset):
+        """Volunteer ids of the set bits, in slot order"""
+        if not bitset:
+            return []
+        with self._lock:
+            size = (len(self.ids) + 7) // 8
+            flags = np.unpackbits(np.frombuffer(bitset.to_bytes(size, 'little'), dtype=np.uint8), bitorder='little')
+            return [self.ids[slot] for slot in np.flatnonzero(flags)]
+
+    def filters_from_keywords(self, keywords_data):
+        """
+        Hard filters implied by the location and availability keywords of a job description
+
+        Only values the index can act on are kept: free-text locations that no
+        volunteer has are ignored, and a remote role gets no location filter.
+        """
+        terms = list(keywords_data.get('location_keywords') or []) + list(keywords_data.get('availability_keywords') or [])
+        terms = [term for term in terms if isinstance(term, str)]
+        filters = normalize_filters({
+            'availability': terms,
+            'mode': terms,
+        })
+        # Commitment level and "flexible" describe the role rather than who can fill it
+        for facet, ignored in AUTO_IGNORED.items():
+            values = filters.get(facet, set()) - ignored
+            if values:
+                filters[facet] = values
+            else:
+                filters.pop(facet, None)
+
+        if 'remote' not in filters.get('mode', ()):
+            with self._lock:
+                known_places = self.bits['location']
+                places = set()
+                for term in keywords_data.get('location_keywords') or []:
+                    if isinstance(term, str):
+                        places |= {place for place in normalize_location(term) if place in known_places}
+            if places:
+                filters['location'] = places
+        return filters
+
+    def stats(self):
+        with self._lock:
+            return {
+                'volunteers': len(self.slots),
+                'values': {facet: len(values) for facet, values in self.bits.items()},
+                'bitset_bytes': sum((bits.bit_length() + 7) // 8 for values in self.bits.values() for bits in values.values()),
+            }
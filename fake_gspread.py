@@ -0,0 +1,114 @@
+"""
+In-memory stand-in for the parts of the gspread client used by GoogleSheetSync
+Lets the Google Sheets sync run locally without credentials or network access:
+
+    client = FakeClient({'sheet-id': {'Sheet1': [['Name', 'Email'], ['Ann', 'ann@x.org']]}})
+    GoogleSheetSync(db=Database('test.db'), client=client).sync_from_sheet('sheet-id')
+
+Every read is recorded in `client.requests` so callers can check how much of
+the sheet a sync actually fetched.
+"""
+
+from datetime import datetime, timezone
+import gspread
+from gspread.utils import a1_to_rowcol
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, rows):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows = [[str(value) for value in row] for row in rows]
+
+    def _record(self, method, argument, cells):
+        self.spreadsheet.client.requests.append((method, self.title, argument, cells))
+
+    def _touch(self):
+        self.spreadsheet.last_update_time = _now()
+
+    def row_values(self, row):
+        values = list(self.rows[row - 1]) if row <= len(self.rows) else []
+        self._record('row_values', row, len(values))
+        return values
+
+    def col_values(self, col):
+        values = [row[col - 1] if col <= len(row) else '' for row in self.rows]
+        while values and values[-1] == '':
+            values.pop()
+        self._record('col_values', col, len(values))
+        return values
+
+    def get(self, range_name):
+        """Values in an A1 range like 'A2:J40', trimmed like the Sheets API does"""
+        start, _, end = range_name.partition(':')
+        first_row, first_col = a1_to_rowcol(start)
+        last_row, last_col = a1_to_rowcol(end or start)
+
+        values = []
+        for row in self.rows[first_row - 1:last_row]:
+            cells = row[first_col - 1:last_col]
+            while cells and cells[-1] == '':
+                cells.pop()
+            values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+
+        self._record('get', range_name, sum(len(row) for row in values))
+        return values
+
+    def get_all_values(self):
+        self._record('get_all_values', None, sum(len(row) for row in self.rows))
+        return [list(row) for row in self.rows]
+
+    def append_row(self, values):
+        self.rows.append([str(value) for value in values])
+        self._touch()
+
+    def update_cell(self, row, col, value):
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        cells.extend([''] * (col - len(cells)))
+        cells[col - 1] = str(value)
+        self._touch()
+
+class FakeSpreadsheet:
+    def __init__(self, client, spreadsheet_id, worksheets):
+        self.client = client
+        self.id = spreadsheet_id
+        self.last_update_time = _now()
+        self.worksheets = {
+            title: FakeWorksheet(self, title, rows) for title, rows in worksheets.items()
+        }
+
+    def worksheet(self, title):
+        if title not in self.worksheets:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return self.worksheets[title]
+
+    def get_lastUpdateTime(self):
+        self.client.requests.append(('get_lastUpdateTime', self.id, None, 0))
+        return self.last_update_time
+
+class FakeClient:
+    def __init__(self, spreadsheets):
+        """
+        Args:
+            spreadsheets: {spreadsheet id: {worksheet title: [[cell, ...], ...]}}
+        """
+        self.requests = []
+        self.spreadsheets = {
+            spreadsheet_id: FakeSpreadsheet(self, spreadsheet_id, worksheets)
+            for spreadsheet_id, worksheets in spreadsheets.items()
+        }
+
+    def open_by_key(self, key):
+        if key not in self.spreadsheets:
+            raise gspread.exceptions.SpreadsheetNotFound(key)
+        return self.spreadsheets[key]
+
+    def open_by_url(self, url):
+        # https://docs.google.com/spreadsheets/d/<id>/edit
+        return self.open_by_key(url.split('/d/')[1].split('/')[0])
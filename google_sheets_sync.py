@@ -5,8 +5,11 @@ Supports both manual and automatic syncing
 """
 
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 from database import Database
+import hashlib
+import json
 import time
 from datetime import datetime
 
@@ -16,17 +19,44 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive.readonly'
 ]
 
+# Sheet column for each volunteer field
+FIELD_COLUMNS = {
+    'name': 'Name',
+    'email': 'Email',
+    'phone': 'Phone',
+    'skills': 'Skills',
+    'experience': 'Experience',
+    'education': 'Education',
+    'availability': 'Availability',
+    'languages': 'Languages',
+    'certifications': 'Certifications',
+    'interests': 'Interests'
+}
+
+# Re-read every row (to pick up edits) on every Nth sync of a worksheet;
+# the syncs in between only fetch rows appended since the last one
+FULL_SCAN_EVERY = 6
+
+def _fingerprint(values):
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False).encode('utf-8')).hexdigest()
+
 class GoogleSheetSync:
-    def __init__(self, credentials_file='credentials.json'):
+    def __init__(self, credentials_file='credentials.json', db=None, client=None,
+                 full_scan_every=FULL_SCAN_EVERY):
         """
         Initialize Google Sheets sync
         
         Args:
             credentials_file: Path to Google service account credentials JSON
+            db: Database to sync into (default: volunteer_management.db)
+            client: Already-authorized gspread client (e.g. fake_gspread.FakeClient)
+            full_scan_every: Re-read all rows on every Nth sync of a worksheet
         """
         self.credentials_file = credentials_file
-        self.db = Database()
-        self.client = None
+        self.db = db or Database()
+        self.client = client
+        self.full_scan_every = full_scan_every
+        self.sync_counts = {}  # sheet key -> syncs run by this instance
     
     def connect(self):
         """Connect to Google Sheets API"""
@@ -46,85 +76,160 @@ class GoogleSheetSync:
             print(f"[ERROR] Failed to connect: {e}")
             return False
     
-    def sync_from_sheet(self, sheet_url_or_id, worksheet_name='Sheet1'):
+    def open_spreadsheet(self, sheet_url_or_id):
+        """Open a spreadsheet by URL or ID"""
+        if sheet_url_or_id.startswith('http'):
+            return self.client.open_by_url(sheet_url_or_id)
+        return self.client.open_by_key(sheet_url_or_id)
+    
+    def row_to_volunteer(self, header, row):
+        """
+        Map a sheet row (list of cell values) onto volunteer fields
+        
+        Only fields whose column is in the header are returned, so an update
+        never blanks fields the sheet does not have (e.g. parsed resume skills).
+        """
+        record = dict(zip(header, row))
+        return {
+            field: str(record[column]).strip()
+            for field, column in FIELD_COLUMNS.items()
+            if column in record
+        }
+    
+    def sync_from_sheet(self, sheet_url_or_id, worksheet_name='Sheet1', full_scan=False,
+                        sheet_modified=False):
         """
-        Sync data from Google Sheet to database
+        Incrementally sync data from Google Sheet to database
+        
+        Only rows appended since the last sync are fetched, except on full
+        scans (first sync, every `full_scan_every` syncs, header changes or
+        deleted rows), which re-read every row to pick up edits. Each row's
+        content hash is stored; rows whose hash is unchanged are skipped
+        without touching the volunteers table, changed rows are upserted.
         
         Args:
             sheet_url_or_id: Google Sheet URL or ID
             worksheet_name: Name of the worksheet (default: 'Sheet1')
+            full_scan: Force re-reading every row
+            sheet_modified: The caller knows the sheet changed since the last
+                sync (e.g. from its modified time); if no rows were appended
+                the change must be an edit, so every row is re-read
+        
+        Returns:
+            dict: inserted/updated/unchanged/skipped counts and the ids of the
+            volunteers that changed, or None if the sync failed
         """
         if not self.client:
             if not self.connect():
-                return False
+                return None
         
         try:
             print(f"\n[INFO] Opening Google Sheet...")
             
-            # Open the spreadsheet
-            if sheet_url_or_id.startswith('http'):
-                sheet = self.client.open_by_url(sheet_url_or_id)
-            else:
-                sheet = self.client.open_by_key(sheet_url_or_id)
-            
-            # Get the worksheet
+            sheet = self.open_spreadsheet(sheet_url_or_id)
             worksheet = sheet.worksheet(worksheet_name)
+            sheet_key = f"{sheet.id}:{worksheet_name}"
+            
+            state = self.db.get_sheet_sync_state(sheet_key)
+            sync_number = self.sync_counts.get(sheet_key, 0)
+            self.sync_counts[sheet_key] = sync_number + 1
             
-            # Get all records as list of dictionaries
-            records = worksheet.get_all_records()
+            header = [str(column).strip() for column in worksheet.row_values(1)]
+            if FIELD_COLUMNS['email'] not in header:
+                print(f"[ERROR] Worksheet '{worksheet_name}' has no '{FIELD_COLUMNS['email']}' column.")
+                return None
+            header_hash = _fingerprint(header)
             
-            print(f"[INFO] Found {len(records)} records in Google Sheet")
+            # Data rows run down to the last filled Email cell
+            email_column = header.index(FIELD_COLUMNS['email']) + 1
+            row_count = max(len(worksheet.col_values(email_column)) - 1, 0)
+            
+            full_scan = (full_scan
+                         or sync_number % self.full_scan_every == 0
+                         or header_hash != state['header_hash']
+                         or row_count < state['row_count']
+                         or (sheet_modified and row_count == state['row_count']))
+            first_row = 1 if full_scan else state['row_count'] + 1
+            
+            rows = []
+            if row_count >= first_row:
+                # Sheet row = data row + 1 (row 1 is the header)
+                rows = worksheet.get(
+                    f"{rowcol_to_a1(first_row + 1, 1)}:{rowcol_to_a1(row_count + 1, len(header))}"
+                )
+            
+            print(f"[INFO] {row_count} rows in sheet, fetched {len(rows)} "
+                  f"({'full scan' if full_scan else 'new rows only'})")
             
             # Sync to database
             inserted_count = 0
             updated_count = 0
             skipped_count = 0
+            changed_ids = []
+            new_hashes = {}
             
-            for record in records:
-                volunteer_data = {
-                    'name': str(record.get('Name', '')).strip(),
-                    'email': str(record.get('Email', '')).strip(),
-                    'phone': str(record.get('Phone', '')).strip(),
-                    'skills': str(record.get('Skills', '')).strip(),
-                    'experience': str(record.get('Experience', '')).strip(),
-                    'education': str(record.get('Education', '')).strip(),
-                    'availability': str(record.get('Availability', '')).strip(),
-                    'languages': str(record.get('Languages', '')).strip(),
-                    'certifications': str(record.get('Certifications', '')).strip(),
-                    'interests': str(record.get('Interests', '')).strip()
-                }
+            for row_number, row in enumerate(rows, start=first_row):
+                row = [str(value) for value in row] + [''] * (len(header) - len(row))
+                row_hash = _fingerprint([header_hash] + row)
+                if state['row_hashes'].get(row_number) == row_hash:
+                    continue
+                
+                volunteer_data = self.row_to_volunteer(header, row)
                 
                 # Validate required fields
-                if not volunteer_data['name'] or not volunteer_data['email']:
+                if not volunteer_data.get('name') or not volunteer_data.get('email'):
                     skipped_count += 1
                     continue
                 
-                # Insert into database
-                volunteer_id = self.db.insert_volunteer(volunteer_data)
+                # Insert or update in database
+                action, volunteer_id = self.db.upsert_volunteer(volunteer_data)
                 
-                if volunteer_id:
+                if action == 'inserted':
                     inserted_count += 1
+                    changed_ids.append(volunteer_id)
                     print(f"  [+] Added: {volunteer_data['name']}")
+                elif action == 'updated':
+                    updated_count += 1
+                    changed_ids.append(volunteer_id)
+                    print(f"  [~] Updated: {volunteer_data['name']}")
                 else:
                     skipped_count += 1
-                    print(f"  [=] Skipped: {volunteer_data['email']} (already exists)")
+                    continue
+                
+                # Only rows that reached the database are remembered, so failed rows are retried
+                new_hashes[row_number] = row_hash
+            
+            self.db.save_sheet_sync_state(sheet_key, row_count, header_hash, new_hashes)
+            unchanged_count = row_count - inserted_count - updated_count - skipped_count
             
             print(f"\n[SUCCESS] Sync completed!")
             print(f"  - Inserted: {inserted_count} new volunteers")
-            print(f"  - Skipped: {skipped_count} (duplicates or invalid)")
-            print(f"  - Total in database: {len(self.db.get_all_volunteers())}")
+            print(f"  - Updated: {updated_count} changed volunteers")
+            print(f"  - Unchanged: {unchanged_count} rows")
+            print(f"  - Skipped: {skipped_count} (invalid)")
+            print(f"  - Total in database: {self.db.count_volunteers()}")
             
-            return True
+            return {
+                'sheet_key': sheet_key,
+                'full_scan': full_scan,
+                'rows': row_count,
+                'fetched': len(rows),
+                'inserted': inserted_count,
+                'updated': updated_count,
+                'unchanged': unchanged_count,
+                'skipped': skipped_count,
+                'changed_ids': changed_ids
+            }
             
         except gspread.exceptions.SpreadsheetNotFound:
             print("[ERROR] Spreadsheet not found. Check the URL/ID and sharing permissions.")
-            return False
+            return None
         except gspread.exceptions.WorksheetNotFound:
             print(f"[ERROR] Worksheet '{worksheet_name}' not found.")
-            return False
+            return None
         except Exception as e:
             print(f"[ERROR] Sync failed: {e}")
-            return False
+            return None
     
     def auto_sync(self, sheet_url_or_id, worksheet_name='Sheet1', interval_seconds=300):
         """
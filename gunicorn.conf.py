@@ -0,0 +1,38 @@
+"""
+gunicorn settings for production serving
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Settings can be overridden with environment variables (VMS_BIND, VMS_WORKERS,
+VMS_THREADS, VMS_TIMEOUT).
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+bind = os.environ.get('VMS_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('VMS_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+# Threads mostly wait on the keyword extraction call. Keep more threads than the
+# matching admission limit plus its queue, so excess shortlist requests reach the
+# admission controller (fast 429) instead of queueing unseen in the socket backlog
+threads = int(os.environ.get('VMS_THREADS', 16))
+# Shortlisting waits on the keyword extraction call, so allow more than the default 30s
+timeout = int(os.environ.get('VMS_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Import the app once in the master so workers share the preloaded state
+preload_app = True
+
+# Only one worker runs the Google Sheets sync; see app.start_background_sync
+SYNC_LOCK_PATH = os.path.join(tempfile.gettempdir(), 'vms_sheet_sync.lock')
+
+def post_fork(server, worker):
+    import app as app_module
+    if app_module.start_background_sync(SYNC_LOCK_PATH):
+        server.log.info("Worker %s runs the Google Sheets sync", worker.pid)
+
+def worker_exit(server, worker):
+    import app as app_module
+    app_module.shutdown()
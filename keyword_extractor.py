@@ -1,6 +1,9 @@
 """
 AI-Powered Keyword Extractor for Job Descriptions
 Uses GPT-4 to intelligently extract keywords from job descriptions
+
+Descriptions are compacted locally first (see prompt_compaction.py), so
+organisation boilerplate is not sent to the model.
 """
 
 from openai import AzureOpenAI
@@ -10,15 +13,36 @@ from config import (
     AZURE_OPENAI_DEPLOYMENT,
     AZURE_OPENAI_API_VERSION
 )
+from prompt_compaction import compact_description
 import json
+import os
+import threading
 
 class KeywordExtractor:
-    def __init__(self):
-        self.client = AzureOpenAI(
-            api_key=AZURE_OPENAI_API_KEY,
-            api_version=AZURE_OPENAI_API_VERSION,
-            azure_endpoint=AZURE_OPENAI_ENDPOINT
-        )
+    def __init__(self, compaction=None):
+        """
+        Args:
+            compaction: compact_description() settings ({"max_tokens": ...}); None sends descriptions as they are
+        """
+        # The client (and its HTTP connection pool) is created on first use in
+        # each process, so pre-fork servers never share sockets across workers
+        self._client = None
+        self._client_pid = None
+        self.compaction = compaction
+        self.compaction_counts = {'calls': 0, 'original_tokens': 0, 'tokens': 0, 'tokens_saved': 0}
+        self._counts_lock = threading.Lock()
+    
+    @property
+    def client(self):
+        if self._client is None or self._client_pid != os.getpid():
+            # Environment variables override config.py (e.g. to point at stub_openai_server.py)
+            self._client = AzureOpenAI(
+                api_key=os.environ.get('AZURE_OPENAI_API_KEY', AZURE_OPENAI_API_KEY),
+                api_version=AZURE_OPENAI_API_VERSION,
+                azure_endpoint=os.environ.get('AZURE_OPENAI_ENDPOINT', AZURE_OPENAI_ENDPOINT)
+            )
+            self._client_pid = os.getpid()
+        return self._client
     
     def extract_keywords(self, job_description):
         """
@@ -31,10 +55,21 @@ class KeywordExtractor:
             dict: Extracted keywords categorized by type
         """
         
+        prompt_description = job_description
+        if self.compaction is not None:
+            compaction = compact_description(job_description, **self.compaction)
+            prompt_description = compaction['text']
+            with self._counts_lock:
+                self.compaction_counts['calls'] += 1
+                for key in ('original_tokens', 'tokens', 'tokens_saved'):
+                    self.compaction_counts[key] += compaction[key]
+            print(f"[AI] Compacted job description: {compaction['original_tokens']} -> "
+                  f"{compaction['tokens']} tokens ({compaction['tokens_saved']} saved)")
+        
         prompt = f"""Analyze this job description and extract key information in JSON format:
 
 JOB DESCRIPTION:
-{job_description}
+{prompt_description}
 
 Extract and return ONLY a JSON object with these fields:
 {{
@@ -92,8 +127,17 @@ Return ONLY valid JSON, no other text."""
                 "education_keywords": [],
                 "location_keywords": [],
                 "availability_keywords": [],
-                "all_keywords": list(set(words))
+                "all_keywords": list(set(words)),
+                "fallback": True  # not from the model; callers shouldn't cache it
             }
+    
+    def compaction_stats(self):
+        """Tokens sent and saved by description compaction (this process)"""
+        with self._counts_lock:
+            counts = dict(self.compaction_counts)
+        counts['enabled'] = self.compaction is not None
+        counts['saved_ratio'] = round(counts['tokens_saved'] / counts['original_tokens'], 4) if counts['original_tokens'] else None
+        return counts
 
 def test_keyword_extractor():
     """Test the keyword extractor"""
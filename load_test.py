@@ -0,0 +1,239 @@
+"""
+Offline Load Test
+Replays a weighted mix of shortlist, resume upload, stats and listing
+requests against a running app at a target request rate, and reports
+latency percentiles, throughput and error rates per endpoint.
+
+Run it fully offline against the stub Azure OpenAI server:
+
+    python stub_openai_server.py --latency-ms 800 --latency-dist lognormal &
+    AZURE_OPENAI_ENDPOINT=http://127.0.0.1:8099 gunicorn -c gunicorn.conf.py wsgi:application &
+    python load_test.py --url http://127.0.0.1:5000 --rps 20 --duration 60 --seed-volunteers 2000
+
+Arrivals are open-loop: request i is due at start + i / rps whether or not
+earlier requests have finished. Latency is measured from the due time, so
+queueing in the client when the server falls behind is counted rather than
+hidden (no coordinated omission). Results are written as JSON.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from benchmark_parse_throughput import generate_resume_lines, write_docx, LAYOUTS
+
+JOB_DESCRIPTIONS = [
+    "Looking for a Python developer with Django and SQL experience to build our volunteer portal.",
+    "Need a data analyst comfortable with Excel, SQL and Tableau for weekend reporting work.",
+    "Seeking a React and Node.js developer for a remote part-time community app project.",
+    "Project manager with Scrum experience to coordinate food bank volunteers.",
+    "Mobile developer (Flutter or Swift) to help build an event check-in app.",
+    "Teacher or tutor fluent in Spanish and English for online mentoring sessions.",
+]
+DEFAULT_MIX = 'shortlist=2,upload=1,stats=5,volunteers=2'
+PERCENTILES = [50, 90, 95, 99]
+
+class Recorder:
+    """Thread-safe per-endpoint results"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+
+    def add(self, endpoint, status, latency, service_time):
+        with self.lock:
+            self.results.setdefault(endpoint, []).append((status, latency, service_time))
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize(samples, elapsed):
+    latencies = sorted(latency for _, latency, _ in samples)
+    service_times = sorted(service for _, _, service in samples)
+    statuses = {}
+    for status, _, _ in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    ok = sum(1 for status, _, _ in samples if isinstance(status, int) and status < 400)
+    return {
+        'requests': len(samples),
+        'ok': ok,
+        'error_rate': round(1 - ok / len(samples), 4) if samples else 0.0,
+        'statuses': statuses,
+        'throughput_rps': round(len(samples) / elapsed, 2),
+        'goodput_rps': round(ok / elapsed, 2),
+        'latency_ms': {
+            **{f'p{p}': round(percentile(latencies, p) * 1000, 1) for p in PERCENTILES},
+            'max': round(latencies[-1] * 1000, 1),
+            'mean': round(sum(latencies) / len(latencies) * 1000, 1),
+        } if latencies else {},
+        'service_ms_p50': round(percentile(service_times, 50) * 1000, 1) if service_times else None,
+    }
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint in --mix: {name} (choose from {', '.join(ENDPOINTS)})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+def multipart_body(field, filename, content, content_type):
+    boundary = uuid.uuid4().hex
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n').encode() + content + f'\r\n--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+class LoadTest:
+    def __init__(self, base_url, timeout, seed, revalidate):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.revalidate = revalidate
+        self.etags = {}
+        self.run_tag = uuid.uuid4().hex[:8]
+        self.upload_counter = itertools.count()
+
+    def send(self, method, path, body=None, headers=None):
+        """Returns (status or error name, service seconds)"""
+        request = urllib.request.Request(self.base_url + path, data=body, method=method, headers=headers or {})
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                status = response.status
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            e.read()
+            status, etag = e.code, e.headers.get('ETag')
+        except Exception as e:
+            status, etag = type(e).__name__, None
+        if etag and method == 'GET':
+            self.etags[path] = etag
+        return status, time.perf_counter() - start
+
+    def get(self, path):
+        headers = {'Accept-Encoding': 'gzip'}
+        if self.revalidate and path in self.etags:
+            headers['If-None-Match'] = self.etags[path]
+        return self.send('GET', path, headers=headers)
+
+    def shortlist(self):
+        with self.rng_lock:
+            job_description = self.rng.choice(JOB_DESCRIPTIONS)
+        body = json.dumps({'job_description': job_description, 'max_results': 10,
+                           'fields': ['id', 'name', 'email', 'skills']}).encode()
+        return self.send('POST', '/api/shortlist', body, {'Content-Type': 'application/json'})
+
+    def upload(self):
+        number = next(self.upload_counter)
+        with self.rng_lock:
+            lines = generate_resume_lines(self.rng, LAYOUTS[number % len(LAYOUTS)], 1, 0.02)
+        lines[1] = f'load.{self.run_tag}.{number}@example.org'  # unique email and file hash
+        body, content_type = multipart_body(
+            'resume', f'load_{number}.docx', write_docx(lines),
+            'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+        )
+        return self.send('POST', '/api/upload-resume', body, {'Content-Type': content_type})
+
+    def stats(self):
+        return self.get('/api/stats')
+
+    def volunteers(self):
+        return self.get('/api/volunteers?fields=id,name,email,skills')
+
+    def seed_volunteers(self, count):
+        """Bulk import synthetic volunteers so shortlisting has a corpus to match"""
+        from benchmark_parse_throughput import FIRST_NAMES, LAST_NAMES, SKILLS
+        rng = random.Random(0)
+        rows = ['name,email,skills,experience']
+        for i in range(count):
+            name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+            skills = ';'.join(rng.sample(SKILLS, rng.randint(3, 8)))
+            rows.append(f'{name},seed.{self.run_tag}.{i}@example.org,{skills},{rng.randint(1, 15)} years')
+        status, seconds = self.send('POST', '/api/volunteers/import', '\n'.join(rows).encode(),
+                                    {'Content-Type': 'text/csv'})
+        print(f"Seeded {count} volunteers (HTTP {status}, {seconds:.1f}s)")
+
+ENDPOINTS = {
+    'shortlist': LoadTest.shortlist,
+    'upload': LoadTest.upload,
+    'stats': LoadTest.stats,
+    'volunteers': LoadTest.volunteers,
+}
+
+def run(load_test, mix, rps, duration, concurrency, seed):
+    """Issue requests open-loop at rps for duration seconds; returns (Recorder, elapsed seconds)"""
+    recorder = Recorder()
+    schedule_rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    total = int(rps * duration)
+
+    def fire(name, due):
+        status, service_time = ENDPOINTS[name](load_test)
+        recorder.add(name, status, time.perf_counter() - due, service_time)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(total):
+            due = start + i / rps
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, schedule_rng.choices(names, weights)[0], due)
+    return recorder, time.perf_counter() - start
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Offline load test for the volunteer management API')
+    arg_parser.add_argument('--url', default='http://127.0.0.1:5000')
+    arg_parser.add_argument('--rps', type=float, default=10, help='Target request rate')
+    arg_parser.add_argument('--duration', type=float, default=30, help='Seconds of load')
+    arg_parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Endpoint weights (default {DEFAULT_MIX})')
+    arg_parser.add_argument('--concurrency', type=int, default=64, help='Maximum requests in flight')
+    arg_parser.add_argument('--timeout', type=float, default=60)
+    arg_parser.add_argument('--seed', type=int, default=42)
+    arg_parser.add_argument('--seed-volunteers', type=int, default=0,
+                            help='Bulk import this many synthetic volunteers first')
+    arg_parser.add_argument('--revalidate', action='store_true',
+                            help='Send If-None-Match on repeated GETs, like a polling browser')
+    arg_parser.add_argument('--output', default='bench_load_results.json')
+    args = arg_parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    load_test = LoadTest(args.url, args.timeout, args.seed, args.revalidate)
+    if args.seed_volunteers:
+        load_test.seed_volunteers(args.seed_volunteers)
+
+    print(f"\nRunning {args.rps:g} req/s for {args.duration:g}s against {args.url} (mix {args.mix})...")
+    recorder, elapsed = run(load_test, mix, args.rps, args.duration, args.concurrency, args.seed)
+
+    all_samples = [sample for samples in recorder.results.values() for sample in samples]
+    results = {
+        'config': vars(args),
+        'elapsed_seconds': round(elapsed, 2),
+        'overall': summarize(all_samples, elapsed),
+        'endpoints': {name: summarize(samples, elapsed) for name, samples in sorted(recorder.results.items())},
+    }
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'endpoint':<12} {'reqs':>6} {'rps':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  (ms)")
+    for name, summary in [('overall', results['overall'])] + list(results['endpoints'].items()):
+        latency = summary['latency_ms']
+        print(f"{name:<12} {summary['requests']:>6} {summary['throughput_rps']:>7} "
+              f"{summary['error_rate'] * 100:>5.1f}% {latency.get('p50', 0):>8} {latency.get('p95', 0):>8} "
+              f"{latency.get('p99', 0):>8} {latency.get('max', 0):>8}")
+    print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Standing Job Postings with Incremental Reverse Matching
+A job posting is a standing query: its keywords are extracted and its term
+vector computed once, when it is created, and its best `top_k` volunteers
+are stored in the posting_matches table.
+
+When volunteers arrive (resume upload, bulk import, Google Sheets sync) only
+those volunteers are scored against the open postings, one sparse matrix
+product of (new volunteers x postings), and a posting's stored top-k is only
+written when a new volunteer beats its current lowest stored score or a
+volunteer already in it changed. Only a full posting that loses ground (a
+stored volunteer edited out of it or below its lowest score) is rescanned.
+
+Vectors come from a HashingVectorizer, which needs no fitted vocabulary, so
+a vector stored months ago is still comparable with a volunteer that
+arrives today. Scores are cosine similarities of those vectors.
+
+The reverse direction, the best postings for one volunteer, is a single
+row against the posting matrix.
+
+Open postings and their floors are cached per process and reloaded whenever
+the 'postings' data version changes, so postings created, closed or matched
+by another worker (or a cleared database) are picked up.
+"""
+
+import json
+import threading
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from facet_index import passes_filters, volunteer_facets
+
+class PostingMatcher:
+    def __init__(self, db, matcher, default_top_k=25, min_score=0.05, n_features=2 ** 18, volunteer_pool=None):
+        """
+        Args:
+            db: Database
+            matcher: ResumeMatcher whose profiles, preprocessing and skill matching are reused
+            default_top_k: Volunteers kept per posting unless the posting sets its own
+            min_score: Volunteers scoring below this (0-1) are never stored; stored scores are percentages
+            n_features: Hashed vector dimensions
+            volunteer_pool: Callable returning the current volunteers, used to refill a
+                posting whose stored top-k lost a volunteer (None: not refilled)
+        """
+        self.db = db
+        self.matcher = matcher
+        self.default_top_k = default_top_k
+        self.min_score = min_score
+        self.volunteer_pool = volunteer_pool
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm='l2',
+            dtype=np.float32
+        )
+        self.postings = None  # open posting id -> state; loaded on first use
+        self.version = None   # (epoch, postings data version) the postings were loaded at
+        self.matrix = None    # open posting vectors stacked in self.order
+        self.order = []
+        self.floors = {}      # posting id -> (stored match count, lowest stored score)
+        self._lock = threading.RLock()
+
+    # Vectors
+
+    def posting_text(self, description, keywords_data):
+        return self.matcher.preprocess_text(description + ' ' + ' '.join(keywords_data.get('all_keywords', [])))
+
+    def vectorize(self, texts):
+        return self.vectorizer.transform(texts).tocsr()
+
+    def _volunteer_vectors(self, volunteers):
+        profiles = [self.matcher.create_volunteer_profile(volunteer) for volunteer in volunteers]
+        return profiles, self.vectorize(profiles)
+
+    def _posting_state(self, posting):
+        indices = np.frombuffer(posting['vector_indices'], dtype=np.int32)
+        values = np.frombuffer(posting['vector_values'], dtype=np.float32)
+        vector = sp.csr_matrix((values, indices, [0, len(indices)]), shape=(1, self.vectorizer.n_features))
+        filters = json.loads(posting['filters'] or '{}')
+        return {
+            'id': posting['id'],
+            'title': posting['title'],
+            'text': self.posting_text(posting['description'], json.loads(posting['keywords'] or '{}')),
+            'vector': vector,
+            'filters': {facet: set(values) for facet, values in filters.get('filters', {}).items()},
+            'lenient': set(filters.get('lenient', [])),
+            'top_k': posting['top_k'],
+        }
+
+    def _load(self):
+        """
+        Reload the open postings and their floors when the 'postings' data
+        version changed, e.g. after another worker created, closed or matched
+        a posting. Postings never change after creation, so the state of a
+        posting that is still open is kept.
+        """
+        versions = self.db.get_data_versions(['postings'])
+        version = (versions['epoch'], versions['postings'])  # read first: the data below is at least this new
+        if version == self.version:
+            return
+        known = self.postings if self.postings is not None and self.version and self.version[0] == version[0] else {}
+        self.postings = {
+            posting['id']: known.get(posting['id']) or self._posting_state(posting)
+            for posting in self.db.get_job_postings(status='open', include_vectors=True)
+        }
+        self.floors = self.db.get_posting_match_floors()
+        self.matrix = None
+        self.version = version
+
+    def _posting_matrix(self):
+        if self.matrix is None:
+            self.order = list(self.postings)
+            self.matrix = sp.vstack([self.postings[posting_id]['vector'] for posting_id in self.order], format='csr') \
+                if self.order else None
+        return self.matrix
+
+    def reset(self):
+        """Forget cached postings; they are reloaded on next use"""
+        with self._lock:
+            self.postings = None
+            self.matrix = None
+            self.floors = {}
+            self.version = None
+
+    # Postings
+
+    def create_posting(self, title, description, keywords_data, filters=None, lenient=(),
+                       top_k=None, required_skills=None, volunteers=()):
+        """
+        Store a posting, then score the current volunteers once to fill its top-k
+
+        Args:
+            keywords_data: KeywordExtractor result for the description
+            filters: facet -> set of normalized values (hard filters)
+            lenient: Facets for which volunteers with no value pass
+            volunteers: The current volunteer pool
+
+        Returns:
+            int: The new posting id
+        """
+        with self._lock:
+            self._load()
+            vector = self.vectorize([self.posting_text(description, keywords_data)])
+            filters = filters or {}
+            posting_id = self.db.insert_job_posting({
+                'title': title,
+                'description': description,
+                'required_skills': required_skills or ', '.join(keywords_data.get('skills', [])),
+                'status': 'open',
+                'keywords': json.dumps(keywords_data),
+                'filters': json.dumps({'filters': {facet: sorted(values) for facet, values in filters.items()},
+                                       'lenient': sorted(lenient)}),
+                'top_k': top_k or self.default_top_k,
+                'vector_indices': vector.indices.astype(np.int32).tobytes(),
+                'vector_values': vector.data.astype(np.float32).tobytes(),
+            })
+            self.postings[posting_id] = self._posting_state(self.db.get_job_posting(posting_id, include_vectors=True))
+            self.matrix = None
+            self.refresh_posting(posting_id, volunteers)
+            return posting_id
+
+    def refresh_posting(self, posting_id, volunteers):
+        """
+        Rescore every volunteer against one posting and replace its stored top-k
+
+        Returns:
+            int: Number of matches stored
+        """
+        with self._lock:
+            self._load()
+            posting = self.postings.get(posting_id)
+            if posting is None:
+                return 0
+            eligible = [volunteer for volunteer in volunteers
+                        if passes_filters(volunteer_facets(volunteer), posting['filters'], posting['lenient'])]
+            matches = []
+            if eligible:
+                profiles, vectors = self._volunteer_vectors(eligible)
+                scores = (vectors @ posting['vector'].T).toarray().ravel() * 100
+                top = np.argsort(-scores)[:posting['top_k']]
+                matches = [self._match(posting, eligible[i], profiles[i], scores[i])
+                           for i in top if scores[i] >= self.min_score * 100]
+            self.db.replace_posting_matches(posting_id, matches)
+            self.floors[posting_id] = (len(matches), min((score for _, score, _ in matches), default=None))
+            return len(matches)
+
+    def close_posting(self, posting_id):
+        """Stop matching a posting (its stored top-k is kept)"""
+        with self._lock:
+            if not self.db.set_job_posting_status(posting_id, 'closed'):
+                return False
+            if self.postings is not None and self.postings.pop(posting_id, None) is not None:
+                self.matrix = None
+            return True
+
+    def reopen_posting(self, posting_id):
+        with self._lock:
+            if not self.db.set_job_posting_status(posting_id, 'open'):
+                return False
+            self.version = None  # reload, including this posting
+            return True
+
+    def _match(self, posting, volunteer, profile, score):
+        skills = self.matcher.find_matching_skills(posting['text'], profile, volunteer)
+        return volunteer['id'], round(float(score), 2), skills
+
+    # Arriving volunteers
+
+    def on_volunteers(self, volunteers):
+        """
+        Score new or changed volunteers against every open posting and merge
+        them into the stored top-k lists they make it into
+
+        A volunteer already stored on a posting always gets their new score
+        written, or is removed when they now fall below min_score or fail the
+        posting's filters. A full posting that lost a match, or whose match
+        dropped below its old lowest score, is refilled from the volunteer pool.
+
+        Returns:
+            int: Number of (posting, volunteer) matches written, removed or refilled
+        """
+        volunteers = [volunteer for volunteer in volunteers if volunteer.get('id') is not None]
+        with self._lock:
+            self._load()
+            matrix = self._posting_matrix()
+            if matrix is None or not volunteers:
+                return 0
+
+            profiles, vectors = self._volunteer_vectors(volunteers)
+            scores = (vectors @ matrix.T).toarray() * 100  # volunteers x postings, as percentages
+            facets = [volunteer_facets(volunteer) for volunteer in volunteers]
+            rows = {volunteer['id']: row for row, volunteer in enumerate(volunteers)}
+            stored = {}  # posting id -> rows of volunteers already in its top-k
+            for posting_id, volunteer_id in self.db.get_posting_match_pairs(rows):
+                stored.setdefault(posting_id, set()).add(rows[volunteer_id])
+
+            min_score = self.min_score * 100
+            updates, removals, refill = {}, {}, set()
+            for column, posting_id in enumerate(self.order):
+                posting = self.postings[posting_id]
+                count, lowest = self.floors.get(posting_id, (0, None))
+                full = count >= posting['top_k'] and lowest is not None
+                # Below the stored k-th best score a new volunteer cannot enter the top-k
+                threshold = max(min_score, lowest) if full else min_score
+                stored_rows = stored.get(posting_id, set())
+                candidates = stored_rows.union(np.flatnonzero(scores[:, column] >= threshold).tolist())
+                for row in sorted(candidates):
+                    score = scores[row, column]
+                    if score >= min_score and passes_filters(facets[row], posting['filters'], posting['lenient']):
+                        updates.setdefault(posting_id, []).append(
+                            self._match(posting, volunteers[row], profiles[row], score)
+                        )
+                        if full and row in stored_rows and round(float(score), 2) < lowest:
+                            refill.add(posting_id)  # volunteers never stored may now rank above it
+                    elif row in stored_rows:
+                        removals.setdefault(posting_id, []).append(volunteers[row]['id'])
+                        if full:
+                            refill.add(posting_id)
+
+            if refill and self.volunteer_pool is None:
+                refill = set()
+            for posting_id in refill:
+                updates.pop(posting_id, None)
+                removals.pop(posting_id, None)
+            self.floors.update(self.db.merge_posting_matches(updates, removals))
+            refilled = 0
+            if refill:
+                pool = self.volunteer_pool()
+                refilled = sum(self.refresh_posting(posting_id, pool) for posting_id in refill)
+
+            written = sum(len(matches) for matches in updates.values())
+            removed = sum(len(volunteer_ids) for volunteer_ids in removals.values())
+            if written or removed or refill:
+                print(f"[MATCHER] {len(volunteers)} new volunteers x {len(self.order)} postings: "
+                      f"{written} matches updated in {len(updates)} postings, {removed} removed, "
+                      f"{len(refill)} postings refilled")
+            return written + removed + refilled
+
+    # Reverse matching
+
+    def postings_for_volunteer(self, volunteer, limit=10):
+        """
+        Best open postings for one volunteer
+
+        Returns:
+            list: (posting id, title, score) tuples, best first; postings whose
+                filters exclude the volunteer are left out
+        """
+        with self._lock:
+            self._load()
+            matrix = self._posting_matrix()
+            if matrix is None:
+                return []
+            _, vector = self._volunteer_vectors([volunteer])
+            scores = (vector @ matrix.T).toarray().ravel()
+            facets = volunteer_facets(volunteer)
+            results = []
+            for column in np.argsort(-scores):
+                posting = self.postings[self.order[column]]
+                if not passes_filters(facets, posting['filters'], posting['lenient']):
+                    continue
+                results.append((posting['id'], posting['title'], round(float(scores[column]) * 100, 2)))
+                if len(results) >= limit:
+                    break
+            return results
+
+    def stats(self):
+        with self._lock:
+            self._load()
+            return {'open_postings': len(self.postings), 'stored_matches': sum(count for count, _ in self.floors.values())}
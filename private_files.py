@@ -0,0 +1,72 @@
+"""
+Private Directories and Files
+Some state is written to disk and later loaded with pickle or marshal: tenant
+spill files (tenants.py) and cProfile artifacts (profiling.py). Loading such a
+file runs whatever it contains, so it must come from a directory no other
+local user can write to. These helpers create and check such directories
+and files:
+
+- a directory is accepted only if it is a real directory (not a symlink),
+  owned by the current user, with no group or other permissions
+- a file is opened without following symlinks and checked the same way on
+  the open descriptor, before anything reads it
+"""
+
+import os
+import stat
+import tempfile
+
+O_NOFOLLOW = getattr(os, 'O_NOFOLLOW', 0)
+
+def check_private(status, is_kind, path):
+    """
+    Raise PermissionError unless status (an lstat/fstat result) is of the
+    expected kind, owned by the current user and not accessible to others
+    """
+    if not is_kind(status.st_mode):
+        kind = 'regular file' if is_kind is stat.S_ISREG else 'directory'
+        raise PermissionError(f"{path} is not a {kind} (symlinks are refused)")
+    if hasattr(os, 'getuid') and status.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+    if status.st_mode & 0o077:
+        raise PermissionError(f"{path} is accessible to other users (mode {stat.S_IMODE(status.st_mode):o})")
+
+def check_private_directory(directory):
+    """Raise PermissionError unless directory is private to the current user"""
+    check_private(os.lstat(directory), stat.S_ISDIR, directory)
+
+def private_directory(directory=None, prefix='vms_'):
+    """
+    A directory private to the current user
+
+    Args:
+        directory: Directory to use; created (mode 0700) if missing. None: a new
+            tempfile.mkdtemp() directory
+        prefix: Name prefix of a new temporary directory
+
+    Raises:
+        PermissionError: The directory exists but is not private to the current user
+    """
+    if directory is None:
+        return tempfile.mkdtemp(prefix=prefix)
+    if not os.path.lexists(directory):
+        os.makedirs(directory, mode=0o700)
+    check_private_directory(directory)
+    return directory
+
+def open_private(path):
+    """
+    Open a file for binary reading, refusing symlinks and files that are
+    not private to the current user
+
+    Raises:
+        PermissionError: The file is not a private regular file
+    """
+    descriptor = os.open(path, os.O_RDONLY | O_NOFOLLOW)
+    f = os.fdopen(descriptor, 'rb')
+    try:
+        check_private(os.fstat(f.fileno()), stat.S_ISREG, path)
+    except BaseException:
+        f.close()
+        raise
+    return f
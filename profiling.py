@@ -0,0 +1,273 @@
+"""
+On-Demand Request Profiling and Allocation Tracing
+Opt-in diagnostics, enabled by setting PROFILING_ADMIN_TOKEN in config.py.
+Every request to these hooks must carry the token in an X-Admin-Token header.
+
+Per-request profiles: send `X-Profile: cprofile` (or `sample`), or add
+`?_profile=cprofile` to the URL. The response carries an X-Profile-Id header,
+and the artifact can be downloaded from /api/admin/profiles/<id> (listed at
+/api/admin/profiles):
+    cprofile -> .pstats file (python -m pstats, snakeviz, ...); ?format=text for a summary
+    sample   -> collapsed stacks (flamegraph.pl, speedscope, inferno)
+
+Memory growth: POST /api/admin/tracemalloc/start, then GET /api/admin/tracemalloc
+takes a snapshot and lists the top allocation differences against the previous
+one (the snapshot itself is kept as a downloadable artifact);
+POST /api/admin/tracemalloc/stop ends tracing. Tracing is per worker process.
+
+Artifacts are files in one directory shared by the workers (created before
+they fork), so any worker can serve them. cProfile artifacts are loaded with
+marshal, so the directory must be private to the user running the app: by
+default a new tempfile.mkdtemp() directory, otherwise a configured directory
+that is owned by that user with mode 0700 (see private_files.py).
+When no token is configured none of the hooks or routes are registered.
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from functools import wraps
+from flask import g, jsonify, request, send_file
+from private_files import private_directory
+
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+PROFILE_EXTENSIONS = {'cprofile': '.pstats', 'sample': '.collapsed.txt'}
+ARTIFACT_EXTENSIONS = {**PROFILE_EXTENSIONS, 'tracemalloc': '.tracemalloc'}
+SORT_KEYS = sorted(key.value for key in pstats.SortKey)
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, thread_id, interval=0.002):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        """Stop sampling; returns the collapsed stacks ("frame;frame;frame count" lines)"""
+        self._stop.set()
+        self._thread.join()
+        return ''.join(f'{stack} {count}\n' for stack, count in self.counts.most_common())
+
+class Profiling:
+    def __init__(self, token, directory=None, max_artifacts=200):
+        """
+        Args:
+            token: Admin token required for every profiling request
+            directory: Where artifacts are written; must be private to the current user
+                (default: a new private temporary directory)
+            max_artifacts: Oldest artifacts beyond this count are deleted
+
+        Raises:
+            PermissionError: directory is not private to the current user
+        """
+        self.token = token
+        self.directory = private_directory(directory, prefix='vms_profiles_')
+        self.max_artifacts = max_artifacts
+        self.last_snapshot = None
+
+    def authorized(self):
+        supplied = request.headers.get('X-Admin-Token', '')
+        return hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    def require_admin(self, view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not self.authorized():
+                return jsonify({'success': False, 'error': 'Admin token required'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+
+    def _artifact_path(self, profile_id, mode):
+        return os.path.join(self.directory, profile_id + ARTIFACT_EXTENSIONS[mode])
+
+    def _prune(self):
+        files = sorted((entry for entry in os.scandir(self.directory) if entry.is_file()),
+                       key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:-self.max_artifacts]:
+            os.unlink(entry.path)
+
+    # Request hooks
+
+    def before_request(self):
+        mode = request.headers.get('X-Profile') or request.args.get('_profile')
+        if not mode:
+            return  # the only cost when profiling is not requested
+        if mode not in PROFILE_EXTENSIONS or not self.authorized():
+            return
+
+        g.profile = (mode, time.perf_counter())
+        if mode == 'cprofile':
+            g.profiler = cProfile.Profile()
+            g.profiler.enable()
+        else:
+            g.profiler = StackSampler(threading.get_ident())
+            g.profiler.start()
+
+    def after_request(self, response):
+        profile = g.pop('profile', None)
+        if profile is None:
+            return response
+        mode, start = profile
+        profiler = g.pop('profiler')
+        profile_id = uuid.uuid4().hex
+        path = self._artifact_path(profile_id, mode)
+
+        if mode == 'cprofile':
+            profiler.disable()
+            profiler.dump_stats(path)
+        else:
+            with open(path, 'w') as f:
+                f.write(profiler.stop())
+        self._prune()
+
+        response.headers['X-Profile-Id'] = profile_id
+        response.headers['X-Profile-Url'] = f'/api/admin/profiles/{profile_id}'
+        response.headers['X-Profile-Wall-Ms'] = f'{(time.perf_counter() - start) * 1000:.1f}'
+        return response
+
+    def teardown_request(self, error=None):
+        # after_request is skipped when the view raised; make sure profiling stops
+        if g.pop('profile', None) is not None:
+            profiler = g.pop('profiler')
+            if isinstance(profiler, StackSampler):
+                profiler.stop()
+            else:
+                profiler.disable()
+
+    # Routes
+
+    def list_profiles(self):
+        profiles = []
+        modes = {extension: mode for mode, extension in ARTIFACT_EXTENSIONS.items()}
+        for entry in sorted(os.scandir(self.directory), key=lambda entry: entry.stat().st_mtime, reverse=True):
+            profile_id, dot, extension = entry.name.partition('.')
+            mode = modes.get(dot + extension)
+            if mode is None:
+                continue
+            profiles.append({'id': profile_id, 'mode': mode, 'bytes': entry.stat().st_size,
+                             'created': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(entry.stat().st_mtime))})
+        return jsonify({'success': True, 'profiles': profiles})
+
+    def download_profile(self, profile_id):
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return jsonify({'success': False, 'error': 'Invalid profile id'}), 400
+
+        for mode, extension in ARTIFACT_EXTENSIONS.items():
+            path = self._artifact_path(profile_id, mode)
+            if not os.path.exists(path):
+                continue
+            if mode == 'cprofile' and request.args.get('format') == 'text':
+                sort = request.args.get('sort', 'cumulative')
+                if sort not in SORT_KEYS:
+                    return jsonify({'success': False, 'error': f"sort must be one of: {', '.join(SORT_KEYS)}"}), 400
+                output = io.StringIO()
+                stats = pstats.Stats(path, stream=output)
+                stats.sort_stats(sort).print_stats(request.args.get('limit', 40, type=int))
+                return output.getvalue(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+            return send_file(path, as_attachment=True, download_name=profile_id + extension)
+
+        return jsonify({'success': False, 'error': 'Profile not found'}), 404
+
+    def tracemalloc_start(self):
+        frames = request.args.get('frames', 10, type=int)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self.last_snapshot = tracemalloc.take_snapshot()
+        return jsonify({'success': True, 'pid': os.getpid(), 'tracing': True, 'frames': tracemalloc.get_traceback_limit()})
+
+    def tracemalloc_stop(self):
+        tracemalloc.stop()
+        self.last_snapshot = None
+        return jsonify({'success': True, 'pid': os.getpid(), 'tracing': False})
+
+    def tracemalloc_diff(self):
+        """Snapshot now and list the largest allocation changes since the previous snapshot"""
+        if not tracemalloc.is_tracing():
+            return jsonify({'success': False, 'error': 'tracemalloc is not running in this worker', 'pid': os.getpid()}), 409
+
+        group_by = request.args.get('group_by', 'lineno')
+        if group_by not in ('lineno', 'filename', 'traceback'):
+            return jsonify({'success': False, 'error': 'group_by must be lineno, filename or traceback'}), 400
+        limit = request.args.get('limit', 25, type=int)
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ])
+        previous, self.last_snapshot = self.last_snapshot, snapshot
+        current, peak = tracemalloc.get_traced_memory()
+
+        snapshot_id = uuid.uuid4().hex
+        snapshot.dump(os.path.join(self.directory, snapshot_id + '.tracemalloc'))
+        self._prune()
+
+        differences = snapshot.compare_to(previous, group_by) if previous else snapshot.statistics(group_by)
+        top = []
+        for stat in differences[:limit]:
+            frame = stat.traceback[0]
+            top.append({
+                'location': f'{frame.filename}:{frame.lineno}',
+                'size_bytes': stat.size,
+                'size_diff_bytes': getattr(stat, 'size_diff', stat.size),
+                'count': stat.count,
+                'count_diff': getattr(stat, 'count_diff', stat.count),
+            })
+
+        return jsonify({
+            'success': True,
+            'pid': os.getpid(),
+            'traced_current_bytes': current,
+            'traced_peak_bytes': peak,
+            'compared_to_previous': previous is not None,
+            'snapshot_id': snapshot_id,
+            'top': top,
+        })
+
+def init_profiling(app, token, directory=None):
+    """Register profiling hooks and admin routes on app (nothing is registered without a token)"""
+    if not token:
+        return None
+
+    try:
+        profiling = Profiling(token, directory)
+    except PermissionError as e:
+        print(f"[ERROR] Profiling disabled: {e}")
+        return None
+    app.before_request(profiling.before_request)
+    app.after_request(profiling.after_request)
+    app.teardown_request(profiling.teardown_request)
+
+    admin = profiling.require_admin
+    app.add_url_rule('/api/admin/profiles', 'list_profiles', admin(profiling.list_profiles))
+    app.add_url_rule('/api/admin/profiles/<profile_id>', 'download_profile', admin(profiling.download_profile))
+    app.add_url_rule('/api/admin/tracemalloc', 'tracemalloc_diff', admin(profiling.tracemalloc_diff))
+    app.add_url_rule('/api/admin/tracemalloc/start', 'tracemalloc_start', admin(profiling.tracemalloc_start), methods=['POST'])
+    app.add_url_rule('/api/admin/tracemalloc/stop', 'tracemalloc_stop', admin(profiling.tracemalloc_stop), methods=['POST'])
+    print(f"[INFO] Profiling hooks enabled (artifacts in {profiling.directory})")
+    return profiling
@@ -0,0 +1,270 @@
+"""
+Job Description Compaction for the Keyword Extraction Prompt
+Postings often wrap a few lines of requirements in pages of organisation
+boilerplate: mission statements, benefits, equal opportunity and how-to-apply
+text. None of it changes which volunteers match, but all of it is sent to the
+model on every keyword extraction. compact_description() shrinks a
+description before it is embedded in the prompt:
+
+1. Sections are found from their headings ("About us", "Requirements:",
+   "What we offer", ...), matched on whole words. Boilerplate sections are
+   dropped up to the next heading of any kind.
+2. Elsewhere, sentences that match boilerplate patterns (non-discrimination
+   clauses, "founded in", "shortlisted candidates will be contacted", ...)
+   are dropped, unless they name a skill from the taxonomy.
+3. A sentence that mentions a facet value (days, weekends or evenings,
+   remote or on-site work, a place) is never dropped as boilerplate, even
+   inside a boilerplate section: the auto filters are built from it.
+4. Repeated sentences and bullets are kept once.
+5. If the rest is still over the token budget, lines are kept by priority
+   (requirements, then responsibilities, then location and availability,
+   then anything else) until the budget is spent. The kept lines stay in
+   their original order.
+
+If nothing would be left, the description is used as it is. Tokens are
+counted with tiktoken when it is installed, otherwise estimated as one token
+per four characters.
+"""
+
+import re
+from facet_index import AUTO_IGNORED, LOCATION_ALIASES, normalize_availability, normalize_mode
+from skills_taxonomy import get_default_taxonomy
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_MAX_TOKENS = 600
+
+# Heading keywords (whole words; a plural "s" is allowed) -> section kind; the first match wins
+SECTION_KINDS = [
+    ('boilerplate', ('about us', 'about the organisation', 'about the organization', 'who we are', 'our mission',
+                     'mission', 'our story', 'our values', 'benefit', 'perk', 'what we offer', 'why join',
+                     'why volunteer with us', 'equal opportunity', 'eeo', 'diversity', 'inclusion', 'how to apply',
+                     'to apply', 'application process', 'disclaimer', 'privacy', 'safeguarding', 'compensation')),
+    ('requirements', ('requirement', 'qualification', 'skill', 'what you bring', 'what we are looking for',
+                      'what we\'re looking for', 'must have', 'nice to have', 'preferred', 'who you are',
+                      'eligibility', 'experience')),
+    ('responsibilities', ('responsibility', 'responsibilities', 'duties', 'what you will do', 'what you\'ll do',
+                          'role', 'task', 'job description', 'position', 'the opportunity')),
+    ('logistics', ('location', 'availability', 'schedule', 'time commitment', 'commitment', 'hour', 'duration')),
+]
+SECTION_PATTERNS = [
+    (kind, re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')s?\b'))
+    for kind, keywords in SECTION_KINDS
+]
+PRIORITY = {'requirements': 0, 'responsibilities': 1, 'logistics': 2, 'other': 3}
+
+BOILERPLATE_PATTERNS = re.compile('|'.join([
+    r'equal opportunit', r'discriminat', r'without regard to', r'regardless of (their )?(race|gender|age)',
+    r'reasonable accommodation', r'protected characteristic', r'veteran status', r'diversity, equity',
+    r'our mission', r'founded in', r'registered non-?profit', r'we believe (that )?every',
+    r'certificate of appreciation', r'letter of recommendation',
+    r'will be contacted', r'safeguarding polic', r'beneficiaries across',
+]), re.I)
+
+# Place names a sentence can mention without a preposition, and "in <Place>"
+PLACE_NAMES = sorted({name for pair in LOCATION_ALIASES.items() for name in pair if len(name) > 2 and '.' not in name})
+PLACE_PATTERN = re.compile(
+    r'(?i:\b(?:' + '|'.join(re.escape(name) for name in PLACE_NAMES) + r')\b)'
+    r'|\b(?i:in|near|based in|located in)\s+(?:the\s+)?[A-Z][a-z]+'
+)
+
+HEADING_PATTERN = re.compile(r'^\s*(?:#+\s*|\*\*)?([A-Za-z][A-Za-z &/\'-]{1,48}?)(?:\*\*)?\s*:?\s*(?:\*\*)?\s*$')
+INLINE_HEADING_PATTERN = re.compile(r'^\s*([A-Za-z][A-Za-z &/\'-]{1,30}):\s+(\S.*)$')
+BULLET_PATTERN = re.compile(r'^\s*(?:[-*•·]|\d+[.)])\s+')
+SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9])')
+
+_encoding = None
+
+def count_tokens(text):
+    """Prompt tokens in text (tiktoken when installed, otherwise about four characters per token)"""
+    global _encoding
+    if tiktoken is not None and _encoding is None:
+        try:
+            _encoding = tiktoken.get_encoding('o200k_base')
+        except Exception:  # e.g. the encoding file cannot be downloaded
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+def section_kind(heading):
+    heading = heading.lower()
+    for kind, pattern in SECTION_PATTERNS:
+        if pattern.search(heading):
+            return kind
+    return None
+
+def mentions_facets(unit):
+    """True if unit names an availability, volunteering mode or place the auto filters could use"""
+    if normalize_availability(unit) - AUTO_IGNORED['availability']:
+        return True
+    if normalize_mode(unit) - AUTO_IGNORED['mode']:
+        return True
+    return bool(PLACE_PATTERN.search(unit))
+
+def _heading(line):
+    """(kind, rest of the line) if line is a known section heading, else None"""
+    match = HEADING_PATTERN.match(line)
+    if match and len(match.group(1).split()) <= 6:
+        kind = section_kind(match.group(1))
+        if kind:
+            return kind, ''
+    match = INLINE_HEADING_PATTERN.match(line)
+    if match and len(match.group(1).split()) <= 4:
+        kind = section_kind(match.group(1))
+        if kind:
+            return kind, match.group(2)
+    return None
+
+def _unknown_heading(line):
+    """True if line looks like a heading: marked up (#, **, trailing colon) or in Title Case"""
+    match = HEADING_PATTERN.match(line)
+    if not match or len(match.group(1).split()) > 6:
+        return False
+    stripped = line.strip()
+    if stripped.startswith(('#', '**')) or stripped.endswith(':'):
+        return True
+    return all(word[0].isupper() for word in match.group(1).split() if len(word) > 3)
+
+def _units(line):
+    """A bullet stays whole; prose is split into sentences"""
+    if BULLET_PATTERN.match(line):
+        return [line.strip()]
+    return [sentence.strip() for sentence in SENTENCE_PATTERN.split(line.strip()) if sentence.strip()]
+
+def _dedupe_key(unit):
+    return ' '.join(re.findall(r'[a-z0-9+#]+', BULLET_PATTERN.sub('', unit).lower()))
+
+def compact_description(text, max_tokens=DEFAULT_MAX_TOKENS):
+    """
+    Compact a job description for the keyword extraction prompt
+
+    Args:
+        text (str): Job description
+        max_tokens (int): Token budget for the compacted description (None: no budget)
+
+    Returns:
+        dict: text, original_tokens, tokens, tokens_saved and the number of
+              units (sentences or bullets) dropped per reason
+    """
+    taxonomy = get_default_taxonomy()
+    dropped = {'boilerplate': 0, 'duplicates': 0, 'over_budget': 0}
+    seen = set()
+    lines = []  # [kind, heading or None, [units]] per output line, in order
+    kind = 'other'
+
+    for raw_line in str(text).splitlines():
+        if not raw_line.strip():
+            continue
+        heading = _heading(raw_line)
+        if heading:
+            kind, rest = heading
+            label = raw_line.split(':', 1)[0].strip() if rest else raw_line.strip()
+            if kind != 'boilerplate':
+                lines.append([kind, label.rstrip(':') + ':', []])
+            if not rest:
+                continue
+            raw_line = rest
+        elif kind == 'boilerplate' and _unknown_heading(raw_line):
+            kind = 'other'  # a boilerplate section ends at the next heading of any kind
+        units = _units(raw_line)
+        kept = []
+        line_kind = kind
+        for unit in units:
+            key = _dedupe_key(unit)
+            if key in seen:
+                dropped['duplicates'] += 1
+            elif mentions_facets(unit):
+                seen.add(key)
+                kept.append(unit)
+                if kind == 'boilerplate':
+                    line_kind = 'logistics'
+            elif kind == 'boilerplate' or (BOILERPLATE_PATTERNS.search(unit) and not taxonomy.find_skills(unit)):
+                dropped['boilerplate'] += 1
+            else:
+                seen.add(key)
+                kept.append(unit)
+        if kept:
+            if lines and lines[-1][0] == line_kind and not lines[-1][2] and lines[-1][1]:
+                lines[-1][2] = kept  # content of the heading just above
+            else:
+                lines.append([line_kind, None, kept])
+
+    lines = [line for line in lines if line[1] or line[2]]
+    if max_tokens is not None:
+        # Spend the budget on the most useful lines first
+        budget = max_tokens
+        keep = set()
+        for position in sorted(range(len(lines)), key=lambda i: (PRIORITY[lines[i][0]], i)):
+            cost = count_tokens(_render(lines[position])) + 1
+            if cost <= budget:
+                keep.add(position)
+                budget -= cost
+            else:
+                dropped['over_budget'] += len(lines[position][2])
+        lines = [line for position, line in enumerate(lines) if position in keep]
+
+    compacted = '\n'.join(_render(line) for line in lines)
+    original_tokens = count_tokens(str(text))
+    if not compacted.strip():
+        compacted = str(text)
+    tokens = count_tokens(compacted)
+    return {
+        'text': compacted,
+        'original_tokens': original_tokens,
+        'tokens': tokens,
+        'tokens_saved': max(original_tokens - tokens, 0),
+        'dropped': dropped,
+    }
+
+def _render(line):
+    _, heading, units = line
+    body = ' '.join(units)
+    return f'{heading}\n{body}' if heading and body else heading or body
+
+def test_compact_description():
+    """Test that boilerplate goes and everything that can affect matching stays"""
+    description = """About us
+We are a registered non-profit founded in 2010. Our mission is to empower communities.
+This is an unpaid remote weekend role in Pune.
+
+Project Details
+Build dashboards in Tableau for our field teams.
+
+Submission guidelines
+Share a short portfolio of past dashboards.
+
+Volunteers make a real difference here. To apply, write to us with your portfolio.
+We are an equal opportunity organisation and do not discriminate on any basis."""
+
+    result = compact_description(description)
+    text = result['text']
+    print(text)
+    print(result['dropped'])
+
+    # Facet values survive, even inside a boilerplate section
+    assert 'This is an unpaid remote weekend role in Pune.' in text
+    # A boilerplate section ends at the next heading, known or not
+    assert 'Build dashboards in Tableau for our field teams.' in text
+    # "mission" in "Submission" does not make a boilerplate section
+    assert 'Share a short portfolio of past dashboards.' in text
+    # Only the clearly boilerplate sentences go
+    assert 'Volunteers make a real difference here.' in text
+    assert 'To apply, write to us with your portfolio.' in text
+    assert 'founded in 2010' not in text
+    assert 'equal opportunity' not in text
+    assert result['dropped']['boilerplate'] == 3
+
+    assert section_kind('Roles and Responsibilities') == 'responsibilities'
+    assert section_kind('Controller') is None
+    assert section_kind('Our Mission') == 'boilerplate'
+    assert mentions_facets('Sessions run on Saturday mornings')
+    assert not mentions_facets('We believe in equality and dignity')
+
+    print("\nAll compaction checks passed")
+
+if __name__ == "__main__":
+    test_compact_description()
@@ -0,0 +1,80 @@
+"""
+Re-parse stored resumes
+Rebuilds every volunteer's resume-derived fields from the stored extracted text,
+without reading the original PDF/DOCX files again. Run this after improving the
+extraction rules in resume_parser.py (and bumping ResumeParser.PARSER_VERSION).
+"""
+
+import argparse
+import json
+from database import Database
+from resume_parser import ResumeParser
+
+# Volunteer fields that come from the resume text (the rest are left untouched)
+PARSED_FIELDS = ['name', 'email', 'phone', 'skills', 'experience', 'education', 'languages', 'certifications']
+
+def reparse_resumes(db, parser, force=False):
+    """
+    Re-run field extraction over all stored resume documents
+
+    Args:
+        db: Database instance
+        parser: ResumeParser instance
+        force: Re-parse documents already at the current parser version
+
+    Returns:
+        dict: Counts of reparsed, updated, skipped and failed documents
+    """
+    counts = {'reparsed': 0, 'updated': 0, 'skipped': 0, 'failed': 0}
+
+    for document in db.get_all_resume_documents():
+        if not force and document['parser_version'] == parser.PARSER_VERSION:
+            counts['skipped'] += 1
+            continue
+
+        volunteer_data = parser.parse_text(document['extracted_text'])
+        db.update_resume_parse(document['content_hash'], volunteer_data, parser.PARSER_VERSION)
+        counts['reparsed'] += 1
+
+        if not document['volunteer_id']:
+            continue
+
+        previous = json.loads(document['parsed_data'] or '{}')
+        changes = {
+            field: volunteer_data[field]
+            for field in PARSED_FIELDS
+            if volunteer_data.get(field) and volunteer_data[field] != previous.get(field)
+        }
+        # Never blank out an email the volunteer is keyed on
+        if not volunteer_data.get('email'):
+            changes.pop('email', None)
+
+        if not changes:
+            continue
+
+        if db.update_volunteer(document['volunteer_id'], changes):
+            counts['updated'] += 1
+            print(f"  [~] Updated: {volunteer_data['name']} ({', '.join(changes)})")
+        else:
+            counts['failed'] += 1
+            print(f"  [!] Could not update volunteer {document['volunteer_id']} (email conflict?)")
+
+    return counts
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Re-parse stored resumes')
+    arg_parser.add_argument('--db', default='volunteer_management.db', help='SQLite database file')
+    arg_parser.add_argument('--force', action='store_true',
+                            help='Re-parse documents already at the current parser version')
+    args = arg_parser.parse_args()
+
+    counts = reparse_resumes(Database(args.db), ResumeParser(), force=args.force)
+
+    print(f"\n[SUCCESS] Re-parse completed!")
+    print(f"  - Re-parsed: {counts['reparsed']} resumes")
+    print(f"  - Volunteers updated: {counts['updated']}")
+    print(f"  - Skipped (current version): {counts['skipped']}")
+    print(f"  - Failed: {counts['failed']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Conditional GET and Response Caching for Read Endpoints
+GET endpoints are tagged with the data versions of the tables they read
+(Database.get_data_versions). The version string is used as the ETag:
+
+- a request whose If-None-Match still matches gets 304 Not Modified without
+  the view running, so the tables aren't read at all
+- otherwise the rendered response body is kept in a small in-process LRU
+  keyed by (URL, Accept header, version), so repeated reads of unchanged data
+  skip the query, the encoding and (with a compressor) the compression
+
+Versions are stored in the database, so every worker process agrees on them
+and a write in one worker invalidates cached responses in all of them.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+from flask import Response, make_response, request
+
+class ResponseCache:
+    """Bounded LRU of rendered response bodies"""
+
+    def __init__(self, max_entries=256, compressor=None):
+        """
+        Args:
+            max_entries: Number of rendered responses to keep
+            compressor: Optional compressor(response, encoded_cache) applied to served
+                responses; it may store compressed bodies in encoded_cache for reuse
+        """
+        self.max_entries = max_entries
+        self.compressor = compressor
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+    def versioned(self, get_versions):
+        """
+        Decorator adding ETags, 304 responses and caching to a GET view
+
+        Args:
+            get_versions: Callable returning the {scope: version} dict the view depends on
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                versions = get_versions()
+                etag = '-'.join(f'{scope}.{version}' for scope, version in versions.items())
+
+                # Weak comparison, so compressed responses (weak ETags) revalidate too
+                if request.if_none_match.contains_weak(etag):
+                    response = Response(status=304)
+                    response.set_etag(etag)
+                else:
+                    key = (request.full_path, request.headers.get('Accept', ''), etag)
+                    entry = self.get(key)
+                    if entry is None:
+                        response = make_response(view(*args, **kwargs))
+                        if response.status_code != 200 or response.is_streamed:
+                            return response
+                        entry = {'body': response.get_data(), 'mimetype': response.mimetype, 'encoded': {}}
+                        self.put(key, entry)
+                    response = Response(entry['body'], mimetype=entry['mimetype'])
+                    response.set_etag(etag)
+                    if self.compressor:
+                        self.compressor(response, entry['encoded'])
+
+                # Clients may keep the body but must revalidate before reusing it
+                response.headers['Cache-Control'] = 'no-cache'
+                return response
+            return wrapper
+        return decorator
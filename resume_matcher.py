@@ -3,6 +3,12 @@ from typing import List, Dict, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from skills_taxonomy import get_default_taxonomy
+from tfidf_index import TfidfIndex
+
+# Volunteer fields that make up the text profile used for matching
+PROFILE_FIELDS = ['skills', 'experience', 'education', 'certifications',
+                  'interests', 'languages']
 
 class ResumeMatcher:
     """
@@ -10,13 +16,18 @@ class ResumeMatcher:
     Uses TF-IDF and cosine similarity for matching volunteers to job descriptions
     """
     
-    def __init__(self):
+    def __init__(self, taxonomy=None, index_settings=None):
+        # Shared skills taxonomy, also used by ResumeParser
+        self.taxonomy = taxonomy or get_default_taxonomy()
         self.vectorizer = TfidfVectorizer(
             lowercase=True,
             stop_words='english',
             ngram_range=(1, 2),
             max_features=1000
         )
+        self.profile_cache = {}  # volunteer id -> (raw profile fields, preprocessed profile)
+        # Optional resident index (MATCH_INDEX in config.py) instead of a refit per request
+        self.index = TfidfIndex(**index_settings) if index_settings is not None else None
     
     def preprocess_text(self, text):
         """Clean and preprocess text"""
@@ -28,48 +39,47 @@ class ResumeMatcher:
         return text.strip()
     
     def extract_keywords(self, text):
-        """Extract important keywords from text"""
+        """Extract known skills (canonical taxonomy names) from text"""
         if not text:
             return []
         
-        # Common tech skills and keywords
-        keywords = []
-        text_lower = text.lower()
-        
-        # Programming languages
-        prog_langs = ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 
-                     'swift', 'kotlin', 'go', 'rust', 'typescript', 'sql', 'r']
-        
-        # Frameworks and tools
-        frameworks = ['react', 'angular', 'vue', 'django', 'flask', 'spring', 
-                     'node.js', 'express', 'fastapi', 'tensorflow', 'pytorch']
-        
-        # Soft skills
-        soft_skills = ['leadership', 'communication', 'teamwork', 'problem solving',
-                      'analytical', 'creative', 'organized', 'detail-oriented']
-        
-        # Check for matches
-        all_terms = prog_langs + frameworks + soft_skills
-        for term in all_terms:
-            if term in text_lower:
-                keywords.append(term)
-        
-        return keywords
+        return self.taxonomy.find_skills(text)
     
     def create_volunteer_profile(self, volunteer):
         """Create a comprehensive text profile from volunteer data"""
-        profile_parts = []
+        # Profiles are cached per volunteer id and reused while the fields are unchanged
+        raw_fields = tuple(volunteer.get(field, '') for field in PROFILE_FIELDS)
+        volunteer_id = volunteer.get('id')
+        cached = self.profile_cache.get(volunteer_id)
+        if cached and cached[0] == raw_fields:
+            return cached[1]
         
-        fields = ['skills', 'experience', 'education', 'certifications', 
-                 'interests', 'languages']
+        profile_parts = []
         
-        for field in fields:
-            value = volunteer.get(field, '')
+        for value in raw_fields:
             if value and value != 'nan':
                 profile_parts.append(str(value))
         
-        profile = ' '.join(profile_parts)
-        return self.preprocess_text(profile)
+        profile = self.preprocess_text(' '.join(profile_parts))
+        if volunteer_id is not None:
+            self.profile_cache[volunteer_id] = (raw_fields, profile)
+        return profile
+    
+    def ingest_volunteers(self, volunteers):
+        """Refresh cached state for volunteers that were added or changed"""
+        for volunteer in volunteers:
+            self.profile_cache.pop(volunteer.get('id'), None)
+            self.create_volunteer_profile(volunteer)
+    
+    def cached_profiles(self):
+        """(volunteer id, profile) for every volunteer seen so far"""
+        return [(volunteer_id, cached[1]) for volunteer_id, cached in list(self.profile_cache.items())]
+    
+    def index_similarities(self, job_desc_clean, volunteers, volunteer_profiles):
+        """Cosine similarities from the resident index, updating it first"""
+        volunteer_ids = [volunteer.get('id') for volunteer in volunteers]
+        self.index.update(volunteer_ids, volunteer_profiles, self.cached_profiles)
+        return self.index.scores(job_desc_clean, volunteer_ids)
     
     def match_volunteers(self, volunteers: List[Dict], job_description: str, 
                         top_n: int = 10) -> List[Tuple[Dict, float, List[str]]]:
@@ -100,28 +110,30 @@ class ResumeMatcher:
         all_texts = [job_desc_clean] + volunteer_profiles
         
         try:
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            
-            # Calculate cosine similarity
-            job_vector = tfidf_matrix[0:1]
-            volunteer_vectors = tfidf_matrix[1:]
-            
-            similarities = cosine_similarity(job_vector, volunteer_vectors)[0]
+            if self.index is not None and all(volunteer.get('id') is not None for volunteer in volunteers):
+                similarities = self.index_similarities(job_desc_clean, volunteers, volunteer_profiles)
+            else:
+                tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+                
+                # Calculate cosine similarity
+                job_vector = tfidf_matrix[0:1]
+                volunteer_vectors = tfidf_matrix[1:]
+                
+                similarities = cosine_similarity(job_vector, volunteer_vectors)[0]
             
-            # Get matching keywords for each volunteer
+            # Take the top N by score first (stable, so ties keep their order),
+            # then get matching keywords for those volunteers only
+            top = np.argsort(-similarities, kind='stable')[:top_n]
             results = []
-            for idx, (volunteer, score) in enumerate(zip(volunteers, similarities)):
-                volunteer_profile = volunteer_profiles[idx]
+            for idx in top:
                 matching_skills = self.find_matching_skills(
                     job_desc_clean, 
-                    volunteer_profile, 
-                    volunteer
+                    volunteer_profiles[idx], 
+                    volunteers[idx]
                 )
-                results.append((volunteer, float(score), matching_skills))
+                results.append((volunteers[idx], float(similarities[idx]), matching_skills))
             
-            # Sort by score and return top N
-            results.sort(key=lambda x: x[1], reverse=True)
-            return results[:top_n]
+            return results
             
         except Exception as e:
             print(f"Error in matching: {e}")
@@ -1,150 +1,292 @@
 """
 Resume Parser - Extract data from PDF and DOCX resumes
-Extracts: Name, Email, Phone, Skills, Experience, Education
+Extracts: Name, Email, Phone, Skills, Experience, Education,
+Certifications, Languages
 """
 
 import re
 import PyPDF2
 import docx
 from io import BytesIO
+from skills_taxonomy import get_default_taxonomy
+
+# Section headings recognised by the segmenter, mapped to the section they open
+SECTION_ALIASES = {
+    'skills': 'skills', 'skill': 'skills', 'technical skills': 'skills',
+    'key skills': 'skills', 'core competencies': 'skills', 'expertise': 'skills',
+    'technologies': 'skills',
+    'experience': 'experience', 'work experience': 'experience',
+    'professional experience': 'experience', 'employment': 'experience',
+    'employment history': 'experience', 'work history': 'experience',
+    'education': 'education', 'academic': 'education', 'academics': 'education',
+    'academic background': 'education', 'qualification': 'education',
+    'qualifications': 'education',
+    'certifications': 'certifications', 'certification': 'certifications',
+    'certificates': 'certifications', 'licenses': 'certifications',
+    'languages': 'languages', 'language': 'languages',
+    # Sections we don't extract, but which must end the previous one
+    'projects': 'other', 'references': 'other', 'interests': 'other',
+    'hobbies': 'other', 'awards': 'other', 'summary': 'other',
+    'objective': 'other', 'profile': 'other', 'volunteering': 'other',
+}
+
+# A heading is a short line holding one alias, either alone ("EDUCATION") or
+# followed by a separator and inline content ("Skills: Python, SQL")
+SECTION_HEADING_PATTERN = re.compile(
+    r'[ \t#*•\-]*(' + '|'.join(sorted(map(re.escape, SECTION_ALIASES), key=len, reverse=True)) +
+    r')[ \t]*(?:(?:[:|]|(?<=[ \t])[-–—](?=[ \t]))[ \t]*(.*))?$',
+    re.IGNORECASE
+)
+MAX_HEADING_LINE_LENGTH = 200
+
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+MAX_EMAIL_TOKEN_LENGTH = 254
+
+PHONE_PATTERNS = [
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # +1-234-567-8900
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # (234) 567-8900
+    re.compile(r'\d{10}'),  # 2345678900
+    re.compile(r'\+?\d{1,3}\s?\d{10}'),  # +91 1234567890
+]
+NAME_PHONE_PATTERN = re.compile(r'\d{3}[-.\s]?\d{3}')
+
+YEARS_EXPERIENCE_PATTERN = re.compile(
+    r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)', re.IGNORECASE
+)
+DEGREE_PATTERN = re.compile(
+    r'(?:bachelor|master|phd|doctorate|mba|b\.?tech|m\.?tech|b\.?sc|m\.?sc|b\.?e|m\.?e)[^\n]*',
+    re.IGNORECASE
+)
+
+LIST_SEPARATOR_PATTERN = re.compile(r'[,;|\n•]')
+BULLET_CHARS = ' \t-*•·'
+
+# Once these sections (and an email) have been seen, later PDF pages are skipped
+EARLY_STOP_SECTIONS = ('skills', 'experience', 'education')
+
+def _as_stream(file_content):
+    """Wrap raw bytes in a stream; file objects are passed through"""
+    if isinstance(file_content, (bytes, bytearray)):
+        return BytesIO(file_content)
+    return file_content
 
 class ResumeParser:
-    def __init__(self):
-        # Common skills keywords
-        self.skills_keywords = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node',
-            'django', 'flask', 'spring', 'sql', 'mysql', 'postgresql', 'mongodb',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'git', 'html', 'css',
-            'php', 'ruby', 'go', 'rust', 'c++', 'c#', 'swift', 'kotlin',
-            'machine learning', 'ai', 'data science', 'tensorflow', 'pytorch',
-            'testing', 'qa', 'agile', 'scrum', 'devops', 'ci/cd', 'jenkins',
-            'wordpress', 'graphic design', 'ui/ux', 'figma', 'photoshop',
-            'digital marketing', 'seo', 'content writing', 'project management'
-        ]
-    
-    def extract_text_from_pdf(self, file_content):
-        """Extract text from PDF file"""
+    # Bump whenever the extraction rules change so stored resumes can be re-parsed
+    PARSER_VERSION = 3
+    
+    def __init__(self, taxonomy=None):
+        # Shared skills taxonomy (canonical names + aliases, compiled once)
+        self.taxonomy = taxonomy or get_default_taxonomy()
+    
+    def extract_text_from_pdf(self, file_content, max_pages=None):
+        """
+        Extract text from PDF file, page by page
+        
+        Stops after max_pages, or one page after the email and the skills,
+        experience and education headings have all been seen (the extra page
+        lets the last of those sections finish).
+        
+        Args:
+            file_content: File bytes or a binary file object
+            max_pages: Maximum number of pages to read (None for all)
+        """
         try:
-            pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            pdf_reader = PyPDF2.PdfReader(_as_stream(file_content))
+            pages = []
+            missing_sections = set(EARLY_STOP_SECTIONS)
+            email_found = False
+            fields_found = False
+            
+            for page_number, page in enumerate(pdf_reader.pages):
+                if max_pages and page_number >= max_pages:
+                    break
+                
+                page_text = page.extract_text() or ""
+                pages.append(page_text + "\n")
+                
+                if fields_found:
+                    break
+                email_found = email_found or bool(self.extract_email(page_text))
+                missing_sections -= self.find_section_headings(page_text)
+                fields_found = email_found and not missing_sections
+            
+            return "".join(pages)
         except Exception as e:
             print(f"Error reading PDF: {e}")
             return ""
     
     def extract_text_from_docx(self, file_content):
-        """Extract text from DOCX file"""
+        """Extract text from DOCX file (bytes or a binary file object)"""
         try:
-            doc = docx.Document(BytesIO(file_content))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            doc = docx.Document(_as_stream(file_content))
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         except Exception as e:
             print(f"Error reading DOCX: {e}")
             return ""
     
+    def find_section_headings(self, text):
+        """Names of the sections whose headings appear in text"""
+        found = set()
+        for line in text.split('\n'):
+            heading = self._match_heading(line)
+            if heading:
+                found.add(heading[0])
+        return found
+    
+    def _match_heading(self, line):
+        """(section, inline content) if line is a section heading, else None"""
+        if len(line) > MAX_HEADING_LINE_LENGTH:
+            return None
+        heading = SECTION_HEADING_PATTERN.match(line.rstrip())
+        if not heading:
+            return None
+        return SECTION_ALIASES[heading.group(1).lower()], heading.group(2)
+    
+    def segment_sections(self, text):
+        """
+        Split resume text into sections in a single pass over its lines
+        
+        Each line is tested once against a precompiled heading pattern, so the
+        cost is linear in the length of the text no matter how messy it is.
+        
+        Returns:
+            dict: section name -> section text ('header' holds everything
+            before the first recognised heading)
+        """
+        sections = {'header': []}
+        current = 'header'
+        
+        for line in text.split('\n'):
+            heading = self._match_heading(line)
+            
+            if heading:
+                current, inline = heading
+                sections.setdefault(current, [])
+                if inline:
+                    sections[current].append(inline)
+            else:
+                sections[current].append(line)
+        
+        return {name: '\n'.join(lines).strip() for name, lines in sections.items()}
+    
     def extract_email(self, text):
         """Extract email from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else ""
+        # Only tokens containing '@' can hold an address; this keeps the scan linear
+        for token in text.split():
+            if '@' in token:
+                email = EMAIL_PATTERN.search(token[:MAX_EMAIL_TOKEN_LENGTH])
+                if email:
+                    return email.group(0)
+        return ""
     
     def extract_phone(self, text):
         """Extract phone number from text"""
-        # Match various phone formats
-        phone_patterns = [
-            r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-234-567-8900
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (234) 567-8900
-            r'\d{10}',  # 2345678900
-            r'\+?\d{1,3}\s?\d{10}',  # +91 1234567890
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0]
+        for pattern in PHONE_PATTERNS:
+            phone = pattern.search(text)
+            if phone:
+                return phone.group(0)
         return ""
     
     def extract_name(self, text):
         """Extract name from resume (usually first line or after specific headers)"""
-        lines = text.split('\n')
+        lines = text.split('\n', 10)
         for line in lines[:10]:  # Check first 10 lines
             line = line.strip()
             if line and len(line) > 3 and len(line) < 50:
                 # Skip lines with email or phone
-                if '@' not in line and not re.search(r'\d{3}[-.\s]?\d{3}', line):
+                if '@' not in line and not NAME_PHONE_PATTERN.search(line):
                     # Check if it looks like a name (2-4 words, mostly alphabetic)
                     words = line.split()
                     if 1 <= len(words) <= 4 and all(word.replace('.', '').isalpha() for word in words):
                         return line
         return "Unknown"
     
-    def extract_skills(self, text):
+    def split_items(self, section_text, max_length=30):
+        """Split a list-style section (comma, bullet or line separated) into items"""
+        items = []
+        for item in LIST_SEPARATOR_PATTERN.split(section_text):
+            item = item.strip(BULLET_CHARS)
+            if 2 < len(item) <= max_length:
+                items.append(item)
+        return items
+    
+    def extract_skills(self, text, sections=None):
         """Extract skills from resume"""
-        text_lower = text.lower()
-        found_skills = []
+        if sections is None:
+            sections = self.segment_sections(text)
         
-        for skill in self.skills_keywords:
-            if skill in text_lower:
-                found_skills.append(skill.title())
+        found_skills = self.taxonomy.find_skills(text)
         
-        # Also look for skills section
-        skills_section_pattern = r'(?:skills?|technical skills?|expertise|technologies)[:\s]+(.*?)(?=\n\n|\n[A-Z]|$)'
-        skills_match = re.search(skills_section_pattern, text, re.IGNORECASE | re.DOTALL)
+        # Also use the skills section
+        found_skills.extend(self.split_items(sections.get('skills', '')))
         
-        if skills_match:
-            skills_text = skills_match.group(1)
-            # Extract comma-separated or bullet-pointed skills
-            additional_skills = re.findall(r'[•\-\*]?\s*([A-Za-z0-9+#.\s]{2,30})(?:[,\n]|$)', skills_text)
-            found_skills.extend([s.strip() for s in additional_skills if len(s.strip()) > 2])
-        
-        # Remove duplicates and return
-        return ', '.join(list(dict.fromkeys(found_skills))[:15])  # Limit to 15 skills
+        # Remove duplicates (case-insensitively) and return
+        unique_skills = {}
+        for skill in found_skills:
+            unique_skills.setdefault(skill.lower(), skill)
+        return ', '.join(list(unique_skills.values())[:15])  # Limit to 15 skills
     
-    def extract_experience(self, text):
+    def extract_experience(self, text, sections=None):
         """Extract experience summary"""
-        # Look for experience section
-        exp_pattern = r'(?:experience|work experience|employment)[:\s]+(.*?)(?=\n\n[A-Z]|education|skills|$)'
-        exp_match = re.search(exp_pattern, text, re.IGNORECASE | re.DOTALL)
+        if sections is None:
+            sections = self.segment_sections(text)
         
-        if exp_match:
-            exp_text = exp_match.group(1).strip()
+        exp_text = sections.get('experience', '')
+        if exp_text:
             # Limit to first 500 characters
-            return exp_text[:500] if exp_text else "Not specified"
+            return exp_text[:500]
         
         # Try to find years of experience
-        years_pattern = r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
-        years_match = re.search(years_pattern, text, re.IGNORECASE)
+        years_match = YEARS_EXPERIENCE_PATTERN.search(text)
         
         if years_match:
             return f"{years_match.group(1)} years of experience"
         
         return "Not specified"
     
-    def extract_education(self, text):
+    def extract_education(self, text, sections=None):
         """Extract education information"""
-        # Look for education section first
-        edu_section_pattern = r'(?:education|academic|qualification)[:\s]+(.*?)(?=\n\n|certification|language|reference|$)'
-        edu_match = re.search(edu_section_pattern, text, re.IGNORECASE | re.DOTALL)
+        if sections is None:
+            sections = self.segment_sections(text)
         
-        if edu_match:
-            edu_text = edu_match.group(1).strip()
+        edu_text = sections.get('education', '')
+        if edu_text:
             # Clean up and limit
             edu_lines = [line.strip() for line in edu_text.split('\n') if line.strip()][:3]
             return ' | '.join(edu_lines) if edu_lines else "Not specified"
         
         # Fallback: Look for degree keywords
-        degree_pattern = r'(?:bachelor|master|phd|doctorate|mba|b\.?tech|m\.?tech|b\.?sc|m\.?sc|b\.?e|m\.?e).*?(?=\n|$)'
-        degree_match = re.search(degree_pattern, text, re.IGNORECASE)
+        degree_match = DEGREE_PATTERN.search(text)
         
         if degree_match:
             return degree_match.group(0).strip()[:200]
         
         return "Not specified"
     
+    def extract_certifications(self, text, sections=None):
+        """Extract certifications from the certifications section"""
+        if sections is None:
+            sections = self.segment_sections(text)
+        
+        items = self.split_items(sections.get('certifications', ''), max_length=100)
+        return ', '.join(items[:10]) if items else "Not specified"
+    
+    def extract_languages(self, text, sections=None):
+        """Extract spoken languages from the languages section"""
+        if sections is None:
+            sections = self.segment_sections(text)
+        
+        items = self.split_items(sections.get('languages', ''))
+        return ', '.join(items[:10]) if items else "Not specified"
+    
+    def extract_text(self, file_content, filename, max_pages=None):
+        """Extract raw text based on file type (empty string if unsupported)"""
+        if filename.lower().endswith('.pdf'):
+            return self.extract_text_from_pdf(file_content, max_pages)
+        elif filename.lower().endswith(('.docx', '.doc')):
+            return self.extract_text_from_docx(file_content)
+        return ""
+    
     def parse_resume(self, file_content, filename):
         """
         Main function to parse resume and extract all information
@@ -156,28 +298,36 @@ class ResumeParser:
         Returns:
             Dictionary with extracted volunteer data
         """
-        # Extract text based on file type
-        if filename.lower().endswith('.pdf'):
-            text = self.extract_text_from_pdf(file_content)
-        elif filename.lower().endswith(('.docx', '.doc')):
-            text = self.extract_text_from_docx(file_content)
-        else:
-            return None
+        text = self.extract_text(file_content, filename)
         
         if not text:
             return None
         
+        return self.parse_text(text)
+    
+    def parse_text(self, text):
+        """
+        Extract all volunteer fields from already-extracted resume text
+        
+        Args:
+            text: Raw text of the resume
+        
+        Returns:
+            Dictionary with extracted volunteer data
+        """
+        sections = self.segment_sections(text)
+        
         # Extract all fields
         volunteer_data = {
             'name': self.extract_name(text),
             'email': self.extract_email(text),
             'phone': self.extract_phone(text),
-            'skills': self.extract_skills(text),
-            'experience': self.extract_experience(text),
-            'education': self.extract_education(text),
+            'skills': self.extract_skills(text, sections),
+            'experience': self.extract_experience(text, sections),
+            'education': self.extract_education(text, sections),
             'availability': 'Not specified',
-            'languages': 'Not specified',
-            'certifications': 'Not specified',
+            'languages': self.extract_languages(text, sections),
+            'certifications': self.extract_certifications(text, sections),
             'interests': 'Not specified'
         }
         
@@ -0,0 +1,239 @@
+"""
+Sandboxed Resume Parsing
+Runs ResumeParser in reusable worker subprocesses with a wall-clock timeout
+and an address-space cap, so a malformed or huge PDF can only take down its
+own worker (which is then restarted) instead of the web process.
+
+Uploads are spooled to a temporary file in fixed-size chunks with a size cap,
+hashing as they go, and the worker reads the file from disk.
+
+Workers speak a line-delimited JSON protocol over stdin/stdout:
+    request:  {"path": "...", "filename": "..."}
+    response: {"ok": true, "text": "...", "data": {...}} or {"ok": false, "error": "..."}
+"""
+
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
+CHUNK_SIZE = 64 * 1024
+
+class UploadTooLarge(Exception):
+    """The upload exceeded the configured size cap"""
+
+class ParseTimeout(Exception):
+    """The worker did not finish parsing within the time limit"""
+
+class ParseFailed(Exception):
+    """The worker crashed or hit its memory limit while parsing"""
+
+def spool_upload(stream, max_bytes, suffix=''):
+    """
+    Copy an upload stream to a temporary file in chunks
+
+    Args:
+        stream: Readable binary stream (e.g. FileStorage.stream)
+        max_bytes: Size cap; UploadTooLarge is raised once it is exceeded
+        suffix: File name suffix for the temporary file
+
+    Returns:
+        tuple: (temporary file path, SHA-256 hex digest of the content)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(prefix='resume_', suffix=suffix)
+
+    try:
+        with os.fdopen(fd, 'wb') as spool:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"Upload exceeds {max_bytes // (1024 * 1024)} MB limit")
+                digest.update(chunk)
+                spool.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+
+    return path, digest.hexdigest()
+
+class _Worker:
+    """One parser subprocess plus a thread reading its responses"""
+
+    def __init__(self, memory_limit_mb, max_pages):
+        command = [sys.executable, os.path.abspath(__file__), '--worker',
+                   '--memory-limit-mb', str(memory_limit_mb), '--max-pages', str(max_pages)]
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            text=True,
+            encoding='utf-8',
+        )
+        self.responses = queue.Queue()
+        self.reader = threading.Thread(target=self._read_responses, daemon=True)
+        self.reader.start()
+
+    def _read_responses(self):
+        for line in self.process.stdout:
+            self.responses.put(line)
+        self.responses.put(None)  # worker exited
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def parse(self, path, filename, timeout):
+        try:
+            self.process.stdin.write(json.dumps({'path': path, 'filename': filename}) + '\n')
+            self.process.stdin.flush()
+        except OSError:
+            raise ParseFailed("Parser worker is not accepting requests")
+
+        try:
+            line = self.responses.get(timeout=timeout)
+        except queue.Empty:
+            raise ParseTimeout(f"Parsing took longer than {timeout} seconds")
+
+        if line is None:
+            raise ParseFailed("Parser worker exited unexpectedly")
+        return json.loads(line)
+
+    def kill(self):
+        if self.is_alive():
+            self.process.kill()
+        self.process.wait()
+
+class SandboxedParser:
+    """
+    Pool of resource-limited parser subprocesses
+
+    Workers are started lazily and reused across requests. A worker that
+    times out or dies is killed and replaced on the next request. Workers are
+    tied to the process that started them, so after a fork each process
+    starts its own.
+    """
+
+    def __init__(self, pool_size=2, timeout_seconds=20, memory_limit_mb=512, max_pages=20):
+        self.pool_size = pool_size
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self._reset()
+
+    def _reset(self):
+        self._owner_pid = os.getpid()
+        self._idle = queue.Queue()
+        self._slots = threading.Semaphore(self.pool_size)
+
+    def _acquire_worker(self):
+        if self._owner_pid != os.getpid():
+            self._reset()
+
+        self._slots.acquire()
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            worker = None
+
+        if worker is None or not worker.is_alive():
+            try:
+                worker = _Worker(self.memory_limit_mb, self.max_pages)
+            except BaseException:
+                self._slots.release()
+                raise
+        return worker
+
+    def _release_worker(self, worker, healthy):
+        if healthy and worker.is_alive():
+            self._idle.put(worker)
+        else:
+            worker.kill()
+        self._slots.release()
+
+    def parse_file(self, path, filename):
+        """
+        Parse a resume file in a sandboxed worker
+
+        Returns:
+            tuple: (extracted text, volunteer data dict), or ("", None) when no
+            text could be extracted
+
+        Raises:
+            ParseTimeout: The worker exceeded the wall-clock timeout
+            ParseFailed: The worker crashed or ran out of memory
+        """
+        worker = self._acquire_worker()
+        healthy = False
+
+        try:
+            response = worker.parse(path, filename, self.timeout_seconds)
+            healthy = True
+        finally:
+            self._release_worker(worker, healthy)
+
+        if not response['ok']:
+            raise ParseFailed(response['error'])
+        return response['text'], response['data']
+
+    def close(self):
+        """Stop all idle workers"""
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                break
+
+def _limit_memory(memory_limit_mb):
+    if resource is None or not memory_limit_mb:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def run_worker(memory_limit_mb, max_pages):
+    """Worker main loop: read requests from stdin, write responses to stdout"""
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr  # keep parser print() output off the protocol stream
+
+    from resume_parser import ResumeParser
+    parser = ResumeParser()
+    _limit_memory(memory_limit_mb)
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            with open(request['path'], 'rb') as f:
+                text = parser.extract_text(f, request['filename'], max_pages=max_pages)
+            data = parser.parse_text(text) if text else None
+            response = {'ok': True, 'text': text, 'data': data}
+        except MemoryError:
+            response = {'ok': False, 'error': 'Parser memory limit exceeded'}
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+
+        protocol_out.write(json.dumps(response) + '\n')
+        protocol_out.flush()
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='Sandboxed resume parser worker')
+    arg_parser.add_argument('--worker', action='store_true', required=True)
+    arg_parser.add_argument('--memory-limit-mb', type=int, default=512)
+    arg_parser.add_argument('--max-pages', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    run_worker(args.memory_limit_mb, args.max_pages)
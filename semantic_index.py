@@ -0,0 +1,338 @@
+"""
+Latent Semantic Matching Engine
+An optional alternative to the exact TF-IDF cosine in ResumeMatcher, built
+entirely offline:
+
+1. TF-IDF over the volunteer profiles (larger vocabulary than the matcher's)
+2. Truncated SVD (LSA) down to about a hundred dimensions, so volunteers who
+   use related words ("ML" / "machine learning", "tutor" / "teaching") end
+   up close together
+3. Unit-length float32 vectors in a random-projection LSH index: each table
+   hashes a vector to the signs of `bits` random projections; a query only
+   scores the volunteers in its buckets (plus `probes` neighbouring buckets
+   per table), instead of the whole pool
+
+More tables and probes raise recall and cost; more bits make buckets
+smaller and queries faster. `exact=True` scores every volunteer, which
+benchmark_semantic.py uses as the reference for recall.
+
+Volunteers added or edited after the build are folded in: projected with
+the existing vocabulary and SVD basis and added to the buckets. Once the
+folded-in share passes `refit_ratio` the model is refit on the next sync.
+"""
+
+import threading
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+class SemanticIndex:
+    def __init__(self, matcher, dimensions=128, max_features=20000, tables=16, bits=None,
+                 probes=2, refit_ratio=0.25, seed=0):
+        """
+        Args:
+            matcher: ResumeMatcher whose volunteer profiles and skill matching are reused
+            dimensions: LSA dimensions (capped by corpus size)
+            max_features: TF-IDF vocabulary size before the SVD
+            tables: Number of LSH hash tables
+            bits: Random projections (hash bits) per table (default: about 32 volunteers per bucket)
+            probes: Extra buckets visited per table, flipping the least certain bits
+            refit_ratio: Refit once folded-in volunteers exceed this share of the pool
+            seed: Random seed for the SVD and the projections
+        """
+        self.matcher = matcher
+        self.dimensions = dimensions
+        self.max_features = max_features
+        self.tables = tables
+        self.bits_setting = bits
+        self.bits = bits or 8
+        self.probes = probes
+        self.refit_ratio = refit_ratio
+        self.seed = seed
+        self.vectorizer = None
+        self.svd = None
+        self.planes = None
+        self.synced_version = None  # data version of the last sync()
+        self._lock = threading.RLock()
+        self._reset()
+
+    def __getstate__(self):
+        # Spilled by tenants.py without the lock or the shared matcher
+        state = self.__dict__.copy()
+        del state['_lock']
+        del state['matcher']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self.matcher = None  # re-attached by the owner
+
+    def _reset(self):
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.codes = np.zeros((0, self.tables), dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)
+        self.size = 0
+        self.ids = []      # row -> volunteer id
+        self.rows = {}     # volunteer id -> row
+        self.profiles = {}  # volunteer id -> profile text the row was built from
+        self.buckets = [{} for _ in range(self.tables)]  # per table: hash code -> list of rows
+        self.built_count = 0
+        self.folded_in = 0
+
+    @property
+    def built(self):
+        return self.svd is not None
+
+    # Model
+
+    def embed(self, texts):
+        """Unit-length LSA vectors (float32) for the given texts"""
+        reduced = self.svd.transform(self.vectorizer.transform(texts))
+        return normalize(reduced).astype(np.float32)
+
+    def _hash(self, vectors):
+        """(n, tables) hash codes, plus the raw projections used for multi-probe"""
+        projections = (vectors @ self.planes).reshape(len(vectors), self.tables, self.bits)
+        codes = (projections > 0).astype(np.int64) @ (1 << np.arange(self.bits, dtype=np.int64))
+        return codes, projections
+
+    def build(self, volunteers):
+        """
+        Fit the vocabulary and SVD on these volunteers and index them
+
+        Returns:
+            bool: False if the pool is too small for a useful model
+        """
+        with self._lock:
+            profiles = [self.matcher.create_volunteer_profile(volunteer) for volunteer in volunteers]
+            vectorizer = TfidfVectorizer(
+                lowercase=True,
+                stop_words='english',
+                ngram_range=(1, 2),
+                max_features=self.max_features,
+                sublinear_tf=True,
+                dtype=np.float32
+            )
+            try:
+                matrix = vectorizer.fit_transform(profiles)
+            except ValueError:  # empty vocabulary
+                return False
+            components = min(self.dimensions, matrix.shape[1] - 1, matrix.shape[0] - 1)
+            if components < 2:
+                return False
+
+            self.vectorizer = vectorizer
+            self.svd = TruncatedSVD(n_components=components, random_state=self.seed).fit(matrix)
+            self.bits = self.bits_setting or int(np.clip(np.round(np.log2(len(volunteers) / 32)), 4, 16))
+            rng = np.random.default_rng(self.seed)
+            self.planes = rng.standard_normal((components, self.tables * self.bits)).astype(np.float32)
+
+            self._reset()
+            self.vectors = np.zeros((max(len(volunteers), 16), components), dtype=np.float32)
+            self.codes = np.zeros((len(self.vectors), self.tables), dtype=np.int64)
+            self.active = np.zeros(len(self.vectors), dtype=bool)
+            vectors = normalize(self.svd.transform(matrix)).astype(np.float32)
+            self._add([volunteer.get('id') for volunteer in volunteers], profiles, vectors)
+            self.built_count = len(volunteers)
+            print(f"[INFO] Semantic index built: {len(volunteers)} volunteers, "
+                  f"{matrix.shape[1]} terms -> {components} dimensions")
+            return True
+
+    # Rows and buckets
+
+    def _grow(self, needed):
+        if needed <= len(self.vectors):
+            return
+        capacity = max(needed, len(self.vectors) * 2)
+        for name in ('vectors', 'codes', 'active'):
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def _unbucket(self, row):
+        for table, code in enumerate(self.codes[row]):
+            bucket = self.buckets[table].get(int(code))
+            if bucket is not None:
+                bucket.remove(row)
+
+    def _add(self, volunteer_ids, profiles, vectors):
+        codes, _ = self._hash(vectors)
+        for volunteer_id, profile, vector, code in zip(volunteer_ids, profiles, vectors, codes):
+            row = self.rows.get(volunteer_id)
+            if row is None:
+                row = self.size
+                self._grow(row + 1)
+                self.size += 1
+                self.ids.append(volunteer_id)
+                self.rows[volunteer_id] = row
+            else:
+                self._unbucket(row)
+            self.vectors[row] = vector
+            self.codes[row] = code
+            self.active[row] = True
+            self.profiles[volunteer_id] = profile
+            for table, table_code in enumerate(code):
+                self.buckets[table].setdefault(int(table_code), []).append(row)
+
+    def ingest(self, volunteers):
+        """
+        Fold in volunteers that were added or whose profile changed
+
+        Returns:
+            int: Number of volunteers folded in
+        """
+        with self._lock:
+            if not self.built:
+                return 0
+            changed, profiles = [], []
+            for volunteer in volunteers:
+                volunteer_id = volunteer.get('id')
+                profile = self.matcher.create_volunteer_profile(volunteer)
+                if volunteer_id is None or self.profiles.get(volunteer_id) == profile:
+                    continue
+                changed.append(volunteer_id)
+                profiles.append(profile)
+            if changed:
+                self._add(changed, profiles, self.embed(profiles))
+                self.folded_in += len(changed)
+            return len(changed)
+
+    def remove(self, volunteer_ids):
+        with self._lock:
+            for volunteer_id in volunteer_ids:
+                row = self.rows.pop(volunteer_id, None)
+                if row is None:
+                    continue
+                self._unbucket(row)
+                self.active[row] = False
+                self.profiles.pop(volunteer_id, None)
+
+    def sync(self, volunteers, version=None):
+        """
+        Bring the index in line with exactly this list of volunteers
+
+        Builds the model on first use, refits once too much has been folded
+        in, and otherwise folds in changes and drops removed volunteers.
+
+        Args:
+            version: Data version the list is at least as new as; when it equals
+                the version of the last sync, the O(N) comparison is skipped
+
+        Returns:
+            bool: True if the index is usable
+        """
+        with self._lock:
+            if self.built and version is not None and version == self.synced_version:
+                return True
+            if not self.built or self.folded_in > self.refit_ratio * max(self.built_count, 1):
+                built = self.build(volunteers)
+                self.synced_version = version if built else None
+                return built
+            self.ingest(volunteers)
+            current = {volunteer.get('id') for volunteer in volunteers}
+            stale = [volunteer_id for volunteer_id in self.rows if volunteer_id not in current]
+            if stale:
+                self.remove(stale)
+            self.synced_version = version
+            return True
+
+    # Queries
+
+    def _candidates(self, query, probes):
+        codes, projections = self._hash(query[None, :])
+        rows = []
+        for table in range(self.tables):
+            code = int(codes[0, table])
+            keys = [code]
+            # Multi-probe: also visit the buckets across the hyperplanes the query is closest to
+            for bit in np.argsort(np.abs(projections[0, table]))[:probes]:
+                keys.append(code ^ (1 << int(bit)))
+            for key in keys:
+                rows.extend(self.buckets[table].get(key, ()))
+        return np.unique(np.array(rows, dtype=np.int64))
+
+    def search(self, text, top_n=10, volunteer_ids=None, exact=False, probes=None):
+        """
+        Nearest volunteers to a text
+
+        Args:
+            text: Query text (a job description)
+            top_n: Number of results
+            volunteer_ids: Only consider these volunteers (default: all)
+            exact: Score every eligible volunteer instead of the LSH candidates
+            probes: Override the configured multi-probe count
+
+        Returns:
+            tuple: ([(volunteer id, cosine similarity)], number of volunteers scored)
+        """
+        with self._lock:
+            query = self.embed([text])[0]
+            eligible = self.active[:self.size].copy()
+            if volunteer_ids is not None:
+                allowed = np.zeros(self.size, dtype=bool)
+                allowed[[self.rows[volunteer_id] for volunteer_id in volunteer_ids if volunteer_id in self.rows]] = True
+                eligible &= allowed
+
+            rows = None
+            if not exact:
+                rows = self._candidates(query, self.probes if probes is None else probes)
+                rows = rows[eligible[rows]]
+                if len(rows) < top_n:
+                    rows = None  # too few candidates: fall back to scoring everyone eligible
+            if rows is None:
+                rows = np.flatnonzero(eligible)
+            if not len(rows):
+                return [], 0
+
+            scores = self.vectors[rows] @ query
+            top = np.argpartition(-scores, min(top_n, len(rows)) - 1)[:top_n]
+            top = top[np.argsort(-scores[top])]
+            return [(self.ids[rows[i]], float(scores[i])) for i in top], len(rows)
+
+    def shortlist_volunteers(self, volunteers, job_description, min_score=0.1, max_results=10,
+                             exact=False, probes=None):
+        """
+        Same result shape as ResumeMatcher.shortlist_volunteers, ranked by LSA similarity
+
+        Args:
+            volunteers: Eligible volunteers (already filtered); the index must be synced
+        """
+        by_id = {volunteer.get('id'): volunteer for volunteer in volunteers}
+        volunteer_ids = None if len(by_id) >= len(self.rows) else list(by_id)
+        matches, scored = self.search(job_description, max_results, volunteer_ids, exact, probes)
+
+        job_desc_clean = self.matcher.preprocess_text(job_description)
+        shortlisted = []
+        for volunteer_id, score in matches:
+            volunteer = by_id.get(volunteer_id)
+            if volunteer is None or score < min_score:
+                continue
+            profile = self.matcher.create_volunteer_profile(volunteer)
+            shortlisted.append({
+                'volunteer': volunteer,
+                'match_score': round(score * 100, 2),
+                'matching_skills': self.matcher.find_matching_skills(job_desc_clean, profile, volunteer)
+            })
+        print(f"[MATCHER] Semantic search scored {scored} of {len(by_id)} volunteers")
+        return shortlisted
+
+    def stats(self):
+        with self._lock:
+            if not self.built:
+                return {'built': False}
+            sizes = [len(bucket) for table in self.buckets for bucket in table.values() if bucket]
+            return {
+                'built': True,
+                'volunteers': len(self.rows),
+                'dimensions': self.svd.n_components,
+                'terms': len(self.vectorizer.vocabulary_),
+                'tables': self.tables,
+                'bits': self.bits,
+                'probes': self.probes,
+                'folded_in': self.folded_in,
+                'vector_bytes': int(self.vectors[:self.size].nbytes),
+                'avg_bucket_size': round(sum(sizes) / len(sizes), 1) if sizes else 0,
+            }
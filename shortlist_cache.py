@@ -0,0 +1,90 @@
+"""
+Shortlist Result Cache
+POST /api/shortlist is a read as far as matching goes: the same description
+and options against an unchanged volunteer pool give the same ranking. This
+cache keeps two kinds of entries in one byte-bounded LRU:
+
+- keyword extractions, keyed by the normalized job description, so a
+  repeated description skips the keyword extraction call
+- ranked results (full rows of the top-k, scores, matching skills, filters),
+  keyed by the normalized description, the extracted keywords, every option
+  that affects matching, and the volunteer data version (epoch, volunteers)
+
+Any Database write that changes volunteers bumps that version, so later
+requests build a different key and stale results are never served. The old
+entries simply age out of the LRU. Entry sizes are measured as pickled
+bytes, which approximates their memory.
+"""
+
+import pickle
+import threading
+from collections import OrderedDict
+
+def normalize_description(text):
+    """Collapse whitespace so re-pasted descriptions hit the same entries"""
+    return ' '.join(str(text).split())
+
+class ShortlistCache:
+    """Byte-bounded LRU of keyword extractions and ranked shortlists"""
+
+    KINDS = ('keywords', 'results')
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Total size of cached entries (0 disables the cache)
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # (kind, key) -> (value, size)
+        self.bytes = 0
+        self.counts = {kind: {'hits': 0, 'misses': 0} for kind in self.KINDS}
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, kind, key):
+        with self._lock:
+            entry = self.entries.get((kind, key))
+            if entry is None:
+                self.counts[kind]['misses'] += 1
+                return None
+            self.entries.move_to_end((kind, key))
+            self.counts[kind]['hits'] += 1
+            return entry[0]
+
+    def put(self, kind, key, value):
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self.entries.pop((kind, key), None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.entries[(kind, key)] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            kinds = {}
+            for kind, counts in self.counts.items():
+                lookups = counts['hits'] + counts['misses']
+                kinds[kind] = {
+                    **counts,
+                    'hit_rate': round(counts['hits'] / lookups, 4) if lookups else None,
+                    'entries': sum(1 for entry_kind, _ in self.entries if entry_kind == kind),
+                }
+            return {
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'entries': len(self.entries),
+                'evictions': self.evictions,
+                **kinds,
+            }
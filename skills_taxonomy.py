@@ -0,0 +1,140 @@
+"""
+Skills Taxonomy - canonical skill names and aliases shared by the resume
+parser and the matcher
+
+All aliases are compiled into one Aho-Corasick automaton, so finding every
+skill in a document is a single pass over the text whose cost does not grow
+with the number of skills in the taxonomy.
+"""
+
+import json
+import os
+from collections import deque
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills_taxonomy.json')
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+def normalize_text(text):
+    """Lowercase and collapse whitespace, the form the automaton is matched against"""
+    return ' '.join(str(text).lower().split())
+
+class SkillsTaxonomy:
+    """
+    Loadable skills taxonomy compiled into a multi-pattern automaton
+
+    Matches respect word boundaries: an alias that starts (or ends) with a
+    letter or digit only matches when the neighbouring character is not one,
+    so 'go' does not match inside 'django' and 'r' does not match inside 'rust'.
+    """
+
+    def __init__(self, skills):
+        """
+        Args:
+            skills: List of dicts with 'name', optional 'category' and 'aliases'
+        """
+        self.skills = []
+        self.categories = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for skill in skills:
+            self._add_skill(skill['name'], skill.get('aliases', []), skill.get('category'))
+
+        self._build_failure_links()
+
+    @classmethod
+    def load(cls, path=DEFAULT_TAXONOMY_PATH):
+        """Load a taxonomy from a JSON file ({"skills": [{"name", "aliases", "category"}]})"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['skills'])
+
+    def _add_skill(self, name, aliases, category):
+        """Add a skill and its aliases to the trie"""
+        skill_id = len(self.skills)
+        self.skills.append(name)
+        self.categories[name] = category
+
+        for term in {normalize_text(name), *(normalize_text(alias) for alias in aliases)}:
+            if term:
+                self._insert(term, skill_id)
+
+    def _insert(self, term, skill_id):
+        state = 0
+        for ch in term:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append((len(term), skill_id,
+                                    _is_word_char(term[0]), _is_word_char(term[-1])))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_matches(self, text):
+        """
+        Find skill mentions in text
+
+        Returns:
+            list: (skill_name, start, end) tuples on the normalized text,
+            leftmost-longest and non-overlapping
+        """
+        text = normalize_text(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        text_length = len(text)
+        candidates = []
+        state = 0
+
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for length, skill_id, word_start, word_end in output[state]:
+                start = i - length + 1
+                if word_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if word_end and i + 1 < text_length and _is_word_char(text[i + 1]):
+                    continue
+                candidates.append((start, -length, skill_id))
+
+        matches = []
+        covered_until = 0
+        for start, negative_length, skill_id in sorted(candidates):
+            if start >= covered_until:
+                matches.append((self.skills[skill_id], start, start - negative_length))
+                covered_until = start - negative_length
+        return matches
+
+    def find_skills(self, text):
+        """Canonical names of all skills mentioned in text, in order of first mention"""
+        return list(dict.fromkeys(name for name, _, _ in self.find_matches(text)))
+
+_default_taxonomy = None
+
+def get_default_taxonomy():
+    """The taxonomy loaded from skills_taxonomy.json (compiled once per process)"""
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        _default_taxonomy = SkillsTaxonomy.load()
+    return _default_taxonomy
@@ -0,0 +1,169 @@
+"""
+Local Stub for the Azure OpenAI Chat Completions API
+Stands in for the endpoint KeywordExtractor calls, so the app can be load
+tested without network access or Azure quota:
+
+    python stub_openai_server.py --port 8099 --latency-ms 800 --latency-dist lognormal --error-rate 0.02
+    AZURE_OPENAI_ENDPOINT=http://127.0.0.1:8099 python app.py
+
+Every POST to .../chat/completions is answered after a delay drawn from the
+chosen latency distribution. A fraction of requests (--error-rate) fail with
+--error-status instead. The reply content is the JSON object KeywordExtractor
+expects: canned from --response-file, or built from the skills and words in
+the job description of the prompt.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from skills_taxonomy import get_default_taxonomy
+
+JOB_DESCRIPTION_PATTERN = re.compile(r'JOB DESCRIPTION:\s*(.*?)\s*Extract and return', re.S)
+STOP_WORDS = {'with', 'and', 'the', 'for', 'looking', 'experience', 'in', 'of', 'to', 'a', 'an',
+              'we', 'are', 'our', 'who', 'will', 'you', 'your', 'have', 'has', 'must', 'should'}
+
+class StubSettings:
+    def __init__(self, latency_ms=500, latency_dist='fixed', latency_spread=0.5,
+                 error_rate=0.0, error_status=500, canned_response=None, seed=None):
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.canned_response = canned_response
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def draw_latency(self):
+        """Response delay in seconds"""
+        with self.lock:
+            if self.latency_dist == 'uniform':
+                # latency_spread is the +/- fraction around latency_ms
+                delay = self.latency_ms * self.rng.uniform(1 - self.latency_spread, 1 + self.latency_spread)
+            elif self.latency_dist == 'lognormal':
+                # latency_ms is the median, latency_spread the sigma of the log
+                delay = self.latency_ms * self.rng.lognormvariate(0, self.latency_spread)
+            else:
+                delay = self.latency_ms
+        return max(delay, 0) / 1000
+
+    def should_fail(self):
+        with self.lock:
+            self.requests += 1
+            failed = self.rng.random() < self.error_rate
+            self.errors += failed
+            return failed
+
+def build_keywords(prompt):
+    """KeywordExtractor-style keyword JSON from the job description in the prompt"""
+    match = JOB_DESCRIPTION_PATTERN.search(prompt)
+    job_description = match.group(1) if match else prompt
+    skills = get_default_taxonomy().find_skills(job_description)
+    words = [word for word in re.findall(r'[a-z][a-z+#.-]{2,}', job_description.lower())
+             if word not in STOP_WORDS]
+    return {
+        'skills': skills,
+        'experience_keywords': [word for word in words if word in ('senior', 'junior', 'years', 'lead')],
+        'education_keywords': [word for word in words if word in ('degree', 'bachelor', 'master', 'phd')],
+        'location_keywords': [word for word in words if word in ('remote', 'onsite', 'hybrid')],
+        'availability_keywords': [word for word in words if word in ('part-time', 'full-time', 'weekends')],
+        'all_keywords': list(dict.fromkeys([skill.lower() for skill in skills] + words)),
+    }
+
+def make_handler(settings):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # keep load tests quiet
+
+        def _send_json(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._send_json(200, {'requests': settings.requests, 'errors': settings.errors})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+
+            if not self.path.split('?')[0].endswith('/chat/completions'):
+                self._send_json(404, {'error': {'code': 'NotFound', 'message': self.path}})
+                return
+
+            time.sleep(settings.draw_latency())
+
+            if settings.should_fail():
+                headers = {'Retry-After': '1'} if settings.error_status == 429 else None
+                self._send_json(settings.error_status, {
+                    'error': {'code': str(settings.error_status), 'message': 'Injected stub error'}
+                }, headers)
+                return
+
+            prompt = ' '.join(message.get('content', '') for message in request.get('messages', []))
+            keywords = settings.canned_response or build_keywords(prompt)
+            content = json.dumps(keywords)
+            self._send_json(200, {
+                'id': f'chatcmpl-{uuid.uuid4().hex[:24]}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': request.get('model', 'stub'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop',
+                }],
+                'usage': {
+                    'prompt_tokens': len(prompt) // 4,
+                    'completion_tokens': len(content) // 4,
+                    'total_tokens': (len(prompt) + len(content)) // 4,
+                },
+            })
+
+    return Handler
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Local stub of the Azure OpenAI chat completions API')
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8099)
+    arg_parser.add_argument('--latency-ms', type=float, default=500,
+                            help='Fixed delay, uniform centre or lognormal median (ms)')
+    arg_parser.add_argument('--latency-dist', choices=['fixed', 'uniform', 'lognormal'], default='fixed')
+    arg_parser.add_argument('--latency-spread', type=float, default=0.5,
+                            help='uniform: +/- fraction of the centre; lognormal: sigma')
+    arg_parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests that fail')
+    arg_parser.add_argument('--error-status', type=int, default=500, help='HTTP status of injected failures')
+    arg_parser.add_argument('--response-file', help='JSON file returned as the keyword extraction result')
+    arg_parser.add_argument('--seed', type=int)
+    args = arg_parser.parse_args()
+
+    canned_response = None
+    if args.response_file:
+        with open(args.response_file) as f:
+            canned_response = json.load(f)
+
+    settings = StubSettings(args.latency_ms, args.latency_dist, args.latency_spread,
+                            args.error_rate, args.error_status, canned_response, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(settings))
+    server.daemon_threads = True
+    print(f"[INFO] Stub Azure OpenAI endpoint at http://{args.host}:{args.port} "
+          f"({args.latency_dist} {args.latency_ms:g} ms, error rate {args.error_rate:g})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n[INFO] Stub stopped after {settings.requests} requests ({settings.errors} injected errors).")
+
+if __name__ == "__main__":
+    main()
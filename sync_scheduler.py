@@ -0,0 +1,250 @@
+"""
+Background Google Sheets Sync Scheduler
+Keeps any number of registered worksheets in sync from a background thread,
+either inside the web app process or as a standalone sidecar:
+
+    python sync_scheduler.py <sheet url or id> [--worksheet "Form Responses 1"]
+
+Polling is adaptive. Before syncing, each job asks Drive for the spreadsheet's
+last-modified time (one cheap metadata call). If it hasn't changed the sync is
+skipped and the job's interval backs off towards `max_interval`; when a change
+is found the interval drops back to `min_interval`, so active edit periods are
+followed closely. Listeners are told which volunteers changed after each sync.
+"""
+
+import itertools
+import threading
+import time
+from datetime import datetime
+
+class SheetJob:
+    """Schedule and status of one registered worksheet"""
+
+    def __init__(self, job_id, sheet_url_or_id, worksheet_name, interval):
+        self.job_id = job_id
+        self.sheet_url_or_id = sheet_url_or_id
+        self.worksheet_name = worksheet_name
+        self.interval = interval
+        self.next_run = time.monotonic()
+        self.last_revision = None
+        self.last_checked_at = None
+        self.last_synced_at = None
+        self.last_result = None
+        self.last_error = None
+        self.last_duration_ms = None
+        self.checks = 0
+        self.syncs = 0
+        self.skipped = 0
+
+    def to_dict(self):
+        result = dict(self.last_result or {})
+        result.pop('changed_ids', None)
+        return {
+            'job_id': self.job_id,
+            'sheet': self.sheet_url_or_id,
+            'worksheet': self.worksheet_name,
+            'interval_seconds': round(self.interval, 1),
+            'next_run_in_seconds': round(max(self.next_run - time.monotonic(), 0), 1),
+            'last_checked_at': self.last_checked_at,
+            'last_synced_at': self.last_synced_at,
+            'last_revision': self.last_revision,
+            'last_result': result or None,
+            'last_error': self.last_error,
+            'last_duration_ms': self.last_duration_ms,
+            'checks': self.checks,
+            'syncs': self.syncs,
+            'skipped_unchanged': self.skipped,
+        }
+
+class SyncScheduler:
+    def __init__(self, syncer, min_interval=30, max_interval=900, backoff=2.0):
+        """
+        Args:
+            syncer: GoogleSheetSync used for revision checks and syncs
+            min_interval: Polling interval (seconds) while the sheet is being edited
+            max_interval: Longest interval the backoff grows to
+            backoff: Interval multiplier after a poll that found no change
+        """
+        self.syncer = syncer
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jobs = {}
+        self.listeners = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+    def register(self, sheet_url_or_id, worksheet_name='Sheet1', job_id=None):
+        """
+        Add a worksheet to keep in sync (due immediately); returns its job id
+
+        Args:
+            job_id: Id to use (e.g. the id the worksheet is stored under); default: the next free one
+        """
+        with self._lock:
+            for job in self.jobs.values():
+                if (job.sheet_url_or_id, job.worksheet_name) == (sheet_url_or_id, worksheet_name):
+                    return job.job_id
+            if job_id is None:
+                job_id = next(self._ids)
+                while job_id in self.jobs:
+                    job_id = next(self._ids)
+            job = SheetJob(job_id, sheet_url_or_id, worksheet_name, self.min_interval)
+            self.jobs[job.job_id] = job
+            self._wakeup.notify()
+            return job.job_id
+
+    def unregister(self, job_id):
+        """Stop syncing a worksheet"""
+        with self._lock:
+            return self.jobs.pop(job_id, None) is not None
+
+    def add_listener(self, listener):
+        """Call listener(changed_volunteer_ids) after every sync that changed rows"""
+        self.listeners.append(listener)
+
+    def start(self):
+        """Run the scheduler in a daemon thread"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='sheet-sync-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        """Stop the scheduler thread (a sync in progress is allowed to finish)"""
+        with self._lock:
+            self._running = False
+            self._wakeup.notify()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_now(self, job_id=None):
+        """Make one job (or all jobs) due immediately"""
+        with self._lock:
+            for job in self.jobs.values():
+                if job_id is None or job.job_id == job_id:
+                    job.next_run = time.monotonic()
+            self._wakeup.notify()
+
+    def status(self):
+        """Scheduler settings and per-job sync status"""
+        with self._lock:
+            jobs = [job.to_dict() for job in self.jobs.values()]
+        return {
+            'running': self._running,
+            'min_interval_seconds': self.min_interval,
+            'max_interval_seconds': self.max_interval,
+            'jobs': jobs,
+        }
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while self._running:
+                    now = time.monotonic()
+                    due = [job for job in self.jobs.values() if job.next_run <= now]
+                    if due:
+                        break
+                    next_run = min((job.next_run for job in self.jobs.values()), default=now + self.max_interval)
+                    self._wakeup.wait(next_run - now)
+                if not self._running:
+                    return
+
+            for job in due:
+                self.poll(job)
+
+    def _revision(self, job):
+        """Spreadsheet last-modified time, or None if it can't be read"""
+        try:
+            if not self.syncer.client and not self.syncer.connect():
+                return None
+            return self.syncer.open_spreadsheet(job.sheet_url_or_id).get_lastUpdateTime()
+        except Exception as e:
+            print(f"[SYNC] Revision check failed for {job.sheet_url_or_id}: {e}")
+            return None
+
+    def poll(self, job):
+        """Check one job for changes, sync it if needed and reschedule it"""
+        job.checks += 1
+        job.last_checked_at = datetime.now().isoformat(timespec='seconds')
+
+        revision = self._revision(job)
+        if revision is not None and revision == job.last_revision:
+            job.skipped += 1
+            self._reschedule(job, changed=False)
+            return
+
+        start = time.perf_counter()
+        result = self.syncer.sync_from_sheet(
+            job.sheet_url_or_id,
+            job.worksheet_name,
+            sheet_modified=revision is not None and job.last_revision is not None
+        )
+        job.last_duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        job.syncs += 1
+
+        if result is None:
+            job.last_error = 'Sync failed (see server log)'
+            self._reschedule(job, changed=False)
+            return
+
+        job.last_error = None
+        job.last_result = result
+        job.last_revision = revision
+        job.last_synced_at = job.last_checked_at
+
+        changed_ids = result['changed_ids']
+        if changed_ids:
+            for listener in self.listeners:
+                try:
+                    listener(changed_ids)
+                except Exception as e:
+                    print(f"[SYNC] Listener failed: {e}")
+
+        # Any sync that found the sheet modified counts as activity
+        self._reschedule(job, changed=bool(changed_ids) or revision is not None)
+
+    def _reschedule(self, job, changed):
+        if changed:
+            job.interval = self.min_interval
+        else:
+            job.interval = min(job.interval * self.backoff, self.max_interval)
+        job.next_run = time.monotonic() + job.interval
+
+def main():
+    import argparse
+    from google_sheets_sync import GoogleSheetSync
+
+    arg_parser = argparse.ArgumentParser(description='Run the Google Sheets sync scheduler as a sidecar')
+    arg_parser.add_argument('sheets', nargs='+', help='Google Sheet URLs or IDs')
+    arg_parser.add_argument('--worksheet', default='Sheet1')
+    arg_parser.add_argument('--credentials', default='credentials.json')
+    arg_parser.add_argument('--min-interval', type=float, default=30)
+    arg_parser.add_argument('--max-interval', type=float, default=900)
+    args = arg_parser.parse_args()
+
+    scheduler = SyncScheduler(GoogleSheetSync(args.credentials), args.min_interval, args.max_interval)
+    for sheet in args.sheets:
+        scheduler.register(sheet, args.worksheet)
+    scheduler.start()
+
+    print(f"[SYNC] Scheduler running for {len(args.sheets)} sheet(s). Press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        scheduler.stop()
+        print("\n[INFO] Scheduler stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,536 @@
+"""
+Large-Scale Synthetic Volunteers and Job Descriptions
+Generates any number of realistic volunteers (every expanded-schema field)
+for load and scale testing, deterministically from a seed, and streams them
+straight to a SQLite database, CSV, JSON lines or XLSX without holding the
+pool in memory:
+
+    python synthetic_data.py volunteers --count 1000000 --output scale.db
+    python synthetic_data.py volunteers --count 200000 --output volunteers.csv --seed 7
+    python synthetic_data.py jobs --count 500 --output jobs.jsonl
+
+How the data is shaped:
+- each volunteer has a profession; skills are drawn from that profession's
+  pool and a shared soft-skill pool with Zipf weights (a few skills are very
+  common, most are rare), using the canonical names of skills_taxonomy.json
+- experience, education, certifications, job position and volunteering
+  mode follow from the profession and from the volunteer's age
+- cities are Zipf-weighted and carry their state, country, postal code and
+  regional languages
+- availability comes from a small set of weighted weekly patterns, with the
+  matching availability_days and time_availability
+- optional fields are left empty at realistic rates
+
+Job descriptions use the same professions, skills and locations. Most carry
+the organisation boilerplate real postings have (mission, benefits, equal
+opportunity statement) around the role, responsibilities and requirements.
+Each job also records the profession, skills, location and mode it was
+generated from, for benchmarks that need ground truth.
+
+CSV and JSON lines use volunteer field names (POST /api/volunteers/import
+accepts them); XLSX uses the column titles excel_sync.py reads.
+"""
+
+import argparse
+import bisect
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from database import Database, VOLUNTEER_FIELDS
+
+# Zipf exponent for skill, city and name popularity
+ZIPF_EXPONENT = 1.1
+
+FIRST_NAMES = {
+    'female': ['Priya', 'Ananya', 'Sneha', 'Aisha', 'Kavya', 'Maria', 'Emily', 'Sarah', 'Fatima', 'Meera',
+               'Divya', 'Pooja', 'Grace', 'Elena', 'Sofia', 'Nisha', 'Rosa', 'Hannah', 'Ines', 'Zara'],
+    'male': ['Rahul', 'Arjun', 'Amit', 'Rohan', 'Vikram', 'John', 'David', 'Michael', 'Omar', 'Karan',
+             'Aditya', 'Sanjay', 'Liam', 'Noah', 'Carlos', 'Farid', 'Hiro', 'Samuel', 'Tariq', 'Dev'],
+}
+LAST_NAMES = ['Sharma', 'Patel', 'Singh', 'Kumar', 'Iyer', 'Reddy', 'Nair', 'Gupta', 'Joshi', 'Das',
+              'Mehta', 'Khan', 'Smith', 'Garcia', 'Chen', 'Okafor', 'Silva', 'Brown', 'Haddad', 'Kim',
+              'Rao', 'Menon', 'Kulkarni', 'Banerjee', 'Fernandes', 'Lopez', 'Novak', 'Tanaka']
+PREFIXES = {'female': ['Ms.', 'Mrs.', 'Dr.'], 'male': ['Mr.', 'Dr.']}
+
+# city, state, country, postal code prefix, regional languages; most populous first
+CITIES = [
+    ('Mumbai', 'Maharashtra', 'India', '400', ['Marathi', 'Hindi']),
+    ('Delhi', 'Delhi', 'India', '110', ['Hindi', 'Punjabi']),
+    ('Bangalore', 'Karnataka', 'India', '560', ['Kannada', 'Tamil']),
+    ('Hyderabad', 'Telangana', 'India', '500', ['Telugu', 'Urdu']),
+    ('Chennai', 'Tamil Nadu', 'India', '600', ['Tamil']),
+    ('Pune', 'Maharashtra', 'India', '411', ['Marathi', 'Hindi']),
+    ('Kolkata', 'West Bengal', 'India', '700', ['Bengali', 'Hindi']),
+    ('Ahmedabad', 'Gujarat', 'India', '380', ['Gujarati', 'Hindi']),
+    ('Jaipur', 'Rajasthan', 'India', '302', ['Hindi']),
+    ('Lucknow', 'Uttar Pradesh', 'India', '226', ['Hindi', 'Urdu']),
+    ('Kochi', 'Kerala', 'India', '682', ['Malayalam']),
+    ('New York', 'New York', 'United States', '100', ['Spanish']),
+    ('London', 'England', 'United Kingdom', 'E1', ['French']),
+    ('Toronto', 'Ontario', 'Canada', 'M5V', ['French']),
+    ('Nagpur', 'Maharashtra', 'India', '440', ['Marathi', 'Hindi']),
+    ('Indore', 'Madhya Pradesh', 'India', '452', ['Hindi']),
+    ('Bhopal', 'Madhya Pradesh', 'India', '462', ['Hindi', 'Urdu']),
+    ('San Francisco', 'California', 'United States', '941', ['Spanish', 'Mandarin']),
+    ('Dubai', 'Dubai', 'United Arab Emirates', '', ['Arabic', 'Hindi']),
+    ('Singapore', 'Singapore', 'Singapore', '01', ['Mandarin', 'Malay']),
+]
+STREETS = ['MG Road', 'Station Road', 'Park Street', 'Main Street', 'Church Road', 'Lake View Road',
+           'Nehru Nagar', 'Gandhi Marg', 'High Street', 'Hill Road']
+
+# Profession -> sector, education field, degrees, skill pool (most common first), extra
+# experience terms, certifications, share choosing remote work
+PROFESSIONS = {
+    'Software Developer': {
+        'sector': 'Information Technology', 'field': 'Computer Science',
+        'degrees': ['B.Tech Computer Science', 'Bachelor of Computer Science', 'M.Tech Software Engineering', 'BCA', 'MCA'],
+        'skills': ['Python', 'JavaScript', 'SQL', 'Git', 'React', 'Java', 'Node.js', 'HTML', 'CSS', 'Django',
+                   'REST API', 'Docker', 'AWS', 'TypeScript', 'Flask', 'MongoDB', 'PostgreSQL', 'Angular',
+                   'Spring', 'Kubernetes', 'FastAPI', 'GraphQL', 'Go', 'C#', 'PHP', 'Vue', 'Rust', 'Kotlin'],
+        'terms': ['web applications', 'backend services', 'APIs', 'code reviews', 'deployments', 'open source'],
+        'certifications': ['AWS Certified Developer', 'Oracle Java Certification', 'Azure Fundamentals'],
+        'remote': 0.55,
+    },
+    'Data Analyst': {
+        'sector': 'Information Technology', 'field': 'Statistics',
+        'degrees': ['M.Sc Statistics', 'Master of Data Science', 'B.Sc Mathematics', 'B.Com', 'MBA Analytics'],
+        'skills': ['Excel', 'SQL', 'Data Analysis', 'Python', 'Data Visualization', 'Statistics', 'R',
+                   'Machine Learning', 'Data Science', 'PostgreSQL', 'AI', 'TensorFlow', 'PyTorch'],
+        'terms': ['dashboards', 'reports', 'surveys', 'impact measurement', 'data cleaning', 'KPIs'],
+        'certifications': ['Google Data Analytics Certificate', 'IBM Data Science Professional Certificate',
+                           'Microsoft Power BI Data Analyst'],
+        'remote': 0.5,
+    },
+    'Designer': {
+        'sector': 'Media and Design', 'field': 'Design',
+        'degrees': ['Bachelor of Design', 'B.F.A', 'Diploma in Graphic Design', 'M.Des Interaction Design'],
+        'skills': ['Graphic Design', 'Photoshop', 'Figma', 'Illustrator', 'UI/UX', 'Social Media', 'WordPress',
+                   'Content Writing', 'HTML', 'CSS'],
+        'terms': ['posters', 'brand identity', 'campaign creatives', 'brochures', 'wireframes', 'infographics'],
+        'certifications': ['Google UX Design Certificate', 'Adobe Certified Professional'],
+        'remote': 0.45,
+    },
+    'Teacher': {
+        'sector': 'Education', 'field': 'Education',
+        'degrees': ['B.Ed', 'M.Ed', 'Bachelor of Arts, English', 'B.Sc Mathematics', 'M.A Education'],
+        'skills': ['Teaching', 'Public Speaking', 'Content Writing', 'Excel', 'Social Media', 'Event Management'],
+        'terms': ['lesson plans', 'classrooms', 'tutoring', 'curriculum', 'literacy', 'exam preparation'],
+        'certifications': ['CTET', 'TEFL Certificate', 'Montessori Training'],
+        'remote': 0.2,
+    },
+    'Marketing Professional': {
+        'sector': 'Marketing and Communications', 'field': 'Marketing',
+        'degrees': ['MBA Marketing', 'BBA', 'B.A Mass Communication', 'PG Diploma in Digital Marketing'],
+        'skills': ['Digital Marketing', 'Social Media', 'SEO', 'Content Writing', 'Public Speaking', 'Excel',
+                   'Graphic Design', 'WordPress', 'Data Analysis'],
+        'terms': ['campaigns', 'newsletters', 'donor communication', 'social media calendars', 'press releases'],
+        'certifications': ['Google Ads Certification', 'HubSpot Content Marketing', 'Meta Blueprint'],
+        'remote': 0.4,
+    },
+    'Nonprofit Coordinator': {
+        'sector': 'Nonprofit', 'field': 'Social Work',
+        'degrees': ['MSW', 'Bachelor of Social Work', 'M.A Development Studies', 'B.A Sociology'],
+        'skills': ['Volunteer Coordination', 'Event Management', 'Fundraising', 'Project Management',
+                   'Public Speaking', 'Excel', 'Social Media', 'Content Writing'],
+        'terms': ['community drives', 'donor relations', 'field visits', 'beneficiary outreach', 'grant reports'],
+        'certifications': ['Certified Fundraising Executive', 'PMP', 'First Aid / CPR'],
+        'remote': 0.15,
+    },
+    'Healthcare Worker': {
+        'sector': 'Healthcare', 'field': 'Nursing',
+        'degrees': ['B.Sc Nursing', 'MBBS', 'Bachelor of Pharmacy', 'Diploma in Nursing', 'M.P.H'],
+        'skills': ['Public Speaking', 'Event Management', 'Excel', 'Teaching', 'Volunteer Coordination'],
+        'terms': ['health camps', 'patient care', 'first aid training', 'awareness sessions', 'elder care'],
+        'certifications': ['First Aid / CPR', 'BLS Certification', 'ACLS Certification'],
+        'remote': 0.05,
+    },
+    'Project Manager': {
+        'sector': 'Consulting', 'field': 'Management',
+        'degrees': ['MBA', 'BBA', 'B.E Civil Engineering', 'M.Sc Management'],
+        'skills': ['Project Management', 'Agile', 'Scrum', 'Excel', 'Public Speaking', 'Data Analysis',
+                   'Fundraising', 'Event Management'],
+        'terms': ['stakeholder meetings', 'budgets', 'timelines', 'vendor management', 'program delivery'],
+        'certifications': ['PMP', 'Scrum Master', 'PRINCE2 Foundation'],
+        'remote': 0.35,
+    },
+    'QA Engineer': {
+        'sector': 'Information Technology', 'field': 'Computer Science',
+        'degrees': ['B.Tech Computer Science', 'BCA', 'B.Sc Information Technology'],
+        'skills': ['Testing', 'QA', 'Selenium', 'Test Automation', 'Python', 'Java', 'SQL', 'Git', 'Jenkins',
+                   'CI/CD', 'Agile'],
+        'terms': ['test plans', 'regression suites', 'bug triage', 'release checks', 'accessibility audits'],
+        'certifications': ['ISTQB Certified Tester', 'Certified Selenium Professional'],
+        'remote': 0.5,
+    },
+    'Student': {
+        'sector': 'Student', 'field': 'General Studies',
+        'degrees': ['Pursuing B.Tech', 'Pursuing B.Com', 'Pursuing B.A', 'Pursuing B.Sc', 'Class XII'],
+        'skills': ['Social Media', 'Content Writing', 'Excel', 'Public Speaking', 'Python', 'Graphic Design',
+                   'Teaching', 'Event Management', 'HTML'],
+        'terms': ['college fests', 'NSS camps', 'peer tutoring', 'clean-up drives', 'online campaigns'],
+        'certifications': ['NSS Certificate', 'NCC Certificate'],
+        'remote': 0.4,
+    },
+}
+# Share of volunteers per profession
+PROFESSION_WEIGHTS = {
+    'Software Developer': 18, 'Student': 22, 'Teacher': 10, 'Data Analyst': 8, 'Designer': 7,
+    'Marketing Professional': 8, 'Nonprofit Coordinator': 9, 'Healthcare Worker': 6,
+    'Project Manager': 7, 'QA Engineer': 5,
+}
+SOFT_SKILLS = ['Communication', 'Teamwork', 'Leadership', 'Problem Solving', 'Organized', 'Creative',
+               'Detail-Oriented', 'Analytical']
+
+# availability, availability_days, time_availability, weight
+AVAILABILITY_PATTERNS = [
+    ('Weekends', 'Saturday, Sunday', 'Flexible', 30),
+    ('Weekday evenings', 'Monday, Tuesday, Wednesday, Thursday, Friday', 'Evenings', 18),
+    ('Flexible', '', 'Flexible', 14),
+    ('Saturdays only', 'Saturday', 'Mornings', 8),
+    ('Sundays', 'Sunday', 'Mornings', 7),
+    ('Part-time, weekends', 'Saturday, Sunday', 'Afternoons', 8),
+    ('Weekdays', 'Monday, Wednesday, Friday', 'Mornings', 6),
+    ('Evenings and weekends', 'Saturday, Sunday', 'Evenings', 7),
+    ('Full-time', 'Monday, Tuesday, Wednesday, Thursday, Friday', 'Flexible', 2),
+]
+CAUSES = ['Education', 'Environment', 'Health', 'Women Empowerment', 'Child Welfare', 'Animal Welfare',
+          'Disaster Relief', 'Elder Care', 'Digital Literacy', 'Livelihoods', 'Arts and Culture', 'Sports']
+SOURCES = ['Friend or family', 'Instagram', 'LinkedIn', 'College', 'Website', 'Facebook', 'Event',
+           'WhatsApp group', 'Newspaper']
+COMMITMENTS = ['1 month', '3 months', '6 months', '1 year', 'Ongoing']
+POSITIONS = ['Intern', 'Associate', 'Senior Associate', 'Lead', 'Manager', 'Director']
+
+class Weighted:
+    """Fast repeated weighted choice from a fixed list"""
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.cumulative = list(itertools.accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def pick(self, rng):
+        return self.items[bisect.bisect(self.cumulative, rng.random() * self.total)]
+
+    def sample(self, rng, count):
+        """Up to count distinct items, popular ones more likely"""
+        chosen = []
+        for _ in range(count * 4):
+            item = self.pick(rng)
+            if item not in chosen:
+                chosen.append(item)
+                if len(chosen) == count:
+                    break
+        return chosen
+
+def zipf(items, exponent=ZIPF_EXPONENT):
+    return Weighted(items, [1 / rank ** exponent for rank in range(1, len(items) + 1)])
+
+# Samplers shared by every generator call
+_PROFESSIONS = Weighted(PROFESSION_WEIGHTS, PROFESSION_WEIGHTS.values())
+_SKILLS = {name: zipf(profession['skills']) for name, profession in PROFESSIONS.items()}
+_SOFT_SKILLS = zipf(SOFT_SKILLS)
+_CITIES = zipf(CITIES)
+_AVAILABILITY = Weighted(AVAILABILITY_PATTERNS, [pattern[3] for pattern in AVAILABILITY_PATTERNS])
+_CAUSES = zipf(CAUSES, 0.8)
+_SOURCES = zipf(SOURCES)
+_LAST_NAMES = zipf(LAST_NAMES, 0.7)
+_FIRST_NAMES = {gender: zipf(names, 0.7) for gender, names in FIRST_NAMES.items()}
+
+def _age(rng, profession):
+    if profession == 'Student':
+        return rng.randint(17, 24)
+    # Most volunteers are young professionals, with a long tail
+    return min(70, 22 + int(rng.expovariate(1 / 9)))
+
+def _phone(rng, country):
+    if country == 'India':
+        return f'+91-{rng.randint(70000, 99999)}{rng.randint(10000, 99999)}'
+    return f'+1-{rng.randint(200, 989)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}'
+
+def _postal_code(rng, country, prefix):
+    if country == 'India':
+        return f'{prefix}{rng.randint(1, 99):03d}'
+    if country == 'United States':
+        return f'{prefix}{rng.randint(0, 99):02d}'
+    return f'{prefix} {rng.randint(1, 9)}{rng.choice("ABDEFGHJ")}{rng.choice("LNPQRSTU")}' if prefix else ''
+
+def generate_volunteer(rng, volunteer_id, today=date(2026, 1, 1)):
+    """One synthetic volunteer as a dict of every VOLUNTEER_FIELDS field"""
+    profession_name = _PROFESSIONS.pick(rng)
+    profession = PROFESSIONS[profession_name]
+    gender = rng.choice(['female', 'male'])
+    first, last = _FIRST_NAMES[gender].pick(rng), _LAST_NAMES.pick(rng)
+    age = _age(rng, profession_name)
+    years = max(0, age - 22 - rng.randint(0, 3)) if profession_name != 'Student' else 0
+    city, state, country, postal_prefix, regional = _CITIES.pick(rng)
+
+    skills = _SKILLS[profession_name].sample(rng, rng.randint(3, 8))
+    soft = _SOFT_SKILLS.sample(rng, rng.randint(0, 2))
+    languages = ['English'] if rng.random() < 0.9 else []
+    languages += [language for language in regional if rng.random() < 0.6]
+    if country == 'India' and 'Hindi' not in languages and rng.random() < 0.5:
+        languages.append('Hindi')
+    availability, days, time_of_day, _ = _AVAILABILITY.pick(rng)
+    remote = rng.random() < profession['remote']
+    mode = 'Remote' if remote else 'Hybrid' if rng.random() < 0.3 else 'Onsite'
+    causes = _CAUSES.sample(rng, rng.randint(1, 3))
+    position = 'Student' if profession_name == 'Student' else POSITIONS[min(len(POSITIONS) - 1, years // 3)]
+    terms = rng.sample(profession['terms'], 2)
+
+    if years:
+        experience = (f"{years} years as a {profession_name.lower()} working on {terms[0]} and {terms[1]} "
+                      f"with {', '.join(skills[:2])}")
+    else:
+        experience = f"Worked on {terms[0]} and {terms[1]} using {', '.join(skills[:2])}"
+    joined = today - timedelta(days=rng.randint(0, 3 * 365))
+    birth = today - timedelta(days=age * 365 + rng.randint(0, 364))
+    handle = f'{first}.{last}.{volunteer_id}'.lower()
+
+    return {
+        'name': f'{first} {last}',
+        'email': f'{handle}@example.org',
+        'phone': _phone(rng, country),
+        'skills': ', '.join(skills + soft),
+        'experience': experience,
+        'education': rng.choice(profession['degrees']),
+        'availability': availability,
+        'languages': ', '.join(languages or ['English']),
+        'certifications': rng.choice(profession['certifications']) if rng.random() < 0.35 else '',
+        'interests': ', '.join(causes),
+        'timestamp': f'{joined.isoformat()} {rng.randint(8, 22):02d}:{rng.randint(0, 59):02d}:00',
+        'prefix': rng.choice(PREFIXES[gender]) if rng.random() < 0.6 else '',
+        'alternate_phone': _phone(rng, country) if rng.random() < 0.15 else '',
+        'date_of_birth': birth.isoformat() if rng.random() < 0.8 else '',
+        'anniversary_date': '',
+        'gender': gender.capitalize() if rng.random() < 0.95 else '',
+        'country': country,
+        'state': state,
+        'city': city,
+        'address': f'{rng.randint(1, 999)}, {rng.choice(STREETS)}' if rng.random() < 0.7 else '',
+        'pin_code': _postal_code(rng, country, postal_prefix) if country == 'India' else '',
+        'zip_code': _postal_code(rng, country, postal_prefix) if country != 'India' else '',
+        'education_field': profession['field'],
+        'job_sector': profession['sector'],
+        'profession': profession_name,
+        'job_position': position,
+        'years_experience': str(years),
+        'linkedin_url': f'https://www.linkedin.com/in/{handle.replace(".", "-")}' if rng.random() < 0.45 else '',
+        'facebook_url': '',
+        'instagram_url': f'https://www.instagram.com/{handle.replace(".", "_")}' if rng.random() < 0.1 else '',
+        'previous_experience': f"Volunteered in {causes[0].lower()} programs" if rng.random() < 0.5 else '',
+        'primary_skills': ', '.join(skills[:3]),
+        'secondary_skills': ', '.join(skills[3:] + soft),
+        'volunteering_mode': mode,
+        'availability_days': days,
+        'time_availability': time_of_day,
+        'commitment_duration': rng.choice(COMMITMENTS),
+        'join_date': joined.isoformat(),
+        'hear_about_source': _SOURCES.pick(rng),
+        'passed_examination': '',
+        'departments_served': ', '.join(causes[:2]) if rng.random() < 0.4 else '',
+        'journey_description': (f"Joined to support {causes[0].lower()} with my {skills[0]} skills"
+                                if rng.random() < 0.3 else ''),
+    }
+
+def generate_volunteers(count, seed=0, start_id=1):
+    """Yield count synthetic volunteers (without ids); the same seed gives the same volunteers"""
+    rng = random.Random(seed)
+    for volunteer_id in range(start_id, start_id + count):
+        yield generate_volunteer(rng, volunteer_id)
+
+# Job descriptions
+
+ORGANISATIONS = ['Green Earth Trust', 'Literacy First Foundation', 'City Food Bank', 'Helping Hands Society',
+                 'Bright Futures NGO', 'Care for Elders Network', 'Code for Good', 'Clean Rivers Initiative']
+MISSIONS = [
+    "{org} is a registered non-profit founded in {year}. Our mission is to build a more equitable society by "
+    "empowering communities through {cause_lower}. Over the years we have reached more than {reach},000 "
+    "beneficiaries across {cities} cities with the help of thousands of dedicated volunteers.",
+    "At {org}, we believe every person deserves access to {cause_lower}. Since {year} we have partnered with "
+    "schools, hospitals, local governments and corporate donors to deliver programs that create lasting change. "
+    "Our work is driven by compassion, transparency and accountability.",
+]
+BENEFITS = [
+    "What we offer: a certificate of appreciation, a letter of recommendation after three months, flexible "
+    "hours, networking opportunities with professionals across sectors, regular volunteer meetups, and the "
+    "chance to make a real difference in the lives of people who need it most.",
+    "Perks: free training workshops, mentorship from experienced staff, recognition at our annual volunteer "
+    "awards, travel reimbursement for field visits, and a supportive, inclusive community of changemakers.",
+]
+EEO_STATEMENTS = [
+    "{org} is an equal opportunity organisation. We welcome volunteers of all backgrounds and do not "
+    "discriminate on the basis of race, religion, caste, colour, gender, gender identity, sexual orientation, "
+    "age, marital status, disability or any other legally protected characteristic. We are committed to "
+    "providing reasonable accommodations to volunteers with disabilities.",
+    "We are committed to diversity, equity and inclusion. All qualified applicants will receive consideration "
+    "without regard to race, colour, religion, sex, national origin, disability or veteran status. Our "
+    "safeguarding policy applies to everyone who works with children and vulnerable adults.",
+]
+APPLY_LINES = [
+    "To apply, submit the form on our website. Shortlisted volunteers will be contacted within two weeks. "
+    "Please note that this is an unpaid volunteer role.",
+    "Interested candidates can write to us with a short note about themselves. Only shortlisted volunteers "
+    "will be contacted.",
+]
+
+def generate_job(rng, job_id, boilerplate=0.7):
+    """One synthetic job posting plus the facts it was generated from"""
+    profession_name = _PROFESSIONS.pick(rng)
+    profession = PROFESSIONS[profession_name]
+    skills = _SKILLS[profession_name].sample(rng, rng.randint(3, 5))
+    city, _, country, _, _ = _CITIES.pick(rng)
+    availability, _, _, _ = _AVAILABILITY.pick(rng)
+    remote = rng.random() < profession['remote']
+    cause = _CAUSES.pick(rng)
+    organisation = rng.choice(ORGANISATIONS)
+    title = f"Volunteer {profession_name} - {cause}"
+    terms = rng.sample(profession['terms'], 2)
+    facts = {'org': organisation, 'year': rng.randint(1995, 2020), 'cause_lower': cause.lower(),
+             'reach': rng.randint(5, 500), 'cities': rng.randint(2, 40)}
+
+    sections = []
+    if rng.random() < boilerplate:
+        sections.append(f"About us\n{rng.choice(MISSIONS).format(**facts)}")
+    sections.append(f"Role: {title}\nWe are looking for a volunteer {profession_name.lower()} to support our "
+                    f"{cause.lower()} program. " + ('This is a remote role.' if remote else f'Location: {city}.'))
+    sections.append("Responsibilities\n" + '\n'.join([
+        f"- Help the team with {terms[0]}",
+        f"- Support {terms[1]} using {skills[0]}",
+        f"- Coordinate with program staff and other volunteers",
+    ]))
+    sections.append("Requirements\n" + '\n'.join(
+        [f"- Experience with {', '.join(skills[:-1])} and {skills[-1]}",
+         f"- Available {availability.lower()}",
+         f"- Good communication skills"]
+    ))
+    if rng.random() < boilerplate:
+        sections.append(rng.choice(BENEFITS))
+    if rng.random() < boilerplate:
+        sections.append(rng.choice(EEO_STATEMENTS).format(**facts))
+    if rng.random() < boilerplate:
+        sections.append(rng.choice(APPLY_LINES))
+
+    return {
+        'id': job_id,
+        'title': title,
+        'description': '\n\n'.join(sections),
+        'profession': profession_name,
+        'skills': skills,
+        'location': 'Remote' if remote else city,
+        'country': country,
+        'availability': availability,
+    }
+
+def generate_jobs(count, seed=1, boilerplate=0.7):
+    """Yield count synthetic job postings"""
+    rng = random.Random(seed)
+    for job_id in range(1, count + 1):
+        yield generate_job(rng, job_id, boilerplate)
+
+# Writers (each consumes a generator, so memory stays bounded)
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def write_sqlite(volunteers, path, batch_size=10000):
+    db = Database(path)
+    written = 0
+    for batch in _batches(volunteers, batch_size):
+        written += db.insert_volunteers_bulk(VOLUNTEER_FIELDS, [tuple(v[field] for field in VOLUNTEER_FIELDS) for v in batch])
+        yield written
+
+def write_csv(volunteers, path, batch_size=10000):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(VOLUNTEER_FIELDS)
+        written = 0
+        for batch in _batches(volunteers, batch_size):
+            writer.writerows([v[field] for field in VOLUNTEER_FIELDS] for v in batch)
+            written += len(batch)
+            yield written
+
+def write_jsonl(records, path, batch_size=10000):
+    with open(path, 'w', encoding='utf-8') as f:
+        written = 0
+        for batch in _batches(records, batch_size):
+            f.writelines(json.dumps(record, ensure_ascii=False) + '\n' for record in batch)
+            written += len(batch)
+            yield written
+
+XLSX_MAX_ROWS = 1048576 - 1  # sheet limit minus the header
+
+def write_xlsx(volunteers, path, batch_size=10000):
+    from openpyxl import Workbook
+    from excel_sync import EXCEL_COLUMNS
+    workbook = Workbook(write_only=True)  # rows are flushed to a temporary file as they are appended
+    sheet = workbook.create_sheet('Volunteers')
+    sheet.append([EXCEL_COLUMNS.get(field, field) for field in VOLUNTEER_FIELDS])
+    written = 0
+    for batch in _batches(volunteers, batch_size):
+        for volunteer in batch:
+            sheet.append([volunteer[field] for field in VOLUNTEER_FIELDS])
+        written += len(batch)
+        yield written
+    workbook.save(path)
+
+WRITERS = {'sqlite': write_sqlite, 'csv': write_csv, 'jsonl': write_jsonl, 'xlsx': write_xlsx}
+EXTENSIONS = {'.db': 'sqlite', '.sqlite': 'sqlite', '.sqlite3': 'sqlite', '.csv': 'csv',
+              '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.xlsx': 'xlsx'}
+
+def output_format(path, requested=None):
+    data_format = requested or EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if data_format not in WRITERS:
+        raise ValueError(f"Cannot tell the format of '{path}'; use --format ({', '.join(WRITERS)})")
+    return data_format
+
+def write(records, path, data_format, total, label):
+    """Run a writer, printing progress; returns the number of records written"""
+    start = time.perf_counter()
+    written, reported = 0, 0
+    for written in WRITERS[data_format](records, path):
+        if written - reported >= 100000 or written == total:
+            reported = written
+            rate = written / max(time.perf_counter() - start, 1e-9)
+            print(f"[INFO] {written:,} / {total:,} {label} ({rate:,.0f}/s)", file=sys.stderr)
+    print(f"[SUCCESS] Wrote {written:,} {label} to {path} ({data_format}) "
+          f"in {time.perf_counter() - start:.1f}s")
+    return written
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Generate synthetic volunteers or job descriptions at scale')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    volunteers = commands.add_parser('volunteers', help='Volunteers (every expanded-schema field)')
+    volunteers.add_argument('--count', type=int, default=100000)
+    volunteers.add_argument('--seed', type=int, default=0)
+    volunteers.add_argument('--output', required=True, help='.db/.sqlite, .csv, .jsonl or .xlsx')
+    volunteers.add_argument('--format', choices=list(WRITERS))
+
+    jobs = commands.add_parser('jobs', help='Job descriptions with the facts they were generated from')
+    jobs.add_argument('--count', type=int, default=200)
+    jobs.add_argument('--seed', type=int, default=1)
+    jobs.add_argument('--boilerplate', type=float, default=0.7,
+                      help='Probability of each boilerplate section (mission, benefits, EEO, how to apply)')
+    jobs.add_argument('--output', required=True, help='.jsonl')
+    args = arg_parser.parse_args()
+
+    if args.command == 'volunteers':
+        data_format = output_format(args.output, args.format)
+        if data_format == 'xlsx' and args.count > XLSX_MAX_ROWS:
+            arg_parser.error(f'XLSX sheets hold at most {XLSX_MAX_ROWS:,} volunteers')
+        write(generate_volunteers(args.count, args.seed), args.output, data_format, args.count, 'volunteers')
+    else:
+        write(generate_jobs(args.count, args.seed, args.boilerplate), args.output, 'jsonl', args.count, 'jobs')
+
+if __name__ == "__main__":
+    main()
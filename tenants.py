@@ -0,0 +1,345 @@
+"""
+Per-Organisation Databases and Matching State
+Each organisation (chapter) configured in TENANTS has its own SQLite database
+and its own in-memory matching state: volunteer store, matcher profile cache
+and TF-IDF index, facet index, semantic index and posting matcher. A request
+picks its tenant with an X-Tenant header or a ?tenant= parameter; without
+one it uses the default tenant (volunteer_management.db), which is always
+resident and is also what warm-up and the Google Sheets sync work on.
+
+Other tenants are loaded on first use and kept in an LRU bounded by memory
+(and optionally by count). When the estimated resident size passes the
+budget, the least recently used idle tenant is evicted: its built state is
+pickled to the spill directory and dropped. The next request for that tenant
+restores the state from the spill file instead of rebuilding it; anything
+that changed in the database since then is picked up by the usual version
+checks. Databases themselves are never evicted, they live on disk.
+
+Spill files are pickles, so they are only ever read from a directory that
+nobody else can write to. By default each registry creates its own
+directory with tempfile.mkdtemp() and removes it on exit. A configured
+directory must be a real directory (not a symlink) owned by the user
+running the app, with no group or other permissions; otherwise nothing is
+spilled to it or restored from it. Spill files are created mode 0600 and
+checked the same way, on the open file, before they are unpickled.
+
+Memory figures are estimates: array sizes are exact, large dicts are
+sampled.
+"""
+
+import itertools
+import os
+import pickle
+import re
+import shutil
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from database import Database
+from facet_index import FacetIndex
+from posting_matcher import PostingMatcher
+from private_files import O_NOFOLLOW, check_private_directory, open_private, private_directory
+from resume_matcher import ResumeMatcher
+from semantic_index import SemanticIndex
+from volunteer_store import VolunteerStore
+
+DEFAULT_TENANT = 'default'
+TENANT_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+def _deep_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list, set, frozenset)):
+        size += sum(_deep_size(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(_deep_size(key) + _deep_size(item) for key, item in value.items())
+    return size
+
+def sampled_bytes(mapping, sample=256):
+    """Approximate deep size of a large dict, from a sample of its items"""
+    if not mapping:
+        return sys.getsizeof(mapping)
+    items = list(itertools.islice(mapping.items(), sample))
+    per_item = sum(_deep_size(key) + _deep_size(value) for key, value in items) / len(items)
+    return sys.getsizeof(mapping) + int(per_item * len(mapping))
+
+class Tenant:
+    """One organisation's database and the matching state built from it"""
+
+    def __init__(self, name, db_path=None, settings=None):
+        """
+        Args:
+            name: Tenant name
+            db_path: SQLite database file (default: Database's default)
+            settings: match_index, semantic_index, posting_top_k, posting_min_score
+        """
+        self.name = name
+        self.settings = settings or {}
+        self.db = Database(db_path) if db_path else Database()
+        self.volunteer_store = VolunteerStore(self.db)
+        self.matcher = ResumeMatcher(index_settings=self.settings.get('match_index'))
+        self.facet_index = FacetIndex()
+        self.semantic_index = SemanticIndex(self.matcher, **(self.settings.get('semantic_index') or {}))
+        self.posting_matcher = PostingMatcher(
+            self.db, self.matcher,
+            default_top_k=self.settings.get('posting_top_k', 25),
+            min_score=self.settings.get('posting_min_score', 0.05),
+            volunteer_pool=self.volunteer_store.volunteers
+        )
+
+    def memory_report(self):
+        """Estimated bytes held in memory, per structure"""
+        semantic = self.semantic_index
+        parts = {
+            'volunteer_store': self.volunteer_store.stats()['total_bytes'],
+            'profile_cache': sampled_bytes(self.matcher.profile_cache),
+            'facet_index': self.facet_index.stats()['bitset_bytes'] + sampled_bytes(self.facet_index.raw)
+                + sampled_bytes(self.facet_index.values) + sampled_bytes(self.facet_index.slots),
+            'tfidf_index': self.matcher.index.memory_report()['total_bytes'] if self.matcher.index is not None else 0,
+            'semantic_index': int(semantic.vectors.nbytes + semantic.codes.nbytes) + sampled_bytes(semantic.profiles)
+                if semantic.built else 0,
+        }
+        return {'total_bytes': sum(parts.values()), 'bytes': parts}
+
+    # Spilling
+
+    def spill(self, path):
+        """Write the built in-memory state to path (atomically)"""
+        state = {
+            'settings': self.settings,
+            'epoch': self.db.get_data_versions([])['epoch'],
+            'profile_cache': self.matcher.profile_cache,
+            'store': (self.volunteer_store.snapshot, self.volunteer_store.version),
+            'facet_index': self.facet_index,
+            'tfidf_index': self.matcher.index,
+            'semantic_index': self.semantic_index if self.semantic_index.built else None,
+        }
+        temporary = f'{path}.{os.getpid()}.tmp'
+        if os.path.lexists(temporary):
+            os.remove(temporary)
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL | O_NOFOLLOW, 0o600)
+        with os.fdopen(descriptor, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def restore(self, path):
+        """
+        Load state written by spill()
+
+        Returns:
+            bool: False if the file no longer matches this tenant's database or settings
+        """
+        with open_private(path) as f:
+            state = pickle.load(f)
+        if state['settings'] != self.settings or state['epoch'] != self.db.get_data_versions([])['epoch']:
+            return False
+        self.matcher.profile_cache = state['profile_cache']
+        self.matcher.index = state['tfidf_index']
+        self.volunteer_store.adopt(*state['store'])
+        self.facet_index = state['facet_index']
+        if state['semantic_index'] is not None:
+            self.semantic_index = state['semantic_index']
+            self.semantic_index.matcher = self.matcher
+        return True
+
+class TenantRegistry:
+    def __init__(self, tenants=None, settings=None, default_path=None, max_bytes=None,
+                 max_resident=None, spill_directory=None, measure_seconds=5):
+        """
+        Args:
+            tenants: Tenant name -> database file
+            settings: Matching settings shared by every tenant (see Tenant)
+            default_path: Database file of the default tenant
+            max_bytes: Memory budget for resident tenants (None: unbounded)
+            max_resident: Most tenants resident besides the default (None: unbounded)
+            spill_directory: Where evicted state is written; must be private to the current
+                user (default: a new private temporary directory, removed on exit)
+            measure_seconds: Minimum time between memory estimates of one tenant
+        """
+        tenants = dict(tenants or {})
+        for name in tenants:
+            if name == DEFAULT_TENANT or not TENANT_NAME_PATTERN.match(name):
+                raise ValueError(f"Invalid tenant name '{name}'")
+        self.paths = tenants
+        self.settings = settings or {}
+        self.max_bytes = max_bytes
+        self.max_resident = max_resident
+        self.spill_directory = spill_directory  # None: created on the first spill
+        self.default = Tenant(DEFAULT_TENANT, default_path, self.settings)
+        self.resident = OrderedDict()  # name -> Tenant, least recently used first
+        self.in_use = {}               # name -> requests currently using the tenant
+        self.loading = {}              # name -> Event set when its load (outside the lock) ends
+        self.memory = {DEFAULT_TENANT: 0}
+        self.measure_seconds = measure_seconds
+        self.measured = {}             # name -> time of the last memory estimate
+        self.metrics = {name: self._new_metrics() for name in [DEFAULT_TENANT] + list(tenants)}
+        self._lock = threading.Lock()
+        self._directory_lock = threading.Lock()
+
+    @staticmethod
+    def _new_metrics():
+        return {'requests': 0, 'hits': 0, 'misses': 0, 'restores': 0, 'evictions': 0,
+                'last_load_ms': None, 'last_spill_ms': None, 'spill_bytes': None}
+
+    def _spill_path(self, name, create=False):
+        """
+        Spill file of a tenant, or None if there is no usable spill directory
+
+        Raises:
+            PermissionError: The configured directory is not private to the current user
+        """
+        if self.spill_directory is None:
+            if not create:
+                return None
+            with self._directory_lock:
+                if self.spill_directory is None:
+                    directory = private_directory(prefix='vms_tenants_')
+                    weakref.finalize(self, shutil.rmtree, directory, ignore_errors=True)
+                    self.spill_directory = directory
+        elif create:
+            private_directory(self.spill_directory)
+        elif os.path.lexists(self.spill_directory):
+            check_private_directory(self.spill_directory)
+        else:
+            return None
+        return os.path.join(self.spill_directory, f'{name}.pkl')
+
+    def names(self):
+        return [DEFAULT_TENANT] + list(self.paths)
+
+    # Requests
+
+    def acquire(self, name=None):
+        """
+        The tenant for a request, loading it if it is not resident
+
+        A tenant is loaded outside the registry lock, so requests for other
+        tenants carry on meanwhile; requests for the same tenant wait for that
+        one load instead of starting their own.
+
+        Raises:
+            KeyError: Unknown tenant name
+        """
+        name = name or DEFAULT_TENANT
+        if name != DEFAULT_TENANT and name not in self.paths:
+            raise KeyError(name)
+        with self._lock:
+            self.metrics[name]['requests'] += 1
+        while True:
+            with self._lock:
+                tenant = self.default if name == DEFAULT_TENANT else self.resident.get(name)
+                if tenant is not None:
+                    if name != DEFAULT_TENANT:
+                        self.resident.move_to_end(name)
+                    self.metrics[name]['hits'] += 1
+                    self.in_use[name] = self.in_use.get(name, 0) + 1
+                    return tenant
+                loading = self.loading.get(name)
+                if loading is None:
+                    self.metrics[name]['misses'] += 1
+                    loading = self.loading[name] = threading.Event()
+                    break
+            loading.wait()
+
+        tenant = None
+        try:
+            tenant = self._load(name)
+        finally:
+            with self._lock:
+                if tenant is not None:
+                    self.resident[name] = tenant
+                    self.in_use[name] = self.in_use.get(name, 0) + 1
+                    self.memory[name] = 0
+                    self.measured.pop(name, None)  # measure after its first request
+                self.loading.pop(name).set()
+        return tenant
+
+    def release(self, tenant):
+        """End of a request: re-measure the tenant (at most every measure_seconds) and evict over budget"""
+        now = time.monotonic()
+        report = None
+        if now - self.measured.get(tenant.name, float('-inf')) >= self.measure_seconds:
+            report = tenant.memory_report()
+        with self._lock:
+            self.in_use[tenant.name] -= 1
+            if report is not None and (tenant.name == DEFAULT_TENANT or self.resident.get(tenant.name) is tenant):
+                self.memory[tenant.name] = report['total_bytes']
+                self.measured[tenant.name] = now
+            victims = self._select_victims()
+        for victim in victims:
+            self._spill(victim)
+
+    # Loading and eviction
+
+    def _load(self, name):
+        start = time.perf_counter()
+        tenant = Tenant(name, self.paths[name], self.settings)
+        try:
+            path = self._spill_path(name)
+        except PermissionError as e:
+            print(f"[ERROR] Not restoring tenant '{name}': {e}")
+            path = None
+        if path is not None and os.path.lexists(path):
+            try:
+                if tenant.restore(path):
+                    self.metrics[name]['restores'] += 1
+            except Exception as e:
+                print(f"[INFO] Ignoring spilled state of tenant '{name}': {e}")
+                tenant = Tenant(name, self.paths[name], self.settings)
+        self.metrics[name]['last_load_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        return tenant
+
+    def _select_victims(self):
+        """
+        Remove idle least recently used tenants until within budget; returns them
+
+        The most recently used tenant stays, even if it alone is over budget.
+        """
+        victims = []
+        for name in list(self.resident)[:-1]:
+            over_count = self.max_resident is not None and len(self.resident) > self.max_resident
+            over_bytes = self.max_bytes is not None and sum(self.memory.values()) > self.max_bytes
+            if not (over_count or over_bytes):
+                break
+            if self.in_use.get(name):
+                continue
+            victims.append(self.resident.pop(name))
+            self.memory.pop(name, None)
+            self.metrics[name]['evictions'] += 1
+        return victims
+
+    def _spill(self, tenant):
+        start = time.perf_counter()
+        try:
+            path = self._spill_path(tenant.name, create=True)
+            tenant.spill(path)
+        except Exception as e:
+            print(f"[INFO] Could not spill tenant '{tenant.name}': {e}")
+            return
+        metrics = self.metrics[tenant.name]
+        metrics['last_spill_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        metrics['spill_bytes'] = os.path.getsize(path)
+        print(f"[INFO] Evicted tenant '{tenant.name}' ({metrics['spill_bytes'] / 1e6:.1f} MB spilled)")
+
+    def status(self):
+        """Per-tenant residency, estimated memory and hit rate"""
+        with self._lock:
+            tenants = {}
+            for name in self.names():
+                metrics = self.metrics[name]
+                lookups = metrics['hits'] + metrics['misses']
+                tenants[name] = {
+                    'resident': name == DEFAULT_TENANT or name in self.resident,
+                    'in_use': self.in_use.get(name, 0),
+                    'memory_bytes': self.memory.get(name),
+                    'hit_rate': round(metrics['hits'] / lookups, 4) if lookups else None,
+                    **metrics,
+                }
+            return {
+                'max_bytes': self.max_bytes,
+                'max_resident': self.max_resident,
+                'resident_bytes': sum(self.memory.values()),
+                'resident_tenants': 1 + len(self.resident),
+                'tenants': tenants,
+            }
@@ -0,0 +1,314 @@
+"""
+Resident TF-IDF Index with Compact Storage
+By default ResumeMatcher refits TF-IDF over every profile on each request.
+With MATCH_INDEX set in config.py it uses this index instead: the
+vectorizer is fitted once on the volunteer corpus and the volunteer matrix
+stays resident, so each request only vectorizes the job description.
+
+Storage is term-major (CSC): a query only reads the columns of the terms it
+contains. The `precision` setting picks the layout:
+
+    float64  float64 weights, int64 row indices (scikit-learn/scipy defaults)
+    float32  float32 weights, int32 row indices
+    int8     8-bit weights (per-volunteer scale), int32 row indices
+
+Vocabulary pruning drops terms below `min_df` or above `max_df` document
+frequency, learned from the volunteer corpus at fit time. The terms cut for
+being too frequent are the corpus's own stop words ("volunteer", "team",
+...); they are kept as a list and shown in the memory report.
+
+Volunteers added or edited after the fit go into a small float32 delta
+matrix; their old rows are masked out. Once the delta passes `refit_ratio`
+of the base, the index is refit from every known profile.
+
+benchmark_index_storage.py reports bytes per volunteer and how closely each
+mode's rankings agree with the exact float64 index.
+"""
+
+import hashlib
+import sys
+import threading
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+PRECISIONS = ['float64', 'float32', 'int8']
+
+def profile_digest(profile):
+    """
+    Stable 64-bit digest of a profile text
+
+    Unlike hash(), it is the same in every process, so digests pickled into
+    tenant spill files or computed by another worker still compare equal.
+    """
+    return int.from_bytes(hashlib.blake2b(profile.encode(), digest_size=8).digest(), 'little', signed=True)
+
+class TfidfIndex:
+    def __init__(self, precision='float32', max_features=None, min_df=1, max_df=1.0,
+                 ngram_range=(1, 2), refit_ratio=0.1):
+        """
+        Args:
+            precision: 'float64', 'float32' or 'int8' weight storage
+            max_features: Keep only this many most frequent terms (None: no cap)
+            min_df: Drop terms in fewer documents than this (count or fraction)
+            max_df: Drop terms in more documents than this (count or fraction)
+            ngram_range: Word n-grams indexed
+            refit_ratio: Refit once the delta exceeds this share of the base rows
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {', '.join(PRECISIONS)}")
+        self.precision = precision
+        self.max_features = max_features
+        self.min_df = min_df
+        self.max_df = max_df
+        self.ngram_range = ngram_range
+        self.refit_ratio = refit_ratio
+        self.vectorizer = None  # CountVectorizer over the kept terms, set by fit()
+        self.idf = None
+        self.vocabulary_bytes = 0
+        self.stop_terms = []  # terms pruned for being in more than max_df documents, most frequent first
+        self._lock = threading.RLock()
+        self._clear()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _clear(self):
+        self.ids = np.zeros(0, dtype=np.int64)       # base rows, sorted by volunteer id
+        self.hashes = np.zeros(0, dtype=np.int64)    # profile_digest of the profile each base row was built from
+        self.alive = np.zeros(0, dtype=bool)         # False once a row was superseded by the delta
+        self.indptr = np.zeros(1, dtype=np.int64)    # CSC: per term, its slice of indices/data
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.data = np.zeros(0, dtype=np.float32)
+        self.row_scale = None                        # int8 only: per-row dequantization scale
+        self.delta = {}                              # volunteer id -> (profile digest, 1 x terms float32 row)
+        self.delta_bytes = 0
+        self._delta_matrix = None
+
+    @property
+    def fitted(self):
+        return self.vectorizer is not None
+
+    # Building
+
+    def fit(self, volunteer_ids, profiles):
+        """Fit the vocabulary on these profiles and build the base matrix"""
+        with self._lock:
+            dtype = np.float64 if self.precision == 'float64' else np.float32
+            vectorizer = TfidfVectorizer(
+                lowercase=True,
+                stop_words='english',
+                ngram_range=self.ngram_range,
+                dtype=dtype
+            )
+            try:
+                matrix = vectorizer.fit_transform(profiles).tocsr()
+            except ValueError:  # empty vocabulary
+                return False
+            matrix = self._prune(vectorizer, matrix)
+            if matrix is None:
+                return False
+
+            volunteer_ids = np.asarray(volunteer_ids, dtype=np.int64)
+            order = np.argsort(volunteer_ids, kind='stable')
+            self._clear()
+            self.ids = volunteer_ids[order]
+            self.hashes = np.array([profile_digest(profiles[i]) for i in order], dtype=np.int64)
+            self.alive = np.ones(len(order), dtype=bool)
+            self._store(matrix[order].tocsc())
+            return True
+
+    def _prune(self, vectorizer, matrix):
+        """
+        Drop terms outside [min_df, max_df] document frequency (and past
+        max_features), remembering the too-frequent ones as stop terms
+
+        Returns:
+            The re-normalized matrix over the kept terms, or None if none are left
+        """
+        documents = matrix.shape[0]
+        df = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        min_df = self.min_df * documents if isinstance(self.min_df, float) else self.min_df
+        max_df = self.max_df * documents if isinstance(self.max_df, float) else self.max_df
+        keep = (df >= min_df) & (df <= max_df)
+        if self.max_features is not None and keep.sum() > self.max_features:
+            kept = np.flatnonzero(keep)
+            keep[:] = False
+            keep[kept[np.argsort(-df[kept], kind='stable')[:self.max_features]]] = True
+        if not keep.any():
+            return None
+
+        terms = vectorizer.get_feature_names_out()
+        frequent = np.flatnonzero(df > max_df)
+        self.stop_terms = [str(terms[i]) for i in frequent[np.argsort(-df[frequent], kind='stable')]]
+        columns = np.flatnonzero(keep)
+        self.idf = vectorizer.idf_[columns].astype(matrix.dtype)
+        # Queries are counted over the kept terms only and weighted with their corpus idf
+        self.vectorizer = CountVectorizer(
+            lowercase=True,
+            stop_words='english',
+            ngram_range=self.ngram_range,
+            vocabulary={str(terms[column]): i for i, column in enumerate(columns)},
+            dtype=matrix.dtype
+        )
+        vocabulary = self.vectorizer.vocabulary
+        # The CountVectorizer holds a second dict over the same term strings
+        self.vocabulary_bytes = 2 * sys.getsizeof(vocabulary) + sum(sys.getsizeof(term) for term in vocabulary) \
+            + self.idf.nbytes
+        return normalize(matrix[:, columns]).astype(matrix.dtype)
+
+    def vectorize(self, texts):
+        """Unit-length TF-IDF rows over the index vocabulary"""
+        counts = self.vectorizer.transform(texts)
+        return normalize(counts.multiply(self.idf).tocsr()).astype(np.float32)
+
+    def _store(self, csc):
+        index_dtype = np.int64 if self.precision == 'float64' else np.int32
+        self.indptr = csc.indptr.astype(np.int64)
+        self.indices = csc.indices.astype(index_dtype)
+        if self.precision != 'int8':
+            self.data = csc.data
+            self.row_scale = None
+            return
+
+        # Per-row scale: a row's largest weight maps to 255
+        row_max = np.zeros(csc.shape[0], dtype=np.float32)
+        np.maximum.at(row_max, csc.indices, csc.data.astype(np.float32))
+        self.row_scale = np.where(row_max > 0, row_max / 255, 1).astype(np.float32)
+        self.data = np.rint(csc.data / self.row_scale[csc.indices]).astype(np.uint8)
+
+    def update(self, volunteer_ids, profiles, all_profiles=None):
+        """
+        Make sure these volunteers are indexed with their current profile
+
+        New or changed profiles go into the delta. When the delta grows past
+        refit_ratio, the index is refit from all_profiles() (pairs of volunteer
+        id and profile), or from these volunteers when it is not given.
+        """
+        with self._lock:
+            if not self.fitted:
+                self._refit(volunteer_ids, profiles, all_profiles)
+                return
+
+            volunteer_ids = np.asarray(volunteer_ids, dtype=np.int64)
+            hashes = np.array([profile_digest(profile) for profile in profiles], dtype=np.int64)
+            positions = np.minimum(np.searchsorted(self.ids, volunteer_ids), max(len(self.ids) - 1, 0))
+            in_base = (self.ids[positions] == volunteer_ids) if len(self.ids) else np.zeros(len(volunteer_ids), bool)
+            current = in_base & self.alive[positions] & (self.hashes[positions] == hashes) if len(self.ids) else in_base
+
+            changed = []
+            for i in np.flatnonzero(~current):
+                volunteer_id = int(volunteer_ids[i])
+                delta = self.delta.get(volunteer_id)
+                if delta is not None and delta[0] == hashes[i]:
+                    continue
+                if in_base[i]:
+                    self.alive[positions[i]] = False
+                changed.append(i)
+
+            if not changed:
+                return
+            rows = self.vectorize([profiles[i] for i in changed])
+            for row, i in enumerate(changed):
+                self.delta[int(volunteer_ids[i])] = (hashes[i], rows[row])
+            self.delta_bytes += rows.data.nbytes + rows.indices.nbytes + len(changed) * 200  # + per-row matrix overhead
+            self._delta_matrix = None
+
+            if len(self.delta) > self.refit_ratio * max(len(self.ids), 1):
+                self._refit(volunteer_ids, profiles, all_profiles)
+
+    def _refit(self, volunteer_ids, profiles, all_profiles):
+        if all_profiles is not None:
+            pairs = list(all_profiles())
+            known = {volunteer_id for volunteer_id, _ in pairs}
+            pairs += [(volunteer_id, profile) for volunteer_id, profile in zip(volunteer_ids, profiles)
+                      if volunteer_id not in known]
+        else:
+            pairs = list(zip(volunteer_ids, profiles))
+        pairs = [(volunteer_id, profile) for volunteer_id, profile in pairs if volunteer_id is not None]
+        if pairs:
+            self.fit([volunteer_id for volunteer_id, _ in pairs], [profile for _, profile in pairs])
+
+    # Queries
+
+    def _base_scores(self, query):
+        """Cosine similarity of every base row with a (1 x terms) query row"""
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for term, weight in zip(query.indices, query.data):
+            start, end = self.indptr[term], self.indptr[term + 1]
+            if start == end:
+                continue
+            rows = self.indices[start:end]
+            scores[rows] += self.data[start:end].astype(np.float32) * np.float32(weight)
+        if self.row_scale is not None:
+            scores *= self.row_scale
+        return scores
+
+    def scores(self, text, volunteer_ids):
+        """
+        Cosine similarity of a text with the given (already updated) volunteers
+
+        Returns:
+            np.ndarray: float32 scores aligned with volunteer_ids (0 for unknown ids)
+        """
+        with self._lock:
+            volunteer_ids = np.asarray(volunteer_ids, dtype=np.int64)
+            result = np.zeros(len(volunteer_ids), dtype=np.float32)
+            if not self.fitted or not len(volunteer_ids):
+                return result
+            query = self.vectorize([text])
+
+            if len(self.ids):
+                base = self._base_scores(query)
+                positions = np.minimum(np.searchsorted(self.ids, volunteer_ids), len(self.ids) - 1)
+                found = (self.ids[positions] == volunteer_ids) & self.alive[positions]
+                result[found] = base[positions[found]]
+
+            if self.delta:
+                if self._delta_matrix is None:
+                    delta_ids = list(self.delta)
+                    self._delta_matrix = (delta_ids, {volunteer_id: row for row, volunteer_id in enumerate(delta_ids)},
+                                          sp.vstack([self.delta[volunteer_id][1] for volunteer_id in delta_ids]).tocsr())
+                _, delta_rows, matrix = self._delta_matrix
+                delta_scores = (matrix @ query.T).toarray().ravel()
+                for i, volunteer_id in enumerate(volunteer_ids.tolist()):
+                    row = delta_rows.get(volunteer_id)
+                    if row is not None:
+                        result[i] = delta_scores[row]
+            return result
+
+    # Reporting
+
+    def memory_report(self):
+        """Bytes held by the index, in total and per volunteer"""
+        with self._lock:
+            arrays = {
+                'weights': self.data.nbytes,
+                'row_indices': self.indices.nbytes,
+                'term_pointers': self.indptr.nbytes,
+                'row_ids': self.ids.nbytes + self.hashes.nbytes + self.alive.nbytes,
+                'row_scale': self.row_scale.nbytes if self.row_scale is not None else 0,
+                'delta': self.delta_bytes,
+                'vocabulary': self.vocabulary_bytes,
+            }
+            total = sum(arrays.values())
+            volunteers = int(self.alive.sum()) + len(self.delta)
+            return {
+                'precision': self.precision,
+                'volunteers': volunteers,
+                'terms': len(self.idf) if self.fitted else 0,
+                'stop_terms': len(self.stop_terms),
+                'top_stop_terms': self.stop_terms[:20],
+                'nonzeros': int(len(self.data)),
+                'delta_rows': len(self.delta),
+                'bytes': arrays,
+                'total_bytes': total,
+                'bytes_per_volunteer': round(total / volunteers, 1) if volunteers else 0,
+            }
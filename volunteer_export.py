@@ -0,0 +1,163 @@
+"""
+Streaming Volunteer Exports
+Builds the CSV and XLSX downloads served by /api/export/volunteers and
+/api/export/shortlisted.
+
+Rows are read from a database cursor in batches (Database.iter_rows) and
+written out as they arrive, so exporting the full roster uses constant memory.
+CSV is streamed to the client as it is generated. XLSX has to be complete
+before it can be read (it is a zip file), so it is written with openpyxl's
+write-only workbook to a temporary file, which is then streamed and deleted.
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+import database
+
+CHUNK_SIZE = 64 * 1024
+
+# Export column -> SQL expression
+VOLUNTEER_COLUMNS = {column: f'v.{column}' for column in database.VOLUNTEER_COLUMNS}
+SHORTLIST_COLUMNS = {
+    'run_id': 's.run_id',
+    'match_score': 's.match_score',
+    'matching_skills': 's.matching_skills',
+    'shortlisted_at': 's.shortlisted_at',
+    'job_description': 's.job_description',
+    **VOLUNTEER_COLUMNS,
+}
+DEFAULT_SHORTLIST_COLUMNS = [
+    'run_id', 'match_score', 'matching_skills', 'id', 'name', 'email', 'phone',
+    'skills', 'experience', 'education', 'shortlisted_at',
+]
+
+def select_columns(requested, available, default=None):
+    """
+    Resolve a comma-separated column list against the exportable columns
+
+    Raises:
+        ValueError: Unknown column names
+    """
+    if not requested:
+        return list(default or available)
+    columns = [column.strip() for column in requested.split(',') if column.strip()]
+    unknown = [column for column in columns if column not in available]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    return columns
+
+def build_filters(filters, available):
+    """
+    WHERE clause for column filters: case-insensitive substring matches
+
+    Args:
+        filters: {column: value}; keys that aren't exportable columns are ignored
+        available: Export column -> SQL expression
+
+    Returns:
+        tuple: (list of SQL conditions, parameters)
+    """
+    conditions, params = [], []
+    for column, value in filters.items():
+        if column not in available or not value:
+            continue
+        escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        conditions.append(f"{available[column]} LIKE ? ESCAPE '\\'")
+        params.append(f'%{escaped}%')
+    return conditions, params
+
+def volunteers_query(columns, filters):
+    """SQL and parameters for a filtered volunteer export"""
+    conditions, params = build_filters(filters, VOLUNTEER_COLUMNS)
+    select = ', '.join(VOLUNTEER_COLUMNS[column] for column in columns)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    return f'SELECT {select} FROM volunteers v {where} ORDER BY v.id', params
+
+def shortlist_query(run_id, columns, filters):
+    """SQL and parameters for exporting one shortlist run"""
+    conditions, params = build_filters(filters, SHORTLIST_COLUMNS)
+    select = ', '.join(SHORTLIST_COLUMNS[column] for column in columns)
+    where = ' AND '.join(['s.run_id IS ?'] + conditions)
+    query = f'''
+        SELECT {select}
+        FROM shortlisted_volunteers s
+        JOIN volunteers v ON s.volunteer_id = v.id
+        WHERE {where}
+        ORDER BY s.match_score DESC, s.shortlisted_at DESC
+    '''
+    return query, [run_id] + params
+
+def format_matching_skills(rows):
+    """Turn the stored JSON matching_skills lists into readable text"""
+    header = next(rows)
+    yield header
+    if 'matching_skills' not in header:
+        yield from rows
+        return
+
+    index = header.index('matching_skills')
+    for row in rows:
+        row = list(row)
+        try:
+            row[index] = ', '.join(json.loads(row[index]))
+        except (TypeError, ValueError):
+            pass
+        yield row
+
+def stream_csv(rows, rows_per_chunk=500):
+    """Yield CSV text in chunks from a header-first row iterator"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % rows_per_chunk == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def _xlsx_value(value):
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub('', value)
+    return value
+
+def write_xlsx(rows, sheet_title):
+    """
+    Write a header-first row iterator to a temporary XLSX file
+
+    Returns:
+        str: Path of the temporary file (the caller deletes it)
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    for row in rows:
+        sheet.append([_xlsx_value(value) for value in row])
+
+    fd, path = tempfile.mkstemp(prefix='export_', suffix='.xlsx')
+    os.close(fd)
+    try:
+        workbook.save(path)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+def stream_file(path):
+    """Yield a file in chunks and delete it afterwards"""
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.unlink(path)
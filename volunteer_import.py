@@ -0,0 +1,155 @@
+"""
+Streaming Bulk Volunteer Import
+Generator pipeline used by POST /api/volunteers/import:
+
+    binary stream -> records (CSV or JSON lines) -> volunteer fields -> validation -> batches
+
+Nothing upstream of the current batch is buffered, so arbitrarily large
+partner exports load in constant memory. Each batch is inserted with
+Database.insert_volunteers_bulk in its own transaction.
+"""
+
+import csv
+import io
+import json
+import time
+from database import VOLUNTEER_FIELDS
+
+# Common partner column names that don't match a field name directly
+COLUMN_ALIASES = {
+    'full_name': 'name',
+    'volunteer_name': 'name',
+    'e_mail': 'email',
+    'email_address': 'email',
+    'email_id': 'email',
+    'phone_number': 'phone',
+    'mobile': 'phone',
+    'mobile_number': 'phone',
+    'contact_number': 'phone',
+    'skill': 'skills',
+    'language': 'languages',
+    'certification': 'certifications',
+    'interest': 'interests',
+    'dob': 'date_of_birth',
+    'pincode': 'pin_code',
+    'zip': 'zip_code',
+    'zipcode': 'zip_code',
+    'postal_code': 'zip_code',
+}
+
+MISSING_VALUES = {'', 'nan', 'none', 'null', 'n/a'}
+MAX_REPORTED_ERRORS = 20
+
+def normalize_column(column):
+    """Map a column header onto a volunteer field name (or None if unknown)"""
+    key = str(column).strip().lower()
+    for separator in (' ', '-', '.', '/'):
+        key = key.replace(separator, '_')
+    key = COLUMN_ALIASES.get(key, key)
+    return key if key in VOLUNTEER_FIELDS else None
+
+def iter_csv_records(stream):
+    """Yield (line number, record dict) from a binary CSV stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    reader = csv.DictReader(text)
+    for record in reader:
+        yield reader.line_num, record
+
+def iter_jsonl_records(stream):
+    """Yield (line number, record dict) from a binary JSON-lines stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig')
+    for line_number, line in enumerate(text, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            record = ValueError(f"invalid JSON ({e.msg})")
+        if not isinstance(record, (dict, ValueError)):
+            record = ValueError("expected a JSON object")
+        yield line_number, record
+
+def map_records(records):
+    """Yield (line number, volunteer dict or error) with columns mapped onto volunteer fields"""
+    field_names = {}
+    for line_number, record in records:
+        if isinstance(record, ValueError):
+            yield line_number, record
+            continue
+
+        volunteer = {}
+        for column, value in record.items():
+            if column not in field_names:
+                field_names[column] = normalize_column(column)
+            field = field_names[column]
+            if field is None or value is None:
+                continue
+            value = str(value).strip()
+            if value.lower() not in MISSING_VALUES:
+                volunteer[field] = value
+        yield line_number, volunteer
+
+def validate_records(records, summary):
+    """Yield valid volunteers; count and sample the errors of the rest in summary"""
+    for line_number, volunteer in records:
+        summary['rows'] += 1
+        error = None
+
+        if isinstance(volunteer, ValueError):
+            error = str(volunteer)
+        elif not volunteer.get('name'):
+            error = "missing name"
+        elif '@' not in volunteer.get('email', ''):
+            error = "missing or invalid email"
+
+        if error:
+            summary['invalid'] += 1
+            if len(summary['errors']) < MAX_REPORTED_ERRORS:
+                summary['errors'].append(f"line {line_number}: {error}")
+            continue
+        yield volunteer
+
+def batched(volunteers, batch_size):
+    """Group volunteers into lists of at most batch_size"""
+    batch = []
+    for volunteer in volunteers:
+        batch.append(volunteer)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def import_volunteers(db, stream, data_format, batch_size=1000):
+    """
+    Stream volunteers from CSV or JSON lines into the database
+
+    Args:
+        db: Database to import into
+        stream: Binary stream of the request body
+        data_format: 'csv' or 'jsonl'
+        batch_size: Volunteers per insert transaction
+
+    Returns:
+        dict: Import summary (rows, inserted, duplicates, invalid, sample errors)
+    """
+    summary = {'format': data_format, 'rows': 0, 'inserted': 0, 'duplicates': 0,
+               'invalid': 0, 'batches': 0, 'errors': []}
+    start = time.perf_counter()
+
+    records = iter_csv_records(stream) if data_format == 'csv' else iter_jsonl_records(stream)
+    volunteers = validate_records(map_records(records), summary)
+
+    for batch in batched(volunteers, batch_size):
+        present = set().union(*batch)
+        columns = [field for field in VOLUNTEER_FIELDS if field in present]
+        inserted = db.insert_volunteers_bulk(
+            columns, (tuple(volunteer.get(field) for field in columns) for volunteer in batch)
+        )
+        summary['inserted'] += inserted
+        summary['duplicates'] += len(batch) - inserted
+        summary['batches'] += 1
+
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    return summary
@@ -0,0 +1,360 @@
+"""
+Compact Columnar Volunteer Store
+A resident copy of only the volunteer fields matching needs (profile text
+and facet fields), so a shortlist no longer turns every database row into a
+45-column dict:
+
+- ids in one int64 array
+- low-cardinality columns (availability, mode, city, ...) dictionary-encoded:
+  one small integer code per volunteer plus the list of distinct values
+- free-text columns as lists whose repeated strings share one object
+
+Matching code reads volunteers through VolunteerView objects (two __slots__
+each), built once per volunteer and shared by every request. They answer .get() and [] like the row dicts did. Full rows are
+fetched from the database only for the final top-k.
+
+When the `volunteers` data version changes the store catches up
+incrementally: rows with ids above the largest resident id are appended, and
+rows the database logged as updated since the last sync are patched. Either
+way a new Snapshot and view list are published; the columns it patches are
+copied first, and patched rows get new views, so a request still reading the
+previous list never sees a partly applied update and needs no lock. Only a new database epoch (a
+cleared or replaced database) reloads everything, streaming a few thousand
+rows at a time.
+
+    python volunteer_store.py [database file]
+
+prints the footprint in bytes per volunteer next to the dict rows
+get_all_volunteers() returns.
+"""
+
+import itertools
+import sys
+import threading
+import time
+import numpy as np
+from facet_index import INDEXED_FIELDS
+from resume_matcher import PROFILE_FIELDS
+
+# Fields kept resident: the matcher's profile fields and the facet fields
+STORE_FIELDS = list(dict.fromkeys(PROFILE_FIELDS + INDEXED_FIELDS))
+
+# Columns with fewer distinct values than this share of rows are dictionary-encoded
+DICTIONARY_MAX_RATIO = 0.5
+
+def _code_dtype(distinct):
+    return np.uint8 if distinct <= 1 << 8 else np.uint16 if distinct <= 1 << 16 else np.uint32
+
+class DictionaryColumn:
+    """Integer codes into a list of distinct values"""
+
+    def __init__(self, values):
+        self.positions = {}
+        codes = [self._code(value) for value in values]
+        self.values = list(self.positions)
+        self.codes = np.array(codes, dtype=_code_dtype(len(self.values)))
+
+    def _code(self, value):
+        return self.positions.setdefault(value, len(self.positions))
+
+    def _add_values(self):
+        """Publish values added to positions, widening the codes if needed"""
+        if len(self.positions) > len(self.values):
+            self.values.extend(itertools.islice(self.positions, len(self.values), None))
+            dtype = _code_dtype(len(self.values))
+            if dtype != self.codes.dtype:
+                self.codes = self.codes.astype(dtype)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def copy(self):
+        column = DictionaryColumn.__new__(DictionaryColumn)
+        column.positions = dict(self.positions)
+        column.values = list(self.values)
+        column.codes = self.codes.copy()
+        return column
+
+    def set(self, row, value):
+        code = self._code(value)
+        self._add_values()
+        self.codes[row] = code
+
+    def extend(self, values):
+        codes = [self._code(value) for value in values]
+        self._add_values()
+        self.codes = np.concatenate([self.codes, np.array(codes, dtype=self.codes.dtype)])
+
+    def nbytes(self):
+        return self.codes.nbytes + sys.getsizeof(self.values) + sum(sys.getsizeof(value) for value in self.values)
+
+class TextColumn:
+    """Plain list of strings; equal strings are stored once"""
+
+    def __init__(self, values):
+        self.values = []
+        self.distinct = 0
+        self._string_bytes = 0
+        self.extend(values)
+
+    def __getitem__(self, row):
+        return self.values[row]
+
+    def copy(self):
+        column = TextColumn(())
+        column.values = list(self.values)
+        column.distinct = self.distinct
+        column._string_bytes = self._string_bytes
+        return column
+
+    def set(self, row, value):
+        # The replaced string may still be shared, so its bytes stay counted
+        self.values[row] = value
+        self._string_bytes += sys.getsizeof(value)
+
+    def extend(self, values):
+        """Append values; equal strings within one call are stored once"""
+        shared = {}
+        self.values.extend(shared.setdefault(value, value) for value in values)
+        self.distinct += len(shared)
+        self._string_bytes += sum(sys.getsizeof(value) for value in shared)
+
+    def nbytes(self):
+        return sys.getsizeof(self.values) + self._string_bytes
+
+def encode_column(values):
+    distinct = len(set(values))
+    if distinct <= max(1, DICTIONARY_MAX_RATIO * len(values)):
+        return DictionaryColumn(values)
+    return TextColumn(values)
+
+class Snapshot:
+    """
+    Volunteer ids and columns as of one data version
+
+    The rows of a published snapshot never change. A later snapshot may
+    share its column objects and append rows beyond its end, but copies any
+    column before patching it. Views of rows a catch-up did not patch are
+    moved to the new snapshot, where those rows read the same.
+    """
+
+    def __init__(self, ids, columns):
+        self.ids = ids
+        self.columns = columns
+
+class VolunteerView:
+    """Read-only, dict-like view of one volunteer in a Snapshot"""
+
+    __slots__ = ('_snapshot', '_row')
+
+    def __init__(self, snapshot, row):
+        self._snapshot = snapshot
+        self._row = row
+
+    def get(self, field, default=None):
+        if field == 'id':
+            return int(self._snapshot.ids[self._row])
+        column = self._snapshot.columns.get(field)
+        return default if column is None else column[self._row]
+
+    def __getitem__(self, field):
+        if field != 'id' and field not in self._snapshot.columns:
+            raise KeyError(field)
+        return self.get(field)
+
+    def __contains__(self, field):
+        return field == 'id' or field in self._snapshot.columns
+
+    def keys(self):
+        return ['id'] + list(self._snapshot.columns)
+
+    def to_dict(self):
+        return {field: self.get(field) for field in self.keys()}
+
+class VolunteerStore:
+    def __init__(self, db, fields=None, batch_size=5000):
+        """
+        Args:
+            db: Database the store mirrors
+            fields: Volunteer fields kept resident (default STORE_FIELDS)
+            batch_size: Rows fetched per round trip while loading
+        """
+        self.db = db
+        self.fields = fields or STORE_FIELDS
+        self.batch_size = batch_size
+        self.snapshot = Snapshot(np.zeros(0, dtype=np.int64), {})
+        self.views = []
+        self.version = None
+        self.load_seconds = None
+        self.last_sync = None  # 'load', 'incremental' or None (unchanged)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.snapshot.ids)
+
+    def _read(self, where='', params=()):
+        """(ids, {field: values}) of the volunteers matching where, by id"""
+        rows = self.db.iter_rows(
+            f"SELECT id, {', '.join(self.fields)} FROM volunteers {where} ORDER BY id",
+            params=params,
+            batch_size=self.batch_size
+        )
+        next(rows)  # column names
+        ids = []
+        values = {field: [] for field in self.fields}
+        for row in rows:
+            ids.append(row[0])
+            for field, value in zip(self.fields, row[1:]):
+                values[field].append(value)
+        return ids, values
+
+    def load(self):
+        """Read the resident fields of every volunteer, streaming"""
+        start = time.perf_counter()
+        ids, values = self._read()
+        self.adopt(Snapshot(
+            np.array(ids, dtype=np.int64),
+            {field: encode_column(column) for field, column in values.items()}
+        ))
+        self.load_seconds = time.perf_counter() - start
+
+    def adopt(self, snapshot, version=None):
+        """Publish a snapshot (loaded or restored from a spill file) and its views"""
+        views = [VolunteerView(snapshot, row) for row in range(len(snapshot.ids))]
+        self.snapshot, self.views = snapshot, views
+        if version is not None:
+            self.version = version
+
+    def _catch_up(self, since_version):
+        """
+        Append volunteers added and patch volunteers updated since since_version
+
+        Returns:
+            bool: False if an updated volunteer isn't resident (reload instead)
+        """
+        snapshot = self.snapshot
+        max_id = int(snapshot.ids[-1]) if len(snapshot.ids) else 0
+        changed = sorted(volunteer_id for volunteer_id in self.db.get_changed_volunteer_ids(since_version)
+                         if volunteer_id <= max_id)
+        rows = np.searchsorted(snapshot.ids, changed)
+        if np.any(snapshot.ids[rows] != changed):
+            return False
+        patches = []
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(changed), 500):
+            batch = changed[start:start + 500]
+            ids, values = self._read(f"WHERE id IN ({', '.join('?' for _ in batch)})", batch)
+            if ids != batch:
+                return False  # deleted
+            patches.append((rows[start:start + 500].tolist(), values))
+        added_ids, added = self._read('WHERE id > ?', (max_id,))
+        if not patches and not added_ids:
+            return True
+
+        columns = dict(snapshot.columns)
+        if patches:
+            # Copy on write: readers of the current snapshot keep seeing consistent rows
+            columns = {field: column.copy() for field, column in columns.items()}
+            for patch_rows, values in patches:
+                for field, column in values.items():
+                    for row, value in zip(patch_rows, column):
+                        columns[field].set(row, value)
+        # Appended rows lie beyond the end of the current snapshot, which never reads them
+        for field, column in added.items():
+            columns[field].extend(column)
+        ids = np.concatenate([snapshot.ids, np.array(added_ids, dtype=np.int64)]) if added_ids else snapshot.ids
+        published = Snapshot(ids, columns)
+
+        # Patched rows get new views; a request holding the old list keeps the old
+        # row. Every other view reads the same values in either snapshot, so it is
+        # moved to the new one rather than rebuilt (and no longer pins the old one).
+        unchanged = [True] * len(self.views)
+        views = list(self.views)
+        for patch_rows, _ in patches:
+            for row in patch_rows:
+                unchanged[row] = False
+                views[row] = VolunteerView(published, row)
+        for view in itertools.compress(self.views, unchanged):
+            view._snapshot = published
+        views.extend(VolunteerView(published, row) for row in range(len(snapshot.ids), len(ids)))
+        self.snapshot, self.views = published, views
+        return True
+
+    def sync(self):
+        """Catch up with the volunteers changed since the last sync"""
+        versions = self.db.get_data_versions(['volunteers'])
+        version = (versions['epoch'], versions['volunteers'])
+        with self._lock:
+            self.last_sync = None
+            if version != self.version:
+                if self.version is not None and self.version[0] == version[0] and self._catch_up(self.version[1]):
+                    self.last_sync = 'incremental'
+                else:
+                    self.load()
+                    self.last_sync = 'load'
+                self.version = version
+        return self
+
+    def volunteers(self):
+        """
+        Up-to-date list of VolunteerView, one per volunteer
+
+        The list is shared between callers and must not be modified.
+        """
+        return self.sync().views
+
+    def full_rows(self, views):
+        """
+        Full database rows for a few volunteers (e.g. the final top-k), in the same order
+
+        Volunteers deleted in the meantime come back as None.
+        """
+        volunteer_ids = [view.get('id') for view in views]
+        rows = {row['id']: row for row in self.db.get_volunteers_by_ids(volunteer_ids)}
+        return [rows.get(volunteer_id) for volunteer_id in volunteer_ids]
+
+    def stats(self):
+        """Resident footprint, in total and per volunteer"""
+        snapshot = self.snapshot
+        count = len(snapshot.ids)
+        column_bytes = {field: column.nbytes() for field, column in snapshot.columns.items()}
+        view_bytes = sys.getsizeof(self.views) + sum(sys.getsizeof(view) for view in self.views[:1]) * len(self.views)
+        total = snapshot.ids.nbytes + sum(column_bytes.values()) + view_bytes
+        return {
+            'volunteers': count,
+            'total_bytes': total,
+            'bytes_per_volunteer': round(total / count, 1) if count else 0,
+            'dictionary_encoded': sorted(field for field, column in snapshot.columns.items()
+                                         if isinstance(column, DictionaryColumn)),
+            'column_bytes': column_bytes,
+            'view_bytes': view_bytes,
+            'load_seconds': round(self.load_seconds, 3) if self.load_seconds is not None else None,
+        }
+
+def dict_rows_bytes(rows):
+    """Approximate memory of get_all_volunteers()-style rows (dicts, keys shared)"""
+    total = sys.getsizeof(rows)
+    for row in rows:
+        total += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values() if value is not None)
+    return total
+
+def main():
+    from database import Database
+    db = Database(sys.argv[1] if len(sys.argv) > 1 else 'volunteer_management.db')
+    store = VolunteerStore(db).sync()
+    stats = store.stats()
+    rows = db.get_all_volunteers()
+    row_bytes = dict_rows_bytes(rows)
+
+    print(f"\nVolunteers: {stats['volunteers']}")
+    if not rows:
+        return
+    print(f"Dict rows (get_all_volunteers): {row_bytes / len(rows):,.0f} bytes/volunteer")
+    print(f"Columnar store:                 {stats['bytes_per_volunteer']:,.0f} bytes/volunteer "
+          f"(loaded in {stats['load_seconds']}s)")
+    print(f"Dictionary-encoded columns: {', '.join(stats['dictionary_encoded']) or 'none'}")
+    for field, size in sorted(stats['column_bytes'].items(), key=lambda item: -item[1]):
+        print(f"  {field:<20} {size / len(rows):>8,.1f} bytes/volunteer")
+
+if __name__ == "__main__":
+    main()
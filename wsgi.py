@@ -0,0 +1,30 @@
+"""
+Production WSGI Entry Point
+Serve the app with a pre-fork server instead of the Flask development server:
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+gunicorn.conf.py preloads this module in the master process, so the database
+schema check, skills taxonomy and matcher profile cache are built once and the
+workers share those pages copy-on-write after the fork.
+"""
+
+import gc
+import app as app_module
+
+def create_app(preload=True):
+    """
+    Return the Flask app ready to serve
+
+    Args:
+        preload: Build the matcher profile cache now (before workers are forked)
+    """
+    if preload:
+        app_module.warm_up()
+        # Move everything built so far out of the collector's generations, so
+        # garbage collection in the workers doesn't write to (and copy) the
+        # shared pages
+        gc.freeze()
+    return app_module.app
+
+application = create_app()